@@ -79,10 +79,12 @@ class CommandBlockchain:
         except Exception:
             return False
 
-    def add_block(self, tx: CommandTransaction) -> None:
+    def add_block(self, tx: CommandTransaction) -> bool:
         """Add validated transaction to the chain"""
         if self.validate_transaction(tx):
             self.chain.append(tx)
+            return True
+        return False
 
     def get_last_block_hash(self) -> str:
         """Get hash of last block in chain"""
@@ -1,11 +1,12 @@
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import timedelta
+import time
 from typing import Dict, Optional
 
 @dataclass
 class CachedMission:
     parameters: Dict[str, Any]
-    timestamp: datetime
+    timestamp: int  # time.monotonic_ns()
     context: Dict[str, Any]
     signature: bytes
     validity: timedelta = timedelta(minutes=5)
@@ -21,8 +22,10 @@ class MissionCache:
     def retrieve(self, mission_id: str) -> Optional[CachedMission]:
         """Retrieve cached mission if valid"""
         cached = self.cache.get(mission_id)
-        if cached and datetime.now() < cached.timestamp + cached.validity:
-            return cached
+        if cached:
+            validity_ns = cached.validity // timedelta(microseconds=1) * 1000
+            if time.monotonic_ns() < cached.timestamp + validity_ns:
+                return cached
         return None
         
     def adapt_parameters(self, cached: CachedMission, context: Dict[str, Any]) -> Dict[str, Any]:
@@ -1,9 +1,14 @@
 from cryptography.hazmat.primitives.asymmetric import padding
 from cryptography.hazmat.primitives import hashes
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import json
 
+def canonical_bytes(parameters: Dict[str, Any]) -> bytes:
+    """Deterministic serialization of mission parameters used for signing"""
+    return json.dumps(parameters, sort_keys=True).encode()
+
 @dataclass
 class SignedMissionParameters:
     parameters: Dict[str, Any]
@@ -11,17 +16,20 @@ class SignedMissionParameters:
     timestamp: float
 
 class MissionSigner:
-    def __init__(self, private_key):
+    def __init__(self, private_key, cache_size: int = 256):
         self.private_key = private_key
+        self._canonical_bytes_cache: OrderedDict = OrderedDict()
+        self._cache_size = cache_size
 
-    def sign_parameters(self, parameters: Dict[str, Any]) -> SignedMissionParameters:
+    def sign_parameters(self, parameters: Dict[str, Any], serialized: Optional[bytes] = None) -> SignedMissionParameters:
         """Sign mission parameters with private key"""
         # Serialize parameters deterministically
-        serialized = json.dumps(parameters, sort_keys=True)
+        if serialized is None:
+            serialized = canonical_bytes(parameters)
         
         # Create signature
         signature = self.private_key.sign(
-            serialized.encode(),
+            serialized,
             padding.PSS(
                 mgf=padding.MGF1(hashes.SHA256()),
                 salt_length=padding.PSS.MAX_LENGTH
@@ -35,20 +43,46 @@ class MissionSigner:
             timestamp=datetime.now().timestamp()
         )
 
+    def sign_parameters_cached(self, parameters: Dict[str, Any]) -> SignedMissionParameters:
+        """Sign mission parameters, reusing canonical bytes for repeated templates"""
+        try:
+            # Include value types so 1, 1.0 and True do not share an entry
+            key = tuple(sorted((k, type(v), v) for k, v in parameters.items()))
+            hash(key)
+        except TypeError:
+            # Nested containers are not hashable; serialize directly
+            return self.sign_parameters(parameters)
+            
+        serialized = self._canonical_bytes_cache.get(key)
+        if serialized is None:
+            serialized = canonical_bytes(parameters)
+            self._canonical_bytes_cache[key] = serialized
+            if len(self._canonical_bytes_cache) > self._cache_size:
+                self._canonical_bytes_cache.popitem(last=False)
+        else:
+            self._canonical_bytes_cache.move_to_end(key)
+            
+        return self.sign_parameters(parameters, serialized)
+
 class MissionVerifier:
     def __init__(self, public_key):
         self.public_key = public_key
 
-    def verify_parameters(self, signed_params: SignedMissionParameters) -> bool:
-        """Verify signed mission parameters"""
+    def verify_parameters(self, signed_params: SignedMissionParameters, serialized: Optional[bytes] = None) -> bool:
+        """Verify signed mission parameters
+        
+        ``serialized`` may carry canonical bytes the caller already computed
+        from the current parameters.
+        """
         try:
             # Serialize parameters deterministically
-            serialized = json.dumps(signed_params.parameters, sort_keys=True)
+            if serialized is None:
+                serialized = canonical_bytes(signed_params.parameters)
             
             # Verify signature
             self.public_key.verify(
                 signed_params.signature,
-                serialized.encode(),
+                serialized,
                 padding.PSS(
                     mgf=padding.MGF1(hashes.SHA256()),
                     salt_length=padding.PSS.MAX_LENGTH
@@ -1,4 +1,4 @@
-from typing import Dict, List, Any, Optional, Type
+from typing import Dict, List, Any, Optional, Tuple, Type
 import os
 import logging
 from .component_manager import ComponentManager
@@ -19,6 +19,9 @@ class ComponentSystem:
         self.component_manager = ComponentManager()
         self.component_registry = ComponentRegistry()
         
+        # Resolved components per service, invalidated on registry change
+        self._service_cache: Dict[str, Tuple[Component, ...]] = {}
+        
     async def initialize(self) -> None:
         """Initialize the component system"""
         self.logger.info("Initializing component system")
@@ -38,6 +41,7 @@ class ComponentSystem:
                             component_id,
                             component.get_component_info()
                         )
+                self._service_cache.clear()
             else:
                 self.logger.warning(f"Component directory not found: {component_dir}")
                 
@@ -45,6 +49,7 @@ class ComponentSystem:
         """Shutdown the component system"""
         self.logger.info("Shutting down component system")
         await self.component_manager.shutdown_all_components()
+        self._service_cache.clear()
         
     def get_component(self, component_id: str) -> Optional[Component]:
         """Get a component by ID"""
@@ -54,12 +59,25 @@ class ComponentSystem:
         """Get all components of a specific type"""
         return self.component_manager.get_components_by_type(component_type)
         
-    def get_components_by_service(self, service: str) -> List[Component]:
+    def get_components_by_service(self, service: str) -> Tuple[Component, ...]:
         """Get all components that provide a specific service"""
+        cached = self._service_cache.get(service)
+        if cached is not None:
+            return cached
+            
         component_ids = self.component_registry.find_components_by_service(service)
-        return [self.component_manager.get_component(cid) for cid in component_ids 
-                if self.component_manager.get_component(cid)]
+        lookup = self.component_manager.get_component
+        components = tuple(c for c in map(lookup, component_ids) if c is not None)
+        self._service_cache[service] = components
+        return components
         
     async def load_component(self, component_class: Type[Component], component_id: str = None) -> Optional[str]:
         """Load a component"""
-        return await self.component_manager.load_component(component_class, component_id)
\ No newline at end of file
+        component_id = await self.component_manager.load_component(component_class, component_id)
+        self._service_cache.clear()
+        return component_id
+        
+    def unregister_component(self, component_id: str) -> bool:
+        """Remove a component from the registry"""
+        self._service_cache.clear()
+        return self.component_registry.unregister_component(component_id)
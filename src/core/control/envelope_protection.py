@@ -1,7 +1,12 @@
+import math
 import numpy as np
 from dataclasses import dataclass
 from typing import Dict, Tuple
 
+def _norm3(v) -> float:
+    """Euclidean norm of a 3-vector without numpy dispatch"""
+    return math.sqrt(v[0]*v[0] + v[1]*v[1] + v[2]*v[2])
+
 @dataclass
 class FlightEnvelope:
     max_mach: float
@@ -33,7 +38,7 @@ class EnvelopeProtectionSystem:
         violations = {}
         
         # Current state checks
-        velocity = np.linalg.norm(state['velocity'])
+        velocity = _norm3(state['velocity'])
         mach = velocity / 343.0
         alpha = np.arctan2(state['velocity'][2], state['velocity'][0])
         beta = np.arcsin(state['velocity'][1]/velocity)
@@ -48,7 +53,7 @@ class EnvelopeProtectionSystem:
         
         # Predicted state checks (if provided)
         if predicted_state:
-            p_velocity = np.linalg.norm(predicted_state['velocity'])
+            p_velocity = _norm3(predicted_state['velocity'])
             p_mach = p_velocity / 343.0
             p_alpha = np.arctan2(predicted_state['velocity'][2], predicted_state['velocity'][0])
             
@@ -75,7 +80,8 @@ class EnvelopeProtectionSystem:
         
     def _check_g_load(self, angular_velocity: np.ndarray) -> Tuple[bool, float]:
         """Check g-load limits"""
-        g_load = np.linalg.norm(angular_velocity)**2 / 9.81
+        wx, wy, wz = angular_velocity[0], angular_velocity[1], angular_velocity[2]
+        g_load = (wx*wx + wy*wy + wz*wz) / 9.81
         violation = g_load > self.envelope.max_g_load * self.safety_margins['g_load']
         severity = max(0, (g_load - self.envelope.max_g_load * self.safety_margins['g_load']) / 
                       (self.envelope.max_g_load - self.envelope.max_g_load * self.safety_margins['g_load']))
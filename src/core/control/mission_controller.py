@@ -1,3 +1,11 @@
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+import asyncio
+import hashlib
+import itertools
+import time
+from ..comms.mission_signing import canonical_bytes
+
 class MissionController:
     def __init__(self, blockchain: CommandBlockchain):
         self.blockchain = blockchain
@@ -7,6 +15,20 @@ class MissionController:
         )
         self.cache = MissionCache()
         
+        # Digests of (signature, parameters) pairs that already verified
+        self._verify_cache: OrderedDict = OrderedDict()
+        self._verify_cache_size = 1024
+        
+        # Mission transactions are committed to the chain in epoch batches
+        self.tx_epoch = 0.6  # seconds
+        self.tx_batch_size = 32
+        self._pending_tx: List[Tuple[int, CommandTransaction]] = []
+        # Keyed per submission: identical missions share a command_id
+        self._tx_seq = itertools.count()
+        self._tx_commits: Dict[int, Tuple[str, asyncio.Future]] = {}
+        self._tx_batch_ready: Optional[asyncio.Event] = None  # Created in the running loop
+        self._tx_flush_task = None
+        
     async def execute_mission(self, signed_params: SignedMissionParameters) -> bool:
         """Execute mission with caching and contextual adaptation"""
         # Check cache first
@@ -20,7 +42,7 @@ class MissionController:
             signed_params.parameters = adapted
             
         # Verify and execute mission
-        if not self.verifier.verify_parameters(signed_params):
+        if not self._verify_cached(signed_params):
             await self.event_manager.publish(SystemEvent(
                 event_type=SystemEventType.INVALID_MISSION_PARAMETERS,
                 component_id="mission_controller",
@@ -34,7 +56,7 @@ class MissionController:
             signed_params.parameters['mission_id'],
             CachedMission(
                 parameters=signed_params.parameters,
-                timestamp=datetime.now(),
+                timestamp=time.monotonic_ns(),
                 context=self.context_aware_planner.situational_context,
                 signature=signed_params.signature
             )
@@ -46,12 +68,94 @@ class MissionController:
             'parameters': signed_params.parameters
         })
         
-        # Add to blockchain
-        self.blockchain.add_block(tx)
+        # Queue for the next batch commit
+        self._submit_transaction(tx)
+        await self.event_manager.publish(SystemEvent(
+            event_type=SystemEventType.MISSION_TRANSACTION_QUEUED,
+            component_id="mission_controller",
+            data={"tx_id": tx.command_id},
+            priority=1
+        ))
         
         # Execute mission
         return await self._execute_mission_parameters(signed_params.parameters)
 
+    def _submit_transaction(self, tx: CommandTransaction) -> asyncio.Future:
+        """Queue a transaction for batched commit and return its commit future"""
+        if self._tx_batch_ready is None:
+            self._tx_batch_ready = asyncio.Event()
+        if self._tx_flush_task is None or self._tx_flush_task.done():
+            self._tx_flush_task = asyncio.create_task(self._tx_flush_loop())
+            
+        seq = next(self._tx_seq)
+        future = asyncio.get_running_loop().create_future()
+        self._tx_commits[seq] = (tx.command_id, future)
+        self._pending_tx.append((seq, tx))
+        if len(self._pending_tx) >= self.tx_batch_size:
+            self._tx_batch_ready.set()
+        return future
+        
+    async def _tx_flush_loop(self) -> None:
+        """Commit pending transactions every epoch or once a batch fills"""
+        while True:
+            try:
+                await asyncio.wait_for(self._tx_batch_ready.wait(), self.tx_epoch)
+            except asyncio.TimeoutError:
+                pass
+            self._tx_batch_ready.clear()
+            self.flush_transactions()
+            
+    def flush_transactions(self) -> None:
+        """Commit all pending transactions to the blockchain"""
+        batch, self._pending_tx = self._pending_tx, []
+        for seq, tx in batch:
+            # Link to the chain head at commit time, not creation time
+            tx.previous_hash = self.blockchain.get_last_block_hash()
+            committed = self.blockchain.add_block(tx)
+            _, future = self._tx_commits.pop(seq)
+            if not future.done():
+                future.set_result(committed)
+                
+    async def close(self) -> None:
+        """Stop the batch committer and commit whatever is still pending"""
+        task, self._tx_flush_task = self._tx_flush_task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self.flush_transactions()
+        
+    async def wait_for_commit(self, tx_id: str) -> bool:
+        """Wait until every queued submission of a mission transaction has been committed"""
+        futures = [future for command_id, future in self._tx_commits.values() if command_id == tx_id]
+        if not futures:
+            return any(tx.command_id == tx_id for tx in self.blockchain.chain)
+        results = await asyncio.shield(asyncio.gather(*futures))
+        return all(results)
+        
+    def _verify_cached(self, signed_params: SignedMissionParameters) -> bool:
+        """Verify mission signature, skipping pairs that already verified"""
+        # Bind the key to the payload as well so altered parameters never
+        # reuse a previously valid signature
+        serialized = canonical_bytes(signed_params.parameters)
+        digest = hashlib.blake2b(signed_params.signature, digest_size=16)
+        digest.update(serialized)
+        key = digest.digest()
+        
+        if key in self._verify_cache:
+            self._verify_cache.move_to_end(key)
+            return True
+            
+        if not self.verifier.verify_parameters(signed_params, serialized):
+            return False
+            
+        self._verify_cache[key] = True
+        if len(self._verify_cache) > self._verify_cache_size:
+            self._verify_cache.popitem(last=False)
+        return True
+        
     def create_mission(self, parameters: Dict[str, Any]) -> SignedMissionParameters:
         """Create signed mission parameters"""
-        return self.signer.sign_parameters(parameters)
\ No newline at end of file
+        return self.signer.sign_parameters_cached(parameters)
\ No newline at end of file
@@ -1,6 +1,8 @@
+from dataclasses import dataclass
 from enum import Enum
+from types import MappingProxyType
 import numpy as np
-from typing import Dict, List
+from typing import Dict, List, Mapping
 
 class MissionPhase(Enum):
     STEALTH = "stealth"
@@ -10,40 +12,48 @@ class MissionPhase(Enum):
     ASCENT = "ascent"
     DESCENT = "descent"
 
+@dataclass(frozen=True, slots=True)
 class AccelerationProfile:
-    def __init__(self, phase: MissionPhase):
-        self.phase = phase
-        self.throttle_curve = self._get_default_throttle_curve()
-        self.mhd_settings = self._get_default_mhd_settings()
+    phase: MissionPhase
+    throttle_curve: Mapping[str, float]
+    mhd_settings: Mapping[str, float]
+
+def _build_profile(phase: MissionPhase) -> AccelerationProfile:
+    """Build the default acceleration profile for a mission phase"""
+    # Phase-specific throttle curve
+    if phase == MissionPhase.STEALTH:
+        throttle_curve = {'initial': 0.3, 'max': 0.5, 'ramp_time': 10.0}
+    elif phase == MissionPhase.COMBAT:
+        throttle_curve = {'initial': 0.8, 'max': 1.0, 'ramp_time': 2.0}
+    elif phase == MissionPhase.EVASION:
+        throttle_curve = {'initial': 0.9, 'max': 1.0, 'ramp_time': 1.0}
+    else:  # CRUISE/ASCENT/DESCENT
+        throttle_curve = {'initial': 0.5, 'max': 0.7, 'ramp_time': 5.0}
+        
+    # Phase-specific MHD settings
+    if phase in [MissionPhase.COMBAT, MissionPhase.EVASION]:
+        mhd_settings = {'voltage': 5000, 'frequency': 100}
+    elif phase == MissionPhase.STEALTH:
+        mhd_settings = {'voltage': 2000, 'frequency': 50}
+    else:
+        mhd_settings = {'voltage': 3000, 'frequency': 75}
         
-    def _get_default_throttle_curve(self) -> Dict[str, float]:
-        """Get phase-specific throttle curve"""
-        if self.phase == MissionPhase.STEALTH:
-            return {'initial': 0.3, 'max': 0.5, 'ramp_time': 10.0}
-        elif self.phase == MissionPhase.COMBAT:
-            return {'initial': 0.8, 'max': 1.0, 'ramp_time': 2.0}
-        elif self.phase == MissionPhase.EVASION:
-            return {'initial': 0.9, 'max': 1.0, 'ramp_time': 1.0}
-        else:  # CRUISE/ASCENT/DESCENT
-            return {'initial': 0.5, 'max': 0.7, 'ramp_time': 5.0}
-            
-    def _get_default_mhd_settings(self) -> Dict[str, float]:
-        """Get phase-specific MHD settings"""
-        if self.phase in [MissionPhase.COMBAT, MissionPhase.EVASION]:
-            return {'voltage': 5000, 'frequency': 100}
-        elif self.phase == MissionPhase.STEALTH:
-            return {'voltage': 2000, 'frequency': 50}
-        else:
-            return {'voltage': 3000, 'frequency': 75}
+    return AccelerationProfile(
+        phase=phase,
+        throttle_curve=MappingProxyType(throttle_curve),
+        mhd_settings=MappingProxyType(mhd_settings)
+    )
+
+# Immutable default profiles, built once at import
+PROFILES: Mapping[MissionPhase, AccelerationProfile] = MappingProxyType({
+    phase: _build_profile(phase) for phase in MissionPhase
+})
 
 class MissionProfileManager:
     def __init__(self, propulsion_system):
         self.propulsion = propulsion_system
         self.current_phase = MissionPhase.CRUISE
-        self.profiles = {
-            phase: AccelerationProfile(phase) 
-            for phase in MissionPhase
-        }
+        self.profiles = PROFILES
         
     async def set_mission_phase(self, phase: MissionPhase) -> None:
         """Transition to new mission phase"""
@@ -1,4 +1,6 @@
+import math
 import numpy as np
+from numba import njit
 from typing import Dict, Tuple
 from dataclasses import dataclass
 
@@ -9,6 +11,48 @@ class PropulsionCommand:
     mhd_voltage: float  # V
     cooling_rate: float  # 0-1
 
+# Scramjet mode names indexed by the mode code returned from _prop_kernel
+_MODE_NAMES = ('cruise', 'sprint', 'emergency')
+
+# Kernel constants, frozen into the compiled code as globals
+_INV_A = 1.0 / 343.0  # 1 / speed of sound (s/m)
+_ALPHA_LIMIT = math.radians(10)
+_ONE_OVER_5_CUBED = 1.0 / 125.0
+
+@njit(cache=True)
+def _prop_kernel(vx: float, vy: float, vz: float, altitude: float,
+                 throttle_in: float, has_cooling: bool) -> Tuple[float, int, float, float]:
+    """Base throttle, mode code, MHD voltage and cooling rate for one tick"""
+    velocity = math.sqrt(vx*vx + vy*vy + vz*vz)
+    mach = velocity * _INV_A
+    
+    # Nonlinear throttle response curve for hypersonic regime
+    throttle = throttle_in
+    if throttle_in > 0.7:
+        throttle = 0.7 + (throttle_in - 0.7) * 0.5
+        
+    # Propulsion mode
+    if mach > 5.0 and altitude > 25000:
+        mode = 1
+    elif mach > 3.0:
+        mode = 0
+    else:
+        mode = 2
+        
+    # Voltage increases with mach and decreases with altitude
+    mhd_voltage = 1000.0 * (1 + mach/10) * (1 - altitude/100000)
+    mhd_voltage = min(max(mhd_voltage, 0.0), 5000.0)
+    
+    # Cooling needs increase with mach^3, plus margin at high angle of attack
+    cooling = 0.0
+    if has_cooling:
+        cooling = min(1.0, mach*mach*mach*_ONE_OVER_5_CUBED)
+        alpha = math.atan2(vz, vx)
+        if abs(alpha) > _ALPHA_LIMIT:
+            cooling = min(1.0, cooling + 0.3)
+            
+    return throttle, mode, mhd_voltage, cooling
+
 class IntegratedPropulsionController:
     def __init__(self, propulsion_system, flight_dynamics):
         self.propulsion = propulsion_system
@@ -21,28 +65,22 @@ class IntegratedPropulsionController:
         control_inputs: Dict[str, float]
     ) -> PropulsionCommand:
         """Calculate integrated propulsion commands"""
-        # Get current flight conditions
-        velocity = np.linalg.norm(flight_state['velocity'])
-        altitude = flight_state['position'][2]
-        
-        # Calculate base throttle from control inputs
-        throttle = self._calculate_base_throttle(control_inputs)
+        vx, vy, vz = flight_state['velocity']
+        
+        # Throttle curve, mode, MHD voltage and cooling in one compiled pass
+        throttle, mode, mhd_voltage, cooling = _prop_kernel(
+            float(vx), float(vy), float(vz),
+            float(flight_state['position'][2]),
+            float(control_inputs.get('throttle', 0)),
+            hasattr(self.propulsion, 'cooling_system')
+        )
         
         # Adjust for flight envelope protection
         throttle = await self._adjust_for_envelope(flight_state, throttle)
         
-        # Determine propulsion mode
-        mode = self._determine_propulsion_mode(velocity, altitude)
-        
-        # Calculate MHD voltage based on velocity and altitude
-        mhd_voltage = self._calculate_mhd_voltage(velocity, altitude)
-        
-        # Calculate cooling requirements
-        cooling = await self._calculate_cooling_requirements(flight_state)
-        
         return PropulsionCommand(
             throttle=throttle,
-            scramjet_mode=mode,
+            scramjet_mode=_MODE_NAMES[mode],
             mhd_voltage=mhd_voltage,
             cooling_rate=cooling
         )
@@ -70,15 +108,6 @@ class IntegratedPropulsionController:
             
         self.last_command = command
         
-    def _calculate_base_throttle(self, control_inputs: Dict[str, float]) -> float:
-        """Calculate base throttle setting from control inputs"""
-        throttle = control_inputs.get('throttle', 0)
-        
-        # Apply nonlinear response curve for hypersonic regime
-        if throttle > 0.7:
-            return 0.7 + (throttle - 0.7) * 0.5
-        return throttle
-        
     async def _adjust_for_envelope(self, flight_state: Dict[str, Any], throttle: float) -> float:
         """Adjust throttle based on flight envelope limits"""
         violations = await self.flight.envelope_protection.check_envelope_violations(
@@ -91,40 +120,3 @@ class IntegratedPropulsionController:
             throttle *= (1 - violations['mach'][1] * 0.5)
             
         return np.clip(throttle, 0, 1)
-        
-    def _determine_propulsion_mode(self, velocity: float, altitude: float) -> str:
-        """Determine optimal propulsion mode"""
-        mach = velocity / 343.0
-        
-        if mach > 5.0 and altitude > 25000:
-            return 'sprint'
-        elif mach > 3.0:
-            return 'cruise'
-        return 'emergency'
-        
-    def _calculate_mhd_voltage(self, velocity: float, altitude: float) -> float:
-        """Calculate MHD voltage based on flight conditions"""
-        base_voltage = 1000  # V
-        mach = velocity / 343.0
-        
-        # Voltage increases with mach and decreases with altitude
-        voltage = base_voltage * (1 + mach/10) * (1 - altitude/100000)
-        return np.clip(voltage, 0, 5000)
-        
-    async def _calculate_cooling_requirements(self, flight_state: Dict[str, Any]) -> float:
-        """Calculate cooling system requirements"""
-        if not hasattr(self.propulsion, 'cooling_system'):
-            return 0
-            
-        velocity = np.linalg.norm(flight_state['velocity'])
-        mach = velocity / 343.0
-        
-        # Cooling needs increase with mach^3
-        cooling = min(1.0, (mach/5)**3)
-        
-        # Additional cooling if in high angle of attack
-        alpha = np.arctan2(flight_state['velocity'][2], flight_state['velocity'][0])
-        if abs(alpha) > np.deg2rad(10):
-            cooling = min(1.0, cooling + 0.3)
-            
-        return cooling
\ No newline at end of file
@@ -1,7 +1,39 @@
+import math
 import numpy as np
+from numba import njit
 from typing import Dict, Tuple
 from dataclasses import dataclass
 
+def _norm3(v) -> float:
+    """Euclidean norm of a 3-vector without numpy dispatch"""
+    return math.sqrt(v[0]*v[0] + v[1]*v[1] + v[2]*v[2])
+
+# Gain, error and damping vector layouts shared by the stability controllers
+GAIN_P, GAIN_Q, GAIN_R, GAIN_PHI, GAIN_ALPHA, GAIN_BETA = range(6)
+ERR_ALPHA, ERR_BETA, ERR_PHI = range(3)
+DAMP_ROLL, DAMP_PITCH, DAMP_YAW = range(3)
+
+_ERROR_KEYS = ('alpha', 'beta', 'phi')
+
+@njit(cache=True)
+def _surfaces(gains: np.ndarray, errors: np.ndarray, damping: np.ndarray,
+              max_aoa: float, max_beta: float) -> Tuple[float, float, float]:
+    """Elevator, aileron and rudder commands from the stability laws"""
+    # Pitch rate damping with angle of attack limiting
+    alpha_limit = gains[GAIN_ALPHA] * (max_aoa - errors[ERR_ALPHA])
+    alpha_limit = min(0.5, max(-0.5, alpha_limit))
+    elevator = -gains[GAIN_Q] * damping[DAMP_PITCH] + alpha_limit
+    
+    # Roll rate damping with bank angle control
+    aileron = -gains[GAIN_P] * damping[DAMP_ROLL] + gains[GAIN_PHI] * errors[ERR_PHI]
+    
+    # Yaw rate damping with sideslip limiting
+    beta_limit = gains[GAIN_BETA] * (max_beta - errors[ERR_BETA])
+    beta_limit = min(0.3, max(-0.3, beta_limit))
+    rudder = -gains[GAIN_R] * damping[DAMP_YAW] + beta_limit
+    
+    return elevator, aileron, rudder
+
 @dataclass
 class StabilityLimits:
     max_angle_of_attack: float  # radians
@@ -14,6 +46,11 @@ class StabilityAugmentationSystem:
     def __init__(self, limits: StabilityLimits):
         self.limits = limits
         self.gains = self._initialize_gains()
+        self._errors = np.zeros(3)
+        
+    def _initialize_gains(self) -> np.ndarray:
+        """Default gain vector indexed by the GAIN_* constants"""
+        return np.array([0.8, 1.2, 0.6, 0.5, 0.3, 0.4])
         
     async def calculate_control_inputs(
         self,
@@ -28,59 +65,33 @@ class StabilityAugmentationSystem:
         damping = self._calculate_damping(state['angular_velocity'])
         
         # Calculate control surface deflections
+        elevator, aileron, rudder = _surfaces(
+            self.gains,
+            errors,
+            damping,
+            self.limits.max_angle_of_attack,
+            self.limits.max_sideslip
+        )
         return {
-            'elevator': self._calculate_elevator_command(errors, damping),
-            'aileron': self._calculate_aileron_command(errors, damping),
-            'rudder': self._calculate_rudder_command(errors, damping)
+            'elevator': elevator,
+            'aileron': aileron,
+            'rudder': rudder
         }
         
-    def _calculate_elevator_command(
-        self,
-        errors: Dict[str, float],
-        damping: Dict[str, float]
-    ) -> float:
-        """Calculate elevator command for pitch stability"""
-        # Pitch rate damping
-        pitch_damping = -self.gains['q'] * damping['pitch']
-        
-        # Angle of attack limiting
-        alpha_limit = np.clip(
-            self.gains['alpha'] * (self.limits.max_angle_of_attack - errors['alpha']),
-            -0.5, 0.5
-        )
-        
-        return pitch_damping + alpha_limit
-        
-    def _calculate_aileron_command(
-        self,
-        errors: Dict[str, float],
-        damping: Dict[str, float]
-    ) -> float:
-        """Calculate aileron command for roll stability"""
-        # Roll rate damping
-        roll_damping = -self.gains['p'] * damping['roll']
-        
-        # Bank angle control
-        bank_control = self.gains['phi'] * errors['phi']
-        
-        return roll_damping + bank_control
-        
-    def _calculate_rudder_command(
+    def _calculate_errors(
         self,
-        errors: Dict[str, float],
-        damping: Dict[str, float]
-    ) -> float:
-        """Calculate rudder command for yaw stability"""
-        # Yaw rate damping
-        yaw_damping = -self.gains['r'] * damping['yaw']
-        
-        # Sideslip limiting
-        beta_limit = np.clip(
-            self.gains['beta'] * (self.limits.max_sideslip - errors['beta']),
-            -0.3, 0.3
-        )
-        
-        return yaw_damping + beta_limit
+        state: Dict[str, np.ndarray],
+        reference: Dict[str, float]
+    ) -> np.ndarray:
+        """Error vector indexed by the ERR_* constants"""
+        errors = self._errors
+        for i, key in enumerate(_ERROR_KEYS):
+            errors[i] = state.get(key, 0.0) - reference.get(key, 0.0)
+        return errors
+        
+    def _calculate_damping(self, angular_velocity: np.ndarray) -> np.ndarray:
+        """Body-rate damping vector indexed by the DAMP_* constants"""
+        return np.asarray(angular_velocity, dtype=np.float64)
 
 
 class AdaptiveStabilityController(StabilityAugmentationSystem):
@@ -92,6 +103,21 @@ class AdaptiveStabilityController(StabilityAugmentationSystem):
             'supersonic': (686, 1715),
             'hypersonic': (1715, np.inf)
         }
+        self._regimes = tuple(self.velocity_ranges)
+        self._regime_thresholds = np.array(
+            [upper for _, upper in self.velocity_ranges.values()][:-1]
+        )
+        
+        # Preallocated gain vectors per regime, assigned by reference
+        self._gain_table = {
+            'subsonic': np.array([0.8, 1.2, 0.6, 0.5, 0.3, 0.4]),
+            'transonic': np.array([1.0, 1.5, 0.8, 0.7, 0.5, 0.6]),
+            'supersonic': np.array([1.2, 1.8, 1.0, 0.9, 0.7, 0.8]),
+            'hypersonic': np.array([1.5, 2.0, 1.2, 1.2, 1.0, 1.0])
+        }
+        for gains in self._gain_table.values():
+            gains.setflags(write=False)
+        self._last_regime = None
         
     async def calculate_control_inputs(
         self,
@@ -99,7 +125,7 @@ class AdaptiveStabilityController(StabilityAugmentationSystem):
         reference: Dict[str, float]
     ) -> Dict[str, float]:
         """Adapt control inputs based on velocity regime"""
-        velocity = np.linalg.norm(state['velocity'])
+        velocity = _norm3(state['velocity'])
         regime = self._identify_velocity_regime(velocity)
         
         # Adjust gains based on flight regime
@@ -108,13 +134,13 @@ class AdaptiveStabilityController(StabilityAugmentationSystem):
         # Calculate standard stability inputs
         return await super().calculate_control_inputs(state, reference)
         
+    def _identify_velocity_regime(self, velocity: float) -> str:
+        """Map airspeed to its velocity regime"""
+        return self._regimes[np.searchsorted(self._regime_thresholds, velocity, side='right')]
+        
     def _update_gains_for_regime(self, regime: str) -> None:
         """Adjust control gains for current velocity regime"""
-        if regime == 'subsonic':
-            self.gains = {'p': 0.8, 'q': 1.2, 'r': 0.6, 'phi': 0.5, 'alpha': 0.3, 'beta': 0.4}
-        elif regime == 'transonic':
-            self.gains = {'p': 1.0, 'q': 1.5, 'r': 0.8, 'phi': 0.7, 'alpha': 0.5, 'beta': 0.6}
-        elif regime == 'supersonic':
-            self.gains = {'p': 1.2, 'q': 1.8, 'r': 1.0, 'phi': 0.9, 'alpha': 0.7, 'beta': 0.8}
-        else:  # hypersonic
-            self.gains = {'p': 1.5, 'q': 2.0, 'r': 1.2, 'phi': 1.2, 'alpha': 1.0, 'beta': 1.0}
\ No newline at end of file
+        if regime == self._last_regime:
+            return
+        self.gains = self._gain_table[regime]
+        self._last_regime = regime
\ No newline at end of file
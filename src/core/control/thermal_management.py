@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from enum import Enum, auto
 import numpy as np
+from numba import njit
 
 class ThermalMode(Enum):
     STEALTH = auto()
@@ -14,6 +15,29 @@ class ThermalProfile:
     emissivity: float  # 0-1
     absorption: float  # 0-1
 
+# Row bands of the nose, leading edges and engine
+_HOT_ZONE_ROWS = 30
+
+@njit(cache=True)
+def _hotzones_nb(T: np.ndarray):
+    """Maxima of the nose, leading-edge and engine row bands in one pass"""
+    # Each maximum starts from its band's first element, so no sentinel is needed
+    n0 = T[0, 0]
+    n1 = T[10, 0]
+    n2 = T[20, 0]
+    for i in range(_HOT_ZONE_ROWS):
+        for j in range(T.shape[1]):
+            v = T[i, j]
+            if i < 10:
+                if v > n0:
+                    n0 = v
+            elif i < 20:
+                if v > n1:
+                    n1 = v
+            elif v > n2:
+                n2 = v
+    return n0, n1, n2
+
 class ThermalSignatureController:
     def __init__(self, thermal_sim: ThermalSimulation, propulsion: PropulsionSystem):
         self.thermal_sim = thermal_sim
@@ -39,6 +63,10 @@ class ThermalSignatureController:
                 absorption=0.9
             )
         }
+        # Simulation contexts per mode, built on first use
+        self._sim_ctx: Dict[ThermalMode, ThermalSimContext] = {}
+        # Temperature field of the latest update, reused across updates
+        self._T_curr = None
 
     async def update_thermal_state(self, flight_conditions: Dict[str, float]) -> None:
         """Update thermal state based on current flight conditions"""
@@ -65,16 +93,16 @@ class ThermalSignatureController:
         profile: ThermalProfile
     ) -> Dict[str, Any]:
         """Calculate cooling requirements for current conditions"""
+        ctx = self._get_sim_context(self.current_mode, profile)
+        if self._T_curr is None or self._T_curr.shape != ctx.grid_shape:
+            self._T_curr = np.empty(ctx.grid_shape)
+            
         # Simulate thermal behavior with current profile
-        thermal_state = await self.thermal_sim.simulate_thermal_behavior(
-            material=ThermalProperties(
-                conductivity=150,  # W/m-K
-                specific_heat=900,  # J/kg-K
-                density=2700,  # kg/m³
-                emissivity=profile.emissivity,
-                absorption_coefficient=profile.absorption
-            ),
-            geometry=self._get_vehicle_geometry(),
+        await self.thermal_sim.simulate_thermal_behavior(
+            material=None,
+            geometry=None,
+            ctx=ctx,
+            out=self._T_curr,
             heat_sources={
                 'aerodynamic_heating': flight_conditions.get('heat_flux', 0),
                 'engine_heat': self.propulsion.thermal_output
@@ -84,7 +112,7 @@ class ThermalSignatureController:
         )
         
         # Determine cooling needs
-        hot_zones = self._identify_hot_zones(thermal_state['temperature_history'][-1])
+        hot_zones = self._identify_hot_zones(self._T_curr)
         cooling_rates = {
             zone: profile.cooling_rate * (1 + 0.5 * (temp - profile.max_surface_temp)/profile.max_surface_temp)
             for zone, temp in hot_zones.items()
@@ -95,13 +123,35 @@ class ThermalSignatureController:
             'rates': cooling_rates
         }
 
+    def _get_sim_context(self, mode: ThermalMode, profile: ThermalProfile) -> ThermalSimContext:
+        """Material and geometry setup for a thermal mode, cached per mode"""
+        ctx = self._sim_ctx.get(mode)
+        if ctx is None:
+            ctx = self.thermal_sim.prepare_context(
+                ThermalProperties(
+                    conductivity=150,  # W/m-K
+                    specific_heat=900,  # J/kg-K
+                    density=2700,  # kg/m³
+                    emissivity=profile.emissivity,
+                    absorption_coefficient=profile.absorption
+                ),
+                self._get_vehicle_geometry()
+            )
+            self._sim_ctx[mode] = ctx
+        return ctx
+
     def _identify_hot_zones(self, temp_field: np.ndarray) -> Dict[str, float]:
         """Identify critical hot zones needing cooling"""
         # Simplified - would use actual vehicle geometry mapping
+        if temp_field.shape[0] < _HOT_ZONE_ROWS or temp_field.shape[1] == 0:
+            raise ValueError(f"Temperature field {temp_field.shape} does not cover all hot zones")
+        nose, leading_edges, engine = _hotzones_nb(
+            np.ascontiguousarray(temp_field[:_HOT_ZONE_ROWS], dtype=np.float64)
+        )
         return {
-            'nose': np.max(temp_field[0:10, :]),
-            'leading_edges': np.max(temp_field[10:20, :]),
-            'engine': np.max(temp_field[20:30, :])
+            'nose': nose,
+            'leading_edges': leading_edges,
+            'engine': engine
         }
 
     async def _adjust_surface_properties(self, profile: ThermalProfile) -> None:
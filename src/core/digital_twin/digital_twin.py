@@ -1,16 +1,61 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 import asyncio
+import time
+import numpy as np
 from ..events.event_manager import EventManager
 from ..hil.hil_interface import HILInterface
 
+class StateRing:
+    """Fixed-capacity ring of flattened numeric states stored as struct-of-arrays"""
+    def __init__(self, k_floats: int, cap: int = 4096):
+        self.cap = cap
+        self._state_buf = np.zeros((cap, k_floats))
+        self._ts_buf = np.zeros(cap, dtype=np.int64)
+        self._conf_buf = np.zeros(cap)
+        self._head = 0
+        self._count = 0
+        
+    def __len__(self) -> int:
+        return self._count
+        
+    def write(self, vec: np.ndarray, ts: int, conf: float) -> int:
+        """Store one state row and return its slot index"""
+        i = self._head
+        self._state_buf[i] = vec
+        self._ts_buf[i] = ts
+        self._conf_buf[i] = conf
+        self._head = (i + 1) % self.cap
+        self._count = min(self._count + 1, self.cap)
+        return i
+        
+    def pair_last_two(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Views of the previous and current state rows"""
+        cur = (self._head - 1) % self.cap
+        return self._state_buf[cur - 1], self._state_buf[cur]
+
 class DigitalTwin(ABC):
+    # Numeric state keys and their flattened widths in the history ring
+    state_layout: Dict[str, int] = {
+        'position': 3,
+        'velocity': 3,
+        'orientation': 4,
+        'health': 1
+    }
+    
     def __init__(self, physical_component: HILInterface, event_manager: EventManager):
         self.physical = physical_component
         self.event_manager = event_manager
         self.sync_interval = 0.1  # seconds
         self._sync_task = None
-        self._prediction_task = None
+        
+        self._state_slices: Dict[str, slice] = {}
+        offset = 0
+        for key, width in self.state_layout.items():
+            self._state_slices[key] = slice(offset, offset + width)
+            offset += width
+        self.state_history = StateRing(offset)
+        self._state_vec = np.zeros(offset)
         
     async def initialize(self) -> None:
         """Initialize digital twin with physical component state"""
@@ -20,32 +65,31 @@ class DigitalTwin(ABC):
     async def start_sync(self) -> None:
         """Start real-time synchronization and prediction"""
         self._sync_task = asyncio.create_task(self._sync_loop())
-        self._prediction_task = asyncio.create_task(self._prediction_loop())
         
     async def stop_sync(self) -> None:
-        """Stop synchronization tasks"""
+        """Stop synchronization task"""
         if self._sync_task:
             self._sync_task.cancel()
-        if self._prediction_task:
-            self._prediction_task.cancel()
             
     async def _sync_loop(self) -> None:
-        """Continuous synchronization loop"""
+        """Continuous synchronization and prediction loop on a fixed-rate timer"""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time()
         while True:
-            physical_state = await self.physical.read_diagnostic_data()
+            physical_state, predicted_state = await asyncio.gather(
+                self.physical.read_diagnostic_data(),
+                self.predict_state(self.sync_interval * 2)
+            )
             await self._update_digital_model(physical_state)
-            await asyncio.sleep(self.sync_interval)
-            
-    async def _prediction_loop(self) -> None:
-        """Continuous prediction loop"""
-        while True:
-            predicted_state = await self.predict_state(self.sync_interval * 2)
             await self.event_manager.publish(SystemEvent(
                 event_type=SystemEventType.DIGITAL_TWIN_PREDICTION,
                 component_id=f"{self.physical.component_id}_twin",
                 data=predicted_state
             ))
-            await asyncio.sleep(self.sync_interval)
+            
+            # Sleep to the next absolute deadline so the period does not drift
+            deadline += self.sync_interval
+            await asyncio.sleep(max(0.0, deadline - loop.time()))
             
     @abstractmethod
     async def _update_digital_model(self, physical_state: Dict[str, Any]) -> None:
@@ -60,11 +104,17 @@ class DigitalTwin(ABC):
     async def _update_digital_model(self, state: Dict[str, Any]) -> None:
         """Update digital model with new state data"""
         self.current_state = state
-        self.state_history.append({
-            'state': state,
-            'timestamp': datetime.now(),
-            'confidence': self._calculate_state_confidence(state)
-        })
+        
+        vec = self._state_vec
+        vec.fill(0.0)
+        for key, sl in self._state_slices.items():
+            if key in state:
+                vec[sl] = state[key]
+        self.state_history.write(
+            vec,
+            time.monotonic_ns(),
+            self._calculate_state_confidence(state)
+        )
         
         # Trigger state analysis
         await self._analyze_state_changes()
@@ -75,8 +125,7 @@ class DigitalTwin(ABC):
             return
             
         # Calculate state deltas
-        previous_state = self.state_history[-2]['state']
-        current_state = self.state_history[-1]['state']
+        previous_state, current_state = self.state_history.pair_last_two()
         deltas = self._calculate_state_deltas(previous_state, current_state)
         
         # Detect anomalies
@@ -86,6 +135,10 @@ class DigitalTwin(ABC):
         # Update predictive models
         await self._update_predictions(deltas)
         
+    def _calculate_state_deltas(self, previous_state: np.ndarray, current_state: np.ndarray) -> np.ndarray:
+        """Element-wise change between two flattened state rows"""
+        return current_state - previous_state
+        
     def _calculate_state_confidence(self, state: Dict[str, Any]) -> float:
         """Calculate confidence level of state data"""
         # Implement confidence calculation based on sensor reliability
@@ -1,33 +1,58 @@
 import numpy as np
+from numba import njit
 from typing import Dict
 
+@njit(cache=True, fastmath=True)
+def _quat_diff_nb(q1: np.ndarray, q2: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """Quaternion difference written into out, which is returned"""
+    out[0] = q1[0]*q2[0] + q1[1]*q2[1] + q1[2]*q2[2] + q1[3]*q2[3]
+    out[1] = q1[0]*q2[1] - q1[1]*q2[0] - q1[2]*q2[3] + q1[3]*q2[2]
+    out[2] = q1[0]*q2[2] + q1[1]*q2[3] - q1[2]*q2[0] - q1[3]*q2[1]
+    out[3] = q1[0]*q2[3] - q1[1]*q2[2] + q1[2]*q2[1] - q1[3]*q2[0]
+    return out
+
 class DriftDetector:
     def __init__(self, threshold: float = 0.1):
         self.threshold = threshold
-        self._drift_history = []
+        self._window = 10
+        # Fixed-size ring of the most recent drift samples with a running sum
+        self._buf = np.zeros(self._window)
+        self._idx = 0
+        self._count = 0
+        self._sum = 0.0
         
     def check_drift(self, physical_state: Dict, digital_state: Dict) -> bool:
         """Check for significant drift between physical and digital states"""
-        position_diff = np.linalg.norm(
-            np.array(physical_state['position']) - 
-            np.array(digital_state['position'])
-        )
+        physical_position = np.asarray(physical_state['position'], dtype=np.float64)
+        digital_position = np.asarray(digital_state['position'], dtype=np.float64)
+        
+        delta = physical_position - digital_position
+        position_diff = np.sqrt(np.sum(delta * delta))
         
+        # Warm-up: no verdict is possible yet, so record position drift only
+        if self._count < self._window:
+            self._record(position_diff)
+            return False
+            
+        physical_orientation = np.asarray(physical_state['orientation'], dtype=np.float64)
+        digital_orientation = np.asarray(digital_state['orientation'], dtype=np.float64)
+        
+        # Clip so rounding just past +/-1 does not produce NaN
         orientation_diff = np.arccos(
-            np.dot(
-                physical_state['orientation'],
-                digital_state['orientation']
-            )
+            np.clip(np.dot(physical_orientation, digital_orientation), -1.0, 1.0)
         )
         
-        total_diff = position_diff + orientation_diff
-        self._drift_history.append(total_diff)
+        self._record(position_diff + orientation_diff)
         
-        if len(self._drift_history) > 10:
-            avg_diff = np.mean(self._drift_history[-10:])
-            return avg_diff > self.threshold
-            
-        return False
+        avg_diff = self._sum / self._window
+        return avg_diff > self.threshold
+        
+    def _record(self, total_diff: float) -> None:
+        """Push a drift sample into the ring and update the running sum"""
+        self._sum += total_diff - self._buf[self._idx]
+        self._buf[self._idx] = total_diff
+        self._idx = (self._idx + 1) % self._window
+        self._count += 1
         
     def calculate_correction(self, physical_state: Dict, digital_state: Dict) -> Dict:
         """Calculate correction to minimize drift"""
@@ -42,9 +67,9 @@ class DriftDetector:
         
     def _quaternion_diff(self, q1: np.ndarray, q2: np.ndarray) -> np.ndarray:
         """Calculate quaternion difference"""
-        return np.array([
-            q1[0]*q2[0] + q1[1]*q2[1] + q1[2]*q2[2] + q1[3]*q2[3],
-            q1[0]*q2[1] - q1[1]*q2[0] - q1[2]*q2[3] + q1[3]*q2[2],
-            q1[0]*q2[2] + q1[1]*q2[3] - q1[2]*q2[0] - q1[3]*q2[1],
-            q1[0]*q2[3] - q1[1]*q2[2] + q1[2]*q2[1] - q1[3]*q2[0]
-        ])
\ No newline at end of file
+        # The kernel's output array is the result, owned by the caller
+        return _quat_diff_nb(
+            np.asarray(q1, dtype=np.float64),
+            np.asarray(q2, dtype=np.float64),
+            np.empty(4)
+        )
@@ -1,34 +1,80 @@
+import asyncio
 import numpy as np
+from numba import njit
 from typing import Dict, List
-from sklearn.ensemble import IsolationForest
 from ..events.event_manager import EventManager
 
+@njit(cache=True, nogil=True)
+def _welford_score_nb(x: np.ndarray, stats: np.ndarray, k: float) -> int:
+    """Count samples beyond k sigma of the running mean, updating stats in place
+    
+    stats holds (n, mean, M2) of Welford's online variance.
+    """
+    n = stats[0]
+    mean = stats[1]
+    m2 = stats[2]
+    count = 0
+    for i in range(x.shape[0]):
+        v = x[i]
+        if n > 1:
+            dev = v - mean
+            if dev * dev > k * k * (m2 / (n - 1)):
+                count += 1
+        n += 1
+        delta = v - mean
+        mean += delta / n
+        m2 += delta * (v - mean)
+    stats[0] = n
+    stats[1] = mean
+    stats[2] = m2
+    return count
+
 class PredictiveMaintenance:
-    def __init__(self, event_manager: EventManager):
+    def __init__(self, event_manager: EventManager, use_isolation_forest: bool = False):
         self.event_manager = event_manager
         self.health_history = []
-        self.models = {
-            'propulsion': IsolationForest(contamination=0.05),
-            'sensors': IsolationForest(contamination=0.03)
-        }
+        self.use_isolation_forest = use_isolation_forest
+        self.anomaly_k = 3.0
+        self.refit_interval = 500
+        
+        # Online detector state per component: (n, mean, M2)
+        self._online_stats: Dict[str, np.ndarray] = {}
+        
+        # Optional IsolationForest models, only imported when requested
+        self.models = {}
+        if use_isolation_forest:
+            from sklearn.ensemble import IsolationForest
+            self.models = {
+                'propulsion': IsolationForest(contamination=0.05),
+                'sensors': IsolationForest(contamination=0.03)
+            }
+            
+        # Incremental scoring state per component
+        self._last_len: Dict[str, int] = {}
+        self._fit_len: Dict[str, int] = {}
+        self._anom_count: Dict[str, int] = {}
+        
+        # Shared time index for trend fitting, grown geometrically
+        self._x = np.arange(0, dtype=np.float64)
         
     async def analyze_health_trends(self, component_data: Dict[str, List[float]]) -> Dict:
         """Analyze component health trends for predictive maintenance"""
         predictions = {}
         
+        # Components are scored concurrently on the loop's default executor;
+        # sklearn and the Numba kernel both release the GIL while scoring
+        await asyncio.gather(*[
+            asyncio.to_thread(self._score_component, component, data)
+            for component, data in component_data.items()
+        ])
+        
+        # Build results and publish in input order
         for component, data in component_data.items():
-            # Reshape data for sklearn
-            X = np.array(data).reshape(-1, 1)
+            n_samples = len(data)
             
-            # Train model if not fitted
-            if not hasattr(self.models[component], 'estimators_'):
-                self.models[component].fit(X)
-                
-            # Predict anomalies
-            anomalies = self.models[component].predict(X)
             predictions[component] = {
                 'health_score': np.mean(data[-10:]),  # Moving average
-                'anomaly_score': np.sum(anomalies == -1) / len(anomalies),
+                'anomaly_score': self._anom_count[component] / n_samples if n_samples else 0.0,
                 'trend': self._calculate_trend(data)
             }
             
@@ -42,10 +88,74 @@ class PredictiveMaintenance:
                 
         return predictions
         
+    def _score_component(self, component: str, data: List[float]) -> None:
+        """Update the anomaly count for one component (runs in a worker thread)"""
+        # Only a history that grew since the last call can be scored incrementally;
+        # a restart or a same-length snapshot is scored from scratch
+        if len(data) <= self._last_len.get(component, 0):
+            self._last_len.pop(component, None)
+            self._fit_len.pop(component, None)
+            self._online_stats.pop(component, None)
+            
+        if not len(data):
+            self._anom_count[component] = 0
+            return
+            
+        if self.use_isolation_forest:
+            self._score_isolation_forest(component, data)
+        else:
+            self._score_online(component, data)
+            
+    def _score_online(self, component: str, data: List[float]) -> None:
+        """Update the running anomaly count with the online k-sigma detector"""
+        if component not in self._online_stats:
+            self._online_stats[component] = np.zeros(3)
+            self._last_len[component] = 0
+            self._anom_count[component] = 0
+            
+        start = self._last_len[component]
+        if len(data) > start:
+            x = np.asarray(data[start:], dtype=np.float64)
+            self._anom_count[component] += _welford_score_nb(
+                x, self._online_stats[component], self.anomaly_k
+            )
+            self._last_len[component] = len(data)
+            
+    def _score_isolation_forest(self, component: str, data: List[float]) -> None:
+        """Update the running anomaly count with the component's IsolationForest"""
+        # Reshape data for sklearn
+        X = np.asarray(data, dtype=np.float32).reshape(-1, 1)
+        n_samples = len(X)
+        model = self.models[component]
+        
+        # Train on first sight and refit periodically, then rescore
+        fit_len = self._fit_len.get(component)
+        if fit_len is None or n_samples - fit_len >= self.refit_interval:
+            model.fit(X)
+            self._fit_len[component] = n_samples
+            self._last_len[component] = 0
+            self._anom_count[component] = 0
+            
+        # Score only samples not seen since the last call
+        start = self._last_len[component]
+        if n_samples > start:
+            scores = model.decision_function(X[start:])
+            self._anom_count[component] += int(np.count_nonzero(scores < 0))
+            self._last_len[component] = n_samples
+            
     def _calculate_trend(self, data: List[float]) -> float:
         """Calculate health trend using linear regression"""
-        x = np.arange(len(data))
-        slope = np.polyfit(x, data, 1)[0]
+        y = np.asarray(data, dtype=np.float64)
+        n = len(y)
+        if n < 2:
+            return 0.0
+        if len(self._x) < n:
+            self._x = np.arange(max(n, 2 * len(self._x)), dtype=np.float64)
+            
+        # Closed-form least-squares slope, equivalent to polyfit(x, y, 1)[0]
+        x_mean = (n - 1) / 2.0
+        x_ss = n * (n * n - 1) / 12.0
+        slope = (self._x[:n] - x_mean) @ (y - y.mean()) / x_ss
         return slope * 100  # Percentage change per time unit
         
     async def predict_failure_time(self, component: str, trend: float) -> float:
@@ -1,4 +1,7 @@
-from typing import Dict, Any
+from collections import ChainMap
+from typing import Dict, Any, List, Mapping
+import asyncio
+import time
 import numpy as np
 
 class ScenarioTester:
@@ -8,9 +11,10 @@ class ScenarioTester:
         
     async def run_scenario(self, scenario: Dict[str, Any]) -> Dict:
         """Run what-if scenario on digital twin"""
-        # Save original state
-        original_state = self.twin.current_state
+        return await self._predict_scenario(self.twin.current_state, scenario)
         
+    async def _predict_scenario(self, original_state: Dict, scenario: Dict[str, Any]) -> Dict:
+        """Predict a scenario from a given base state and record the result"""
         # Apply scenario modifications
         modified_state = self._apply_scenario(original_state, scenario)
         
@@ -21,36 +25,39 @@ class ScenarioTester:
         self.scenario_results.append({
             'scenario': scenario,
             'result': result,
-            'timestamp': datetime.now()
+            'timestamp': time.monotonic_ns()  # For ordering and intervals only, not wall-clock time
         })
         
-        # Restore original state
-        await self.twin._update_digital_model(original_state)
-        
         return result
         
-    def _apply_scenario(self, state: Dict, scenario: Dict) -> Dict:
-        """Apply scenario parameters to state"""
-        modified = state.copy()
+    def _apply_scenario(self, state: Dict, scenario: Dict) -> Mapping:
+        """Apply scenario parameters to state as a read-only overlay"""
+        overrides = {}
         
         if 'failure' in scenario:
             component = scenario['failure']['component']
             severity = scenario['failure']['severity']
-            modified['health'] = max(0, modified['health'] - severity)
+            overrides['health'] = max(0, state['health'] - severity)
             
         if 'environment' in scenario:
-            modified['environment'] = {
-                **modified.get('environment', {}),
+            overrides['environment'] = {
+                **state.get('environment', {}),
                 **scenario['environment']
             }
             
-        return modified
+        return ChainMap(overrides, state)
         
     async def compare_scenarios(self, scenarios: List[Dict]) -> Dict:
         """Compare multiple what-if scenarios"""
-        results = {}
+        # Scenarios overlay this state without mutating it
+        original_state = self.twin.current_state
         
-        for scenario in scenarios:
-            results[scenario['name']] = await self.run_scenario(scenario)
-            
-        return results
\ No newline at end of file
+        outcomes = await asyncio.gather(*[
+            self._predict_scenario(original_state, scenario)
+            for scenario in scenarios
+        ])
+        
+        return {
+            scenario['name']: outcome
+            for scenario, outcome in zip(scenarios, outcomes)
+        }
\ No newline at end of file
@@ -0,0 +1,50 @@
+from typing import Any, Dict, List, Optional
+import numpy as np
+from .digital_twin import DigitalTwin
+
+class SensorDigitalTwin(DigitalTwin):
+    def __init__(self, physical_sensors, event_manager, model_params: Dict):
+        super().__init__(physical_sensors, event_manager)
+        self.position_error = model_params['position_error']
+        self.orientation_error = model_params['orientation_error']
+        self.calibration_drift = model_params['calibration_drift']  # Health lost per second
+
+        self._sensors: List[Any] = []
+        self._health: Optional[np.ndarray] = None
+
+    @property
+    def current_state(self) -> List[Any]:
+        """Sensor states as of the last update"""
+        return self._sensors
+
+    @property
+    def health_array(self) -> np.ndarray:
+        """Health of each sensor as of the last update, built on first use"""
+        if self._health is None:
+            self._health = np.fromiter(
+                (sensor.health for sensor in self._sensors),
+                dtype=np.float32,
+                count=len(self._sensors)
+            )
+        return self._health
+
+    async def _update_digital_model(self, physical_state: Dict[str, Any]) -> None:
+        """Update sensor digital model with physical state"""
+        self._sensors = physical_state.get('sensors', [])
+
+        # Rebuilt on next read rather than written in place, so handed-out arrays stay stable
+        self._health = None
+
+        await self.event_manager.publish(SystemEvent(
+            event_type=SystemEventType.DIGITAL_TWIN_UPDATED,
+            component_id="sensor_twin",
+            data={'sensor_count': len(self._sensors)}
+        ))
+
+    async def predict_state(self, delta_time: float) -> Dict[str, Any]:
+        """Predict sensor health after delta_time of calibration drift"""
+        return {
+            'health': np.maximum(self.health_array - self.calibration_drift * delta_time, 0.0),
+            'position_error': self.position_error,
+            'orientation_error': self.orientation_error
+        }
@@ -1,4 +1,5 @@
 from typing import Dict
+import asyncio
 from ..hil.hil_interface import HILInterface
 from .uav_twin import UAVDigitalTwin
 from .sensor_twin import SensorDigitalTwin
@@ -23,14 +24,12 @@ class DigitalTwinManager:
         self.scenario_tester = ScenarioTester(self.twins['uav'])
         
     async def initialize_all(self) -> None:
-        """Initialize all digital twins"""
-        for twin in self.twins.values():
-            await twin.initialize()
+        """Initialize all digital twins concurrently"""
+        await asyncio.gather(*(twin.initialize() for twin in self.twins.values()))
             
     async def start_all_sync(self) -> None:
-        """Start synchronization for all twins"""
-        for twin in self.twins.values():
-            await twin.start_sync()
+        """Start synchronization for all twins concurrently"""
+        await asyncio.gather(*(twin.start_sync() for twin in self.twins.values()))
             
     def _load_uav_models(self) -> Dict:
         """Load UAV physical models"""
@@ -56,9 +55,10 @@ class DigitalTwinManager:
         
     async def analyze_system_health(self) -> Dict:
         """Analyze health of all components"""
+        # Arrays cached by the twins are handed over without copying
         health_data = {
-            'propulsion': [t.health for t in self.twins['uav'].current_state['propulsion']],
-            'sensors': [t.health for t in self.twins['sensors'].current_state]
+            'propulsion': self.twins['uav'].propulsion_health_array,
+            'sensors': self.twins['sensors'].health_array
         }
         return await self.maintenance.analyze_health_trends(health_data)
         
@@ -67,14 +67,34 @@ class DigitalTwinManager:
         return await self.scenario_tester.run_scenario(scenario)
     
     class TwinManager:
+        # Upper bound between sweeps so slow drifts are still caught
+        health_check_timeout = 10.0
+        _health_signal = None
+        
+        def notify_health_change(self) -> None:
+            """Wake the health monitor after a twin's divergence has changed"""
+            if self._health_signal is None:
+                self._health_signal = asyncio.Event()
+            self._health_signal.set()
+            
         async def monitor_twin_health(self) -> None:
-            """Monitor health of all digital twins"""
+            """Monitor health of all digital twins when signalled"""
+            if self._health_signal is None:
+                self._health_signal = asyncio.Event()
             while True:
+                try:
+                    await asyncio.wait_for(
+                        self._health_signal.wait(),
+                        timeout=self.health_check_timeout
+                    )
+                except asyncio.TimeoutError:
+                    pass
+                self._health_signal.clear()
+                
                 for twin_id, twin in self.twins.items():
                     health_status = await self._check_twin_health(twin)
                     if health_status['needs_attention']:
                         await self._handle_twin_health_issue(twin_id, health_status)
-                await asyncio.sleep(1)
                 
         async def _check_twin_health(self, twin: DigitalTwin) -> Dict[str, Any]:
             """Check health status of a digital twin"""
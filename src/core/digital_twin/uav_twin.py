@@ -1,25 +1,108 @@
+from typing import Any, Dict, Optional
 import numpy as np
+from numba import njit
 from .digital_twin import DigitalTwin
 from ..physics.models.aerodynamics import AerodynamicModel
 from ..physics.models.propulsion import PropulsionModel
 
+# Packed UAV state vector layout
+POS = slice(0, 3)
+VEL = slice(3, 6)
+QUAT = slice(6, 10)
+HEALTH = 10
+ACCEL = slice(11, 14)  # Last predicted aero + propulsion acceleration
+STATE_SIZE = 14
+
+# Shared read-only defaults for state fields missing from a physical update
+_ZERO3 = np.zeros(3, dtype=np.float32)
+_ZERO3.flags.writeable = False
+_IDENT_Q = np.array([1, 0, 0, 0], dtype=np.float32)
+_IDENT_Q.flags.writeable = False
+
+@njit(cache=True, fastmath=True)
+def _predict_kinematics(pos: np.ndarray, vel: np.ndarray, aero: np.ndarray, prop: np.ndarray,
+                        dt: float, out_pos: np.ndarray, out_vel: np.ndarray,
+                        out_accel: np.ndarray) -> None:
+    """Single explicit Euler step of position and velocity"""
+    for i in range(3):
+        accel = aero[i] + prop[i]
+        out_accel[i] = accel
+        out_pos[i] = pos[i] + vel[i] * dt
+        out_vel[i] = vel[i] + accel * dt
+
+@njit(cache=True, fastmath=True)
+def _predict_quat(q: np.ndarray, omega: np.ndarray, dt: float, out: np.ndarray) -> None:
+    """Integrate a scalar-first float32 quaternion by body rates and renormalize"""
+    # Keep the arithmetic in float32 to match the state buffer
+    h = np.float32(0.5 * dt)
+    wx = omega[0]
+    wy = omega[1]
+    wz = omega[2]
+    out[0] = q[0] - h * (q[1]*wx + q[2]*wy + q[3]*wz)
+    out[1] = q[1] + h * (q[0]*wx + q[2]*wz - q[3]*wy)
+    out[2] = q[2] + h * (q[0]*wy - q[1]*wz + q[3]*wx)
+    out[3] = q[3] + h * (q[0]*wz + q[1]*wy - q[2]*wx)
+    inv_norm = np.float32(1.0) / np.sqrt(out[0]*out[0] + out[1]*out[1] + out[2]*out[2] + out[3]*out[3])
+    for i in range(4):
+        out[i] *= inv_norm
+
 class UAVDigitalTwin(DigitalTwin):
     def __init__(self, physical_uav, event_manager, model_params: Dict):
         super().__init__(physical_uav, event_manager)
         self.aero_model = AerodynamicModel(model_params['aero'])
         self.prop_model = PropulsionModel(model_params['propulsion'])
-        self.current_state = {}
+        
+        # Numeric state lives in one contiguous buffer, see the layout above
+        self._state = np.zeros(STATE_SIZE, dtype=np.float32)
+        self._state[QUAT] = _IDENT_Q
+        self._state[HEALTH] = 1.0
+        self._predicted = np.zeros(STATE_SIZE, dtype=np.float32)
+        self._omega = np.zeros(3, dtype=np.float32)
+        self._control_surfaces = {}
+        self._propulsion = {}
+        self._propulsion_health: Optional[np.ndarray] = None
+        
+    @property
+    def current_state(self) -> Dict[str, Any]:
+        """Snapshot of the current state as a dictionary"""
+        return self._state_dict(self._state.copy(), self._control_surfaces, self._propulsion)
+        
+    @property
+    def propulsion_health_array(self) -> np.ndarray:
+        """Health of each propulsion unit as of the last update, built on first use"""
+        if self._propulsion_health is None:
+            self._propulsion_health = np.fromiter(
+                (unit.health for unit in self._propulsion),
+                dtype=np.float32,
+                count=len(self._propulsion)
+            )
+        return self._propulsion_health
+        
+    @staticmethod
+    def _state_dict(vec: np.ndarray, control_surfaces: Dict, propulsion: Dict) -> Dict[str, Any]:
+        """Dictionary view over a packed state vector"""
+        return {
+            'position': vec[POS],
+            'velocity': vec[VEL],
+            'orientation': vec[QUAT],
+            'control_surfaces': control_surfaces,
+            'propulsion': propulsion,
+            'health': float(vec[HEALTH])
+        }
         
     async def _update_digital_model(self, physical_state: Dict[str, Any]) -> None:
         """Update UAV digital model with physical state"""
-        self.current_state = {
-            'position': physical_state.get('position', np.zeros(3)),
-            'velocity': physical_state.get('velocity', np.zeros(3)),
-            'orientation': physical_state.get('orientation', np.array([1, 0, 0, 0])),
-            'control_surfaces': physical_state.get('control_surfaces', {}),
-            'propulsion': physical_state.get('propulsion', {}),
-            'health': physical_state.get('health', 1.0)
-        }
+        state = self._state
+        state[POS] = physical_state.get('position', _ZERO3)
+        state[VEL] = physical_state.get('velocity', _ZERO3)
+        state[QUAT] = physical_state.get('orientation', _IDENT_Q)
+        state[HEALTH] = physical_state.get('health', 1.0)
+        self._omega[:] = physical_state.get('angular_velocity', _ZERO3)
+        self._control_surfaces = physical_state.get('control_surfaces', {})
+        self._propulsion = physical_state.get('propulsion', {})
+        
+        # Rebuilt on next read rather than written in place, so handed-out arrays stay stable
+        self._propulsion_health = None
         
         # Update models if needed
         if 'aero_params' in physical_state:
@@ -31,31 +114,52 @@ class UAVDigitalTwin(DigitalTwin):
             data=self.current_state
         ))
         
-    async def predict_state(self, delta_time: float) -> Dict[str, Any]:
-        """Predict UAV state after delta_time"""
-        # Calculate aerodynamic forces
+    def predict_state_into(self, out: np.ndarray, delta_time: float) -> np.ndarray:
+        """
+        Predict the packed UAV state after delta_time into a caller buffer
+        
+        Args:
+            out: Float32 buffer of length STATE_SIZE, overwritten in place
+            delta_time: Prediction horizon in seconds
+            
+        Returns:
+            The out buffer
+        """
+        state = self._state
+        
+        # Calculate aerodynamic and propulsion forces
         aero_forces = self.aero_model.calculate_forces(
-            self.current_state['velocity'],
-            self.current_state['orientation'],
-            self.current_state['control_surfaces']
+            state[VEL],
+            state[QUAT],
+            self._control_surfaces
         )
+        prop_forces = self.prop_model.calculate_thrust(self._propulsion)
         
-        # Calculate propulsion forces
-        prop_forces = self.prop_model.calculate_thrust(
-            self.current_state['propulsion']
+        # Integrate one step
+        _predict_kinematics(
+            state[POS], state[VEL],
+            np.asarray(aero_forces, dtype=np.float32),
+            np.asarray(prop_forces, dtype=np.float32),
+            delta_time,
+            out[POS], out[VEL], state[ACCEL]
         )
+        self._predict_orientation(delta_time, out[QUAT])
+        out[HEALTH] = max(0.0, state[HEALTH] - 0.001 * delta_time)
+        out[ACCEL] = state[ACCEL]
+        return out
         
-        # Predict new state
-        predicted = {
-            'position': self.current_state['position'] + self.current_state['velocity'] * delta_time,
-            'velocity': self.current_state['velocity'] + (aero_forces + prop_forces) * delta_time,
-            'orientation': self._predict_orientation(delta_time),
-            'control_surfaces': self.current_state['control_surfaces'],
-            'propulsion': self.prop_model.predict_state(
-                self.current_state['propulsion'],
-                delta_time
-            ),
-            'health': max(0, self.current_state['health'] - 0.001 * delta_time)
-        }
+    def _predict_orientation(self, delta_time: float, out: np.ndarray) -> np.ndarray:
+        """Propagate the orientation quaternion by the latest body rates"""
+        _predict_quat(self._state[QUAT], self._omega, delta_time, out)
+        return out
+        
+    async def predict_state(self, delta_time: float) -> Dict[str, Any]:
+        """Predict UAV state after delta_time"""
+        predicted = self.predict_state_into(self._predicted, delta_time)
         
-        return predicted
\ No newline at end of file
+        # Results outlive the scratch buffer, so hand out a single copy
+        return self._state_dict(
+            predicted.copy(),
+            self._control_surfaces,
+            self.prop_model.predict_state(self._propulsion, delta_time)
+        )
\ No newline at end of file
@@ -5,7 +5,7 @@ This module provides the main controller for terrain and environment modeling
 in the XY-28C-Sentinel system.
 """
 
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Dict, List, Tuple, Optional, Any, Callable
 import asyncio
 import numpy as np
 from ..system.system_controller import SystemController
@@ -28,6 +28,15 @@ class EnvironmentController:
         self.terrain_model = None
         self.environment_model = EnvironmentModel()
         
+        # Terrain-dependent effectiveness multipliers per sensor type
+        self._terrain_mods: Dict[str, Callable[[TerrainModel, float, float], float]] = {
+            # These sensors affected by radar reflectivity
+            "lidar": lambda terrain, x, y: 0.5 + 0.5 * terrain.get_radar_reflectivity(x, y),
+            "rangefinder": lambda terrain, x, y: 0.5 + 0.5 * terrain.get_radar_reflectivity(x, y),
+            # Quantum sensors affected by terrain density
+            "quantum_magnetic": lambda terrain, x, y: 0.7 + 0.3 * min(1.0, terrain.get_density(x, y) / 2000.0)
+        }
+        
     async def initialize(self, terrain_dimensions: Tuple[int, int], resolution: float = 1.0) -> bool:
         """
         Initialize environment controller
@@ -159,15 +168,14 @@ class EnvironmentController:
             return {}
             
         x, y = position
-        elevation = await self.terrain_model.get_elevation(x, y)
-        properties = await self.terrain_model.get_terrain_properties(x, y)
-        slope = await self.terrain_model.get_slope(x, y)
+        elevation = self.terrain_model.get_elevation(x, y)
+        slope = self.terrain_model.get_slope(x, y)
         
         return {
             "elevation": elevation,
             "slope": slope,
-            "friction": properties.friction_coefficient,
-            "radar_reflectivity": properties.radar_reflectivity
+            "friction": self.terrain_model.get_friction(x, y),
+            "radar_reflectivity": self.terrain_model.get_radar_reflectivity(x, y)
         }
     
     async def get_environment_info(self) -> Dict[str, Any]:
@@ -203,7 +211,23 @@ class EnvironmentController:
         if self.terrain_model is None:
             return True
             
-        return await self.terrain_model.calculate_line_of_sight(start, end)
+        return self.terrain_model.calculate_line_of_sight(start, end)
+    
+    async def check_line_of_sight_batch(self, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+        """
+        Check line of sight for many point pairs in one call
+        
+        Args:
+            starts: Starting points, shape (R, 3)
+            ends: Ending points, shape (R, 3)
+            
+        Returns:
+            Boolean array of shape (R,), True where line of sight exists
+        """
+        if self.terrain_model is None:
+            return np.ones(len(starts), dtype=bool)
+            
+        return self.terrain_model.calculate_line_of_sight_batch(starts, ends)
     
     async def get_sensor_effectiveness(self, sensor_type: str, 
                                      position: Tuple[float, float]) -> float:
@@ -218,24 +242,11 @@ class EnvironmentController:
             Effectiveness factor (0-1 scale)
         """
         # Get base effectiveness from environment
-        base_effectiveness = await self.environment_model.get_sensor_effectiveness(sensor_type)
+        base_effectiveness = self.environment_model.get_sensor_effectiveness(sensor_type)
         
         # Modify based on terrain if needed
-        if self.terrain_model is not None:
-            properties = await self.terrain_model.get_terrain_properties(*position)
+        modifier = self._terrain_mods.get(sensor_type)
+        if modifier is None or self.terrain_model is None:
+            return base_effectiveness
             
-            # Apply terrain-specific modifications
-            if sensor_type == "lidar" or sensor_type == "rangefinder":
-                # These sensors affected by radar reflectivity
-                return base_effectiveness * (0.5 + 0.5 * properties.radar_reflectivity)
-                
-            elif sensor_type == "quantum_magnetic":
-                # Quantum sensors affected by terrain density
-                density_factor = min(1.0, properties.density / 2000.0)
-                return base_effectiveness * (0.7 + 0.3 * density_factor)
-                
-            elif sensor_type == "hyperspectral":
-                # Hyperspectral affected by terrain type
-                return base_effectiveness
-        
-        return base_effectiveness
\ No newline at end of file
+        return base_effectiveness * modifier(self.terrain_model, *position)
\ No newline at end of file
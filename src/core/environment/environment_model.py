@@ -7,10 +7,22 @@ This module provides environmental conditions modeling for the XY-28C-Sentinel s
 from dataclasses import dataclass
 from enum import Enum
 from typing import Dict, List, Tuple, Optional, Any
+from functools import lru_cache
+import math
 import numpy as np
 import asyncio
 from datetime import datetime, time
 
+@lru_cache(maxsize=64)
+def _freq_terms(frequency_mhz: float) -> Tuple[float, float, float]:
+    """Frequency-dependent FSPL constant, rain factor and fog factor"""
+    fspl_const = 20 * math.log10(frequency_mhz) + 32.44
+    # Rain attenuation increases with frequency
+    rain_factor = 0.01 * (frequency_mhz / 1000.0)**2
+    # Fog attenuation for high frequencies (above 10 GHz)
+    fog_factor = 0.5 * (frequency_mhz / 10000.0) if frequency_mhz > 10000 else 0.0
+    return fspl_const, rain_factor, fog_factor
+
 class WeatherCondition(Enum):
     """Weather condition types"""
     CLEAR = "clear"
@@ -27,7 +39,7 @@ class TimeOfDay(Enum):
     DUSK = "dusk"
     NIGHT = "night"
 
-@dataclass
+@dataclass(slots=True)
 class AtmosphericConditions:
     """Atmospheric conditions data"""
     temperature: float = 20.0  # Celsius
@@ -39,6 +51,44 @@ class AtmosphericConditions:
     visibility: float = 10000.0  # meters
     cloud_cover: float = 0.0  # 0-1 scale
 
+# Atmospheric fields set by each weather condition; unlisted fields are left as-is
+_WEATHER_TABLE: Dict[WeatherCondition, Dict[str, float]] = {
+    WeatherCondition.CLEAR: {
+        'cloud_cover': 0.1,
+        'visibility': 10000.0,
+        'precipitation': 0.0
+    },
+    WeatherCondition.CLOUDY: {
+        'cloud_cover': 0.7,
+        'visibility': 5000.0,
+        'precipitation': 0.0
+    },
+    WeatherCondition.RAIN: {
+        'cloud_cover': 0.9,
+        'visibility': 2000.0,
+        'precipitation': 5.0,
+        'humidity': 0.9
+    },
+    WeatherCondition.SNOW: {
+        'cloud_cover': 0.8,
+        'visibility': 1000.0,
+        'precipitation': 3.0,
+        'temperature': -2.0
+    },
+    WeatherCondition.FOG: {
+        'cloud_cover': 0.5,
+        'visibility': 200.0,
+        'humidity': 0.95
+    },
+    WeatherCondition.STORM: {
+        'cloud_cover': 1.0,
+        'visibility': 500.0,
+        'precipitation': 20.0,
+        'wind_speed': 15.0,
+        'humidity': 0.9
+    }
+}
+
 class EnvironmentModel:
     """Environment model for XY-28C-Sentinel"""
     
@@ -49,57 +99,28 @@ class EnvironmentModel:
         self.atmospheric = AtmosphericConditions()
         self.light_level = 1.0  # 0-1 scale
         self.em_interference = 0.0  # 0-1 scale
+        self._sensor_effectiveness: Dict[str, float] = {}
+        self._recompute_sensor_effectiveness()
         
     async def update_weather(self, condition: WeatherCondition) -> None:
         """Update weather condition and related atmospheric properties"""
         self.weather = condition
         
         # Update atmospheric conditions based on weather
-        if condition == WeatherCondition.CLEAR:
-            self.atmospheric.cloud_cover = 0.1
-            self.atmospheric.visibility = 10000.0
-            self.atmospheric.precipitation = 0.0
-            
-        elif condition == WeatherCondition.CLOUDY:
-            self.atmospheric.cloud_cover = 0.7
-            self.atmospheric.visibility = 5000.0
-            self.atmospheric.precipitation = 0.0
-            
-        elif condition == WeatherCondition.RAIN:
-            self.atmospheric.cloud_cover = 0.9
-            self.atmospheric.visibility = 2000.0
-            self.atmospheric.precipitation = 5.0
-            self.atmospheric.humidity = 0.9
-            
-        elif condition == WeatherCondition.SNOW:
-            self.atmospheric.cloud_cover = 0.8
-            self.atmospheric.visibility = 1000.0
-            self.atmospheric.precipitation = 3.0
-            self.atmospheric.temperature = -2.0
-            
-        elif condition == WeatherCondition.FOG:
-            self.atmospheric.cloud_cover = 0.5
-            self.atmospheric.visibility = 200.0
-            self.atmospheric.humidity = 0.95
-            
-        elif condition == WeatherCondition.STORM:
-            self.atmospheric.cloud_cover = 1.0
-            self.atmospheric.visibility = 500.0
-            self.atmospheric.precipitation = 20.0
-            self.atmospheric.wind_speed = 15.0
-            self.atmospheric.humidity = 0.9
-            
+        for field_name, value in _WEATHER_TABLE[condition].items():
+            setattr(self.atmospheric, field_name, value)
+        
         # Update light level based on weather and time of day
-        await self._update_light_level()
+        self._update_light_level()
     
     async def update_time_of_day(self, time_of_day: TimeOfDay) -> None:
         """Update time of day and related properties"""
         self.time_of_day = time_of_day
         
         # Update light level based on time of day
-        await self._update_light_level()
+        self._update_light_level()
     
-    async def _update_light_level(self) -> None:
+    def _update_light_level(self) -> None:
         """Update light level based on weather and time of day"""
         # Base light level from time of day
         if self.time_of_day == TimeOfDay.DAY:
@@ -123,46 +144,49 @@ class EnvironmentModel:
             weather_factor = 0.3
             
         self.light_level = base_light * weather_factor
+        self._recompute_sensor_effectiveness()
     
-    async def get_sensor_effectiveness(self, sensor_type: str) -> float:
+    def _recompute_sensor_effectiveness(self) -> None:
         """
-        Calculate sensor effectiveness based on environmental conditions
+        Recompute the per-sensor effectiveness table
         
-        Args:
-            sensor_type: Type of sensor (e.g., "lidar", "quantum_magnetic", "hyperspectral")
-            
-        Returns:
-            Effectiveness factor (0-1 scale)
+        Must be called whenever weather, light level or EM interference
+        changes.
         """
-        if sensor_type == "lidar":
+        atmospheric = self.atmospheric
+        self._sensor_effectiveness = {
             # LIDAR affected by precipitation and fog
-            return max(0.1, 1.0 - (self.atmospheric.precipitation / 20.0) - 
-                      (10000.0 - min(10000.0, self.atmospheric.visibility)) / 10000.0)
-                      
-        elif sensor_type == "quantum_magnetic":
+            "lidar": max(0.1, 1.0 - (atmospheric.precipitation / 20.0) - 
+                         (10000.0 - min(10000.0, atmospheric.visibility)) / 10000.0),
             # Quantum magnetic sensors affected by EM interference
-            return max(0.2, 1.0 - self.em_interference)
-            
-        elif sensor_type == "hyperspectral":
+            "quantum_magnetic": max(0.2, 1.0 - self.em_interference),
             # Hyperspectral affected by light level and cloud cover
-            return max(0.1, self.light_level * (1.0 - self.atmospheric.cloud_cover * 0.5))
-            
-        elif sensor_type == "rangefinder":
+            "hyperspectral": max(0.1, self.light_level * (1.0 - atmospheric.cloud_cover * 0.5)),
             # Rangefinder affected by precipitation
-            return max(0.3, 1.0 - (self.atmospheric.precipitation / 30.0))
-            
-        elif sensor_type == "video":
+            "rangefinder": max(0.3, 1.0 - (atmospheric.precipitation / 30.0)),
             # Video affected by light level and visibility
-            return max(0.1, self.light_level * 
-                      (self.atmospheric.visibility / 10000.0))
-                      
-        return 1.0  # Default for unknown sensor types
+            "video": max(0.1, self.light_level * 
+                         (atmospheric.visibility / 10000.0))
+        }
+    
+    def get_sensor_effectiveness(self, sensor_type: str) -> float:
+        """
+        Get sensor effectiveness under current environmental conditions
+        
+        Args:
+            sensor_type: Type of sensor (e.g., "lidar", "quantum_magnetic", "hyperspectral")
+            
+        Returns:
+            Effectiveness factor (0-1 scale), 1.0 for unknown sensor types
+        """
+        return self._sensor_effectiveness.get(sensor_type, 1.0)
     
-    async def set_em_interference(self, level: float) -> None:
+    def set_em_interference(self, level: float) -> None:
         """Set electromagnetic interference level (0-1 scale)"""
         self.em_interference = max(0.0, min(1.0, level))
+        self._recompute_sensor_effectiveness()
     
-    async def calculate_signal_attenuation(self, frequency_mhz: float, distance_km: float) -> float:
+    def calculate_signal_attenuation(self, frequency_mhz: float, distance_km: float) -> float:
         """
         Calculate signal attenuation based on environmental conditions
         
@@ -173,21 +197,19 @@ class EnvironmentModel:
         Returns:
             Attenuation in dB
         """
-        # Free space path loss
-        fspl = 20 * np.log10(distance_km) + 20 * np.log10(frequency_mhz) + 32.44
+        fspl_const, rain_factor, fog_factor = _freq_terms(frequency_mhz)
+        
+        # Free space path loss; co-located endpoints lose nothing
+        fspl = 20 * math.log10(distance_km) + fspl_const if distance_km > 0 else 0.0
         
         # Additional attenuation from weather
         weather_attenuation = 0.0
         
         if self.weather == WeatherCondition.RAIN:
-            # Rain attenuation increases with frequency
-            rain_factor = 0.01 * (frequency_mhz / 1000.0)**2
             weather_attenuation = rain_factor * self.atmospheric.precipitation * distance_km
             
         elif self.weather == WeatherCondition.FOG:
-            # Fog attenuation for high frequencies
-            if frequency_mhz > 10000:  # Above 10 GHz
-                fog_factor = 0.5 * (frequency_mhz / 10000.0)
+            if fog_factor > 0.0:
                 visibility_km = self.atmospheric.visibility / 1000.0
                 weather_attenuation = fog_factor * (10.0 / visibility_km) * distance_km
                 
@@ -7,9 +7,138 @@ This module provides terrain representation and analysis capabilities for the XY
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Dict, List, Tuple, Optional, Any
+import math
 import numpy as np
 import asyncio
 
+try:
+    from numba import njit
+except ImportError:
+    # Fall back to plain Python when Numba is unavailable
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+@njit(cache=True, fastmath=True)
+def _bilinear(elev: np.ndarray, gx: float, gy: float, W: int, H: int) -> float:
+    """Bilinear interpolation at grid coordinates (gx, gy), clamped to the grid"""
+    # Clamp before splitting so off-grid points take the edge value, not an extrapolation
+    gx = min(max(gx, 0.0), W - 1.0)
+    gy = min(max(gy, 0.0), H - 1.0)
+    x0 = int(gx)
+    y0 = int(gy)
+    x1 = min(x0 + 1, W - 1)
+    y1 = min(y0 + 1, H - 1)
+    dx = gx - x0
+    dy = gy - y0
+    return (1 - dx) * (1 - dy) * elev[x0, y0] + \
+           dx * (1 - dy) * elev[x1, y0] + \
+           (1 - dx) * dy * elev[x0, y1] + \
+           dx * dy * elev[x1, y1]
+
+@njit(cache=True)
+def _to_grid(v: float, res: float, inv_res: float) -> float:
+    """World coordinate to grid coordinate, multiplying when inv_res is exact"""
+    if inv_res > 0.0:
+        return v * inv_res
+    return v / res
+
+# Number of coarse levels in the max-elevation pyramid (2x .. 16x)
+_PYRAMID_LEVELS = 4
+
+@njit(cache=True)
+def _pyramid_max(level: int, bx: int, by: int, p0: np.ndarray, p1: np.ndarray,
+                 p2: np.ndarray, p3: np.ndarray, p4: np.ndarray) -> float:
+    """Max elevation of block (bx, by) at the given pyramid level"""
+    if level == 0:
+        return p0[bx, by]
+    elif level == 1:
+        return p1[bx, by]
+    elif level == 2:
+        return p2[bx, by]
+    elif level == 3:
+        return p3[bx, by]
+    return p4[bx, by]
+
+@njit(cache=True)
+def _los_kernel(elev: np.ndarray, p0: np.ndarray, p1: np.ndarray, p2: np.ndarray,
+                p3: np.ndarray, p4: np.ndarray, sx: float, sy: float, sz: float,
+                ex: float, ey: float, ez: float, res: float, inv_res: float,
+                W: int, H: int) -> bool:
+    """
+    March a ray over the elevation grid, stopping at the first blocked sample
+    
+    Runs of samples whose lowest ray height clears the max elevation of the
+    pyramid block they fall in are skipped without interpolation. Samples
+    are the same as a plain march at half-cell spacing, so the result is too.
+    
+    inv_res is 1/res when that reciprocal is exact (power-of-two resolution)
+    and 0.0 otherwise.
+    """
+    dx = ex - sx
+    dy = ey - sy
+    dz = ez - sz
+    distance = math.sqrt(dx*dx + dy*dy + dz*dz)
+    num_samples = int(distance / (res * 0.5))
+    
+    i = 1
+    start_level = _PYRAMID_LEVELS
+    while i < num_samples:
+        t = i / num_samples
+        gx = _to_grid(sx + t * dx, res, inv_res)
+        gy = _to_grid(sy + t * dy, res, inv_res)
+        x0 = min(max(int(gx), 0), W - 1)
+        y0 = min(max(int(gy), 0), H - 1)
+        z = sz + t * dz
+        
+        skipped = False
+        for level in range(start_level, -1, -1):
+            bx = x0 >> level
+            by = y0 >> level
+            lo_x = bx << level
+            lo_y = by << level
+            hi_x = min((bx + 1) << level, W) - 1
+            hi_y = min((by + 1) << level, H) - 1
+            
+            # Parameter at which the ray leaves the block (clamped edges never exit)
+            t_exit = np.inf
+            if dx > 0 and hi_x < W - 1:
+                t_exit = min(t_exit, ((hi_x + 1) * res - sx) / dx)
+            elif dx < 0 and lo_x > 0:
+                t_exit = min(t_exit, (lo_x * res - sx) / dx)
+            if dy > 0 and hi_y < H - 1:
+                t_exit = min(t_exit, ((hi_y + 1) * res - sy) / dy)
+            elif dy < 0 and lo_y > 0:
+                t_exit = min(t_exit, (lo_y * res - sy) / dy)
+                
+            j = num_samples - 1
+            if t_exit * num_samples < j:
+                j = max(i, int(t_exit * num_samples))
+                
+            # Back off until the last sample is provably inside the block
+            while j > i:
+                tj = j / num_samples
+                xj = min(max(int(_to_grid(sx + tj * dx, res, inv_res)), 0), W - 1)
+                yj = min(max(int(_to_grid(sy + tj * dy, res, inv_res)), 0), H - 1)
+                if (xj >> level) == bx and (yj >> level) == by:
+                    break
+                j -= 1
+                
+            z_min = min(z, sz + (j / num_samples) * dz)
+            if z_min > _pyramid_max(level, bx, by, p0, p1, p2, p3, p4):
+                i = j + 1
+                start_level = min(level + 1, _PYRAMID_LEVELS)
+                skipped = True
+                break
+                
+        if not skipped:
+            if z < _bilinear(elev, gx, gy, W, H):
+                return False
+            i += 1
+            start_level = 0
+    return True
+
 class TerrainType(Enum):
     """Types of terrain surfaces"""
     FLAT = "flat"
@@ -20,7 +149,7 @@ class TerrainType(Enum):
     WATER = "water"
     CUSTOM = "custom"
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TerrainProperties:
     """Physical properties of terrain"""
     friction_coefficient: float = 0.5
@@ -47,6 +176,25 @@ class TerrainProperties:
         else:
             return cls()
 
+# Canonical immutable property instances, shared by all terrain models
+_DEFAULT_PROPERTIES = {
+    terrain_type.value: TerrainProperties.for_terrain_type(terrain_type)
+    for terrain_type in TerrainType
+}
+
+# Compact per-cell encoding of TerrainType for the terrain grid
+TERRAIN_CODES = {terrain_type: code for code, terrain_type in enumerate(TerrainType)}
+_TYPES_BY_CODE = tuple(TerrainType)
+
+# Field layout of the per-code property table
+_PROPERTY_DTYPE = np.dtype([
+    ('friction', 'f4'),
+    ('reflect', 'f4'),
+    ('thermal', 'f4'),
+    ('density', 'f4'),
+    ('em_abs', 'f4')
+])
+
 class TerrainModel:
     """Terrain model for XY-28C-Sentinel"""
     
@@ -60,62 +208,187 @@ class TerrainModel:
         """
         self.dimensions = dimensions
         self.resolution = resolution
-        self.elevation_data = np.zeros(dimensions)
-        self.terrain_types = np.full(dimensions, TerrainType.FLAT.value)
-        self.properties_map = {}
+        
+        # Power-of-two resolutions (..., 0.5, 1, 2, 4, ...) have an exact
+        # reciprocal, so grid conversion can multiply instead of divide
+        # with bit-identical results. Other resolutions keep the division.
+        self._fast_idx = resolution > 0 and math.frexp(resolution)[0] == 0.5
+        self._inv_res = 1.0 / resolution if self._fast_idx else 0.0
+        # Elevation grid is always C-contiguous float32 (see load_elevation_data)
+        self.elevation_data = np.zeros(dimensions, dtype=np.float32)
+        # Terrain grid holds TERRAIN_CODES ordinals
+        self.terrain_types = np.full(dimensions, TERRAIN_CODES[TerrainType.FLAT], dtype=np.int8)
         
         # Initialize default properties for each terrain type
-        for terrain_type in TerrainType:
-            self.properties_map[terrain_type.value] = TerrainProperties.for_terrain_type(terrain_type)
+        self.properties_map = dict(_DEFAULT_PROPERTIES)
+            
+        self._rebuild_derived()
+        self._rebuild_property_maps()
     
     async def load_elevation_data(self, data: np.ndarray) -> bool:
-        """Load elevation data into the model"""
+        """
+        Load elevation data into the model
+        
+        The data is stored as a C-contiguous float32 array, copying only
+        when the input dtype or memory layout differs.
+        
+        Args:
+            data: Elevation grid matching the model dimensions
+            
+        Returns:
+            Success status
+        """
         if data.shape != self.dimensions:
             return False
         
-        self.elevation_data = data
+        self.elevation_data = np.ascontiguousarray(data, dtype=np.float32)
+        self._rebuild_derived()
         return True
     
-    async def set_terrain_type(self, x: int, y: int, terrain_type: TerrainType) -> None:
+    def _rebuild_derived(self) -> None:
+        """Recompute gradient and slope maps from the elevation grid"""
+        if min(self.elevation_data.shape) < 2:
+            self._gx = np.zeros(self.dimensions, dtype=np.float32)
+            self._gy = np.zeros(self.dimensions, dtype=np.float32)
+        else:
+            gx, gy = np.gradient(self.elevation_data, self.resolution)
+            self._gx = gx.astype(np.float32)
+            self._gy = gy.astype(np.float32)
+        self._slope_map = np.hypot(self._gx, self._gy)
+        
+        # Max-elevation pyramid for line-of-sight culling. Level 0 holds the
+        # max of each cell's bilinear support, level k the max over 2^k blocks.
+        padded = np.pad(self.elevation_data, ((0, 1), (0, 1)), mode='edge')
+        cell_max = np.maximum(
+            np.maximum(padded[:-1, :-1], padded[1:, :-1]),
+            np.maximum(padded[:-1, 1:], padded[1:, 1:])
+        )
+        pyramid = [np.ascontiguousarray(cell_max)]
+        for _ in range(_PYRAMID_LEVELS):
+            level = pyramid[-1]
+            h, w = level.shape
+            level = np.pad(level, ((0, h % 2), (0, w % 2)), mode='edge')
+            pyramid.append(np.ascontiguousarray(
+                level.reshape(level.shape[0] // 2, 2, level.shape[1] // 2, 2).max(axis=(1, 3))
+            ))
+        self._elev_max_pyramid = pyramid
+    
+    def _rebuild_property_maps(self) -> None:
+        """
+        Rebuild per-cell property arrays from the terrain type grid
+        
+        Must be called after properties_map is modified so the
+        per-code table and struct-of-arrays maps stay in sync.
+        """
+        self._props_by_code = np.array([
+            (props.friction_coefficient, props.radar_reflectivity,
+             props.thermal_conductivity, props.density, props.em_absorption)
+            for props in (self.properties_map[t.value] for t in _TYPES_BY_CODE)
+        ], dtype=_PROPERTY_DTYPE)
+        
+        codes = self.terrain_types
+        self._friction_map = self._props_by_code['friction'][codes]
+        self._reflectivity_map = self._props_by_code['reflect'][codes]
+        self._thermal_map = self._props_by_code['thermal'][codes]
+        self._density_map = self._props_by_code['density'][codes]
+        self._em_abs_map = self._props_by_code['em_abs'][codes]
+    
+    def _cell_index(self, x: float, y: float) -> Tuple[int, int]:
+        """Grid cell containing a world position, clamped to the grid"""
+        ix = max(0, min(int(x / self.resolution), self.dimensions[0] - 1))
+        iy = max(0, min(int(y / self.resolution), self.dimensions[1] - 1))
+        return ix, iy
+    
+    def set_terrain_type(self, x: int, y: int, terrain_type: TerrainType) -> None:
         """Set terrain type for a specific location"""
         if 0 <= x < self.dimensions[0] and 0 <= y < self.dimensions[1]:
-            self.terrain_types[x, y] = terrain_type.value
+            code = TERRAIN_CODES[terrain_type]
+            self.terrain_types[x, y] = code
+            
+            # Keep the per-cell property maps in sync
+            props = self._props_by_code[code]
+            self._friction_map[x, y] = props['friction']
+            self._reflectivity_map[x, y] = props['reflect']
+            self._thermal_map[x, y] = props['thermal']
+            self._density_map[x, y] = props['density']
+            self._em_abs_map[x, y] = props['em_abs']
     
-    async def get_elevation(self, x: float, y: float) -> float:
+    def get_elevation(self, x: float, y: float) -> float:
         """Get interpolated elevation at a specific location"""
+        return _bilinear(
+            self.elevation_data,
+            x / self.resolution,
+            y / self.resolution,
+            self.dimensions[0],
+            self.dimensions[1]
+        )
+    
+    def _get_elevation_vec(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """
+        Bilinear elevation lookup for arrays of world coordinates
+        
+        Args:
+            xs: X coordinates in meters
+            ys: Y coordinates in meters
+            
+        Returns:
+            Interpolated elevations, same shape as the inputs
+        """
         # Convert to grid coordinates
-        grid_x = x / self.resolution
-        grid_y = y / self.resolution
+        if self._fast_idx:
+            gx = np.asarray(xs, dtype=np.float64) * self._inv_res
+            gy = np.asarray(ys, dtype=np.float64) * self._inv_res
+        else:
+            gx = np.asarray(xs, dtype=np.float64) / self.resolution
+            gy = np.asarray(ys, dtype=np.float64) / self.resolution
         
-        # Bilinear interpolation
-        x0, y0 = int(grid_x), int(grid_y)
-        x1, y1 = min(x0 + 1, self.dimensions[0] - 1), min(y0 + 1, self.dimensions[1] - 1)
+        # Clamp to the grid before splitting so off-grid points take the edge value
+        width, height = self.dimensions
+        gx = np.clip(gx, 0.0, width - 1.0)
+        gy = np.clip(gy, 0.0, height - 1.0)
+        x0 = gx.astype(np.int32)
+        y0 = gy.astype(np.int32)
+        x1 = np.minimum(x0 + 1, width - 1)
+        y1 = np.minimum(y0 + 1, height - 1)
         
-        dx, dy = grid_x - x0, grid_y - y0
+        dx = gx - x0
+        dy = gy - y0
         
-        # Interpolate elevation
-        elevation = (1 - dx) * (1 - dy) * self.elevation_data[x0, y0] + \
-                    dx * (1 - dy) * self.elevation_data[x1, y0] + \
-                    (1 - dx) * dy * self.elevation_data[x0, y1] + \
-                    dx * dy * self.elevation_data[x1, y1]
-                    
-        return elevation
+        # Gather corner elevations and interpolate
+        elev = self.elevation_data
+        e00 = elev[x0, y0]
+        e10 = elev[x1, y0]
+        e01 = elev[x0, y1]
+        e11 = elev[x1, y1]
+        
+        return (1 - dx) * (1 - dy) * e00 + \
+               dx * (1 - dy) * e10 + \
+               (1 - dx) * dy * e01 + \
+               dx * dy * e11
     
-    async def get_terrain_properties(self, x: float, y: float) -> TerrainProperties:
+    def get_terrain_properties(self, x: float, y: float) -> TerrainProperties:
         """Get terrain properties at a specific location"""
-        # Convert to grid coordinates
-        grid_x = int(x / self.resolution)
-        grid_y = int(y / self.resolution)
-        
-        # Clamp to valid range
-        grid_x = max(0, min(grid_x, self.dimensions[0] - 1))
-        grid_y = max(0, min(grid_y, self.dimensions[1] - 1))
-        
-        terrain_type = self.terrain_types[grid_x, grid_y]
-        return self.properties_map[terrain_type]
+        code = self.terrain_types[self._cell_index(x, y)]
+        return self.properties_map[_TYPES_BY_CODE[code].value]
+    
+    def get_friction(self, x: float, y: float) -> float:
+        """Get friction coefficient at a specific location"""
+        return float(self._friction_map[self._cell_index(x, y)])
+    
+    def get_radar_reflectivity(self, x: float, y: float) -> float:
+        """Get radar reflectivity at a specific location"""
+        return float(self._reflectivity_map[self._cell_index(x, y)])
     
-    async def calculate_line_of_sight(self, start: Tuple[float, float, float], 
-                                    end: Tuple[float, float, float]) -> bool:
+    def get_density(self, x: float, y: float) -> float:
+        """Get terrain density at a specific location"""
+        return float(self._density_map[self._cell_index(x, y)])
+    
+    def get_em_absorption(self, x: float, y: float) -> float:
+        """Get electromagnetic absorption at a specific location"""
+        return float(self._em_abs_map[self._cell_index(x, y)])
+    
+    def calculate_line_of_sight(self, start: Tuple[float, float, float], 
+                                end: Tuple[float, float, float]) -> bool:
         """
         Calculate line of sight between two points
         
@@ -126,51 +399,57 @@ class TerrainModel:
         Returns:
             True if line of sight exists, False otherwise
         """
-        # Extract coordinates
         start_x, start_y, start_z = start
         end_x, end_y, end_z = end
         
-        # Calculate direction vector
-        dx = end_x - start_x
-        dy = end_y - start_y
-        dz = end_z - start_z
-        
-        # Calculate distance
-        distance = np.sqrt(dx**2 + dy**2 + dz**2)
+        return _los_kernel(
+            self.elevation_data,
+            *self._elev_max_pyramid,
+            float(start_x), float(start_y), float(start_z),
+            float(end_x), float(end_y), float(end_z),
+            float(self.resolution),
+            self._inv_res,
+            self.dimensions[0],
+            self.dimensions[1]
+        )
+    
+    def calculate_line_of_sight_batch(self, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+        """
+        Calculate line of sight for many rays at once
         
-        # Number of sample points
-        num_samples = int(distance / (self.resolution * 0.5))
+        Rays are sampled exactly as in calculate_line_of_sight, padded to
+        the longest ray and masked per ray.
         
-        # Check line of sight
-        for i in range(1, num_samples):
-            # Calculate sample point
-            t = i / num_samples
-            x = start_x + t * dx
-            y = start_y + t * dy
-            z = start_z + t * dz
-            
-            # Get elevation at sample point
-            elevation = await self.get_elevation(x, y)
+        Args:
+            starts: Starting points, shape (R, 3)
+            ends: Ending points, shape (R, 3)
             
-            # Check if sample point is below terrain
-            if z < elevation:
-                return False
-                
-        return True
-    
-    async def get_slope(self, x: float, y: float) -> float:
-        """Calculate terrain slope at a specific location"""
-        # Convert to grid coordinates
-        grid_x = int(x / self.resolution)
-        grid_y = int(y / self.resolution)
+        Returns:
+            Boolean array of shape (R,), True where line of sight exists
+        """
+        starts = np.asarray(starts, dtype=np.float64).reshape(-1, 3)
+        ends = np.asarray(ends, dtype=np.float64).reshape(-1, 3)
+        dirs = ends - starts
         
-        # Clamp to valid range
-        grid_x = max(0, min(grid_x, self.dimensions[0] - 2))
-        grid_y = max(0, min(grid_y, self.dimensions[1] - 2))
+        # Per-ray sample counts, matching the scalar ray march
+        distances = np.sqrt(np.einsum('ij,ij->i', dirs, dirs))
+        num_samples = (distances / (self.resolution * 0.5)).astype(np.int64)
+        max_samples = int(num_samples.max()) if len(num_samples) else 0
+        if max_samples < 2:
+            return np.ones(len(starts), dtype=bool)
         
-        # Calculate slope using central difference
-        dx = self.elevation_data[grid_x + 1, grid_y] - self.elevation_data[grid_x, grid_y]
-        dy = self.elevation_data[grid_x, grid_y + 1] - self.elevation_data[grid_x, grid_y]
+        # Sample parameters t = i / n for i in [1, n), padded to max_samples
+        steps = np.arange(1, max_samples, dtype=np.float64)[None, :]
+        valid = steps < num_samples[:, None]
+        t = steps / np.maximum(num_samples, 1)[:, None]
+        pts = starts[:, None, :] + t[:, :, None] * dirs[:, None, :]
         
-        # Calculate slope magnitude
-        return np.sqrt((dx / self.resolution)**2 + (dy / self.resolution)**2)
\ No newline at end of file
+        elev = self._get_elevation_vec(pts[:, :, 0], pts[:, :, 1])
+        blocked = (pts[:, :, 2] < elev) & valid
+        return ~np.any(blocked, axis=1)
+    
+    def get_slope(self, x: float, y: float) -> float:
+        """Calculate terrain slope at a specific location"""
+        ix = min(max(int(x / self.resolution), 0), self.dimensions[0] - 1)
+        iy = min(max(int(y / self.resolution), 0), self.dimensions[1] - 1)
+        return float(self._slope_map[ix, iy])
\ No newline at end of file
@@ -1,7 +1,9 @@
-from typing import Callable, Dict, List, Any
+from typing import Callable, Dict, List, Any, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 import asyncio
+import heapq
+import itertools
 import uuid
 
 @dataclass
@@ -12,22 +14,88 @@ class Event:
     source_id: str
     priority: int
 
+class PriorityEventQueue:
+    """Async event queue popping the highest priority first, FIFO within a priority"""
+    def __init__(self):
+        self._heap: List[tuple] = []
+        self._counter = itertools.count()
+        self._notify = asyncio.Event()
+        
+    def __len__(self) -> int:
+        return len(self._heap)
+        
+    def put_nowait(self, event: Any) -> None:
+        # Counter breaks ties so events themselves are never compared
+        priority = getattr(event, 'priority', 0)
+        heapq.heappush(self._heap, (-priority, next(self._counter), event))
+        self._notify.set()
+        
+    def put_many_nowait(self, events: List[Any]) -> None:
+        """Enqueue several events with a single wakeup"""
+        heap = self._heap
+        counter = self._counter
+        for event in events:
+            heapq.heappush(heap, (-getattr(event, 'priority', 0), next(counter), event))
+        if events:
+            self._notify.set()
+        
+    def empty(self) -> bool:
+        return not self._heap
+        
+    def get_nowait(self) -> Any:
+        return heapq.heappop(self._heap)[2]
+        
+    async def get(self) -> Any:
+        while not self._heap:
+            self._notify.clear()
+            await self._notify.wait()
+        return heapq.heappop(self._heap)[2]
+
 class EventManager:
     def __init__(self):
         self._subscribers: Dict[str, List[Callable]] = {}
-        self._event_queue = asyncio.Queue()
+        # Immutable snapshots of _subscribers read by the dispatch loop
+        self._subs_frozen: Dict[str, Tuple[Callable, ...]] = {}
+        self._event_queue = PriorityEventQueue()
         
     async def publish(self, event: Event) -> None:
-        await self._event_queue.put(event)
+        self._event_queue.put_nowait(event)
+        
+    def publish_nowait(self, event: Event) -> None:
+        """Publish from synchronous code without yielding to the event loop"""
+        self._event_queue.put_nowait(event)
+        
+    async def publish_many(self, events: List[Event]) -> None:
+        """Publish a burst of events, waking the dispatch loop once"""
+        self._event_queue.put_many_nowait(events)
         
     def subscribe(self, event_type: str, callback: Callable) -> None:
         if event_type not in self._subscribers:
             self._subscribers[event_type] = []
         self._subscribers[event_type].append(callback)
+        self._subs_frozen[event_type] = tuple(self._subscribers[event_type])
         
     async def process_events(self) -> None:
         while True:
-            event = await self._event_queue.get()
-            if event.event_type in self._subscribers:
-                for callback in self._subscribers[event.event_type]:
-                    await callback(event)
\ No newline at end of file
+            # Drain everything queued so far, in priority order
+            batch = [await self._event_queue.get()]
+            while not self._event_queue.empty():
+                batch.append(self._event_queue.get_nowait())
+                
+            # Group by type, keeping the order in which types first appear
+            by_type: Dict[str, List[Event]] = {}
+            for event in batch:
+                by_type.setdefault(event.event_type, []).append(event)
+                
+            for event_type, events in by_type.items():
+                callbacks = self._subs_frozen.get(event_type)
+                if callbacks:
+                    await self._dispatch_batch(callbacks, events)
+                
+    async def _dispatch_batch(self, callbacks: Tuple[Callable, ...], events: List[Event]) -> None:
+        """Deliver a batch of same-typed events to their subscribers concurrently"""
+        await asyncio.gather(*(
+            callback.on_batch(events) if hasattr(callback, 'on_batch')
+            else asyncio.gather(*(callback(event) for event in events))
+            for callback in callbacks
+        ))
\ No newline at end of file
@@ -75,6 +75,7 @@ class SystemEventType(Enum):
     MISSION_PLAN_GENERATED = auto()
     MISSION_REHEARSAL_STARTED = auto()
     MISSION_REHEARSAL_COMPLETE = auto()
+    MISSION_TRANSACTION_QUEUED = auto()
     AFTER_ACTION_ANALYSIS_STARTED = auto()
     AFTER_ACTION_ANALYSIS_COMPLETE = auto()
     FIELD_DIAGNOSTICS_STARTED = auto()
@@ -1,6 +1,7 @@
 import numpy as np
+from bisect import bisect_left
 from enum import Enum
-from typing import Dict, List
+from typing import Callable, Dict, List, Optional
 from dataclasses import dataclass
 from ..physics.models.electronic_vulnerability import ElectronicSystemType
 
@@ -10,6 +11,14 @@ class AttackPriority(Enum):
     MEDIUM = 2
     LOW = 1
 
+# Score thresholds separating LOW | MEDIUM | HIGH | CRITICAL (upper-inclusive)
+_PRIORITY_THRESHOLDS = np.array([0.4, 0.6, 0.8])
+_PRIORITY_LEVELS = (AttackPriority.LOW, AttackPriority.MEDIUM, AttackPriority.HIGH, AttackPriority.CRITICAL)
+_PRIORITY_THRESHOLD_LIST = _PRIORITY_THRESHOLDS.tolist()
+
+# Batches up to this size are scored in pure Python, below NumPy's setup cost
+_SCALAR_BATCH_LIMIT = 8
+
 @dataclass
 class TargetVulnerability:
     system_type: ElectronicSystemType
@@ -25,41 +34,91 @@ class ElectronicAttackPrioritizer:
             'threat_level': 0.3
         }
         
-    def prioritize_targets(self, targets: List[TargetVulnerability]) -> List[Dict]:
-        """Prioritize electronic attack targets based on multiple factors"""
-        prioritized = []
+    @property
+    def weights(self) -> Dict[str, float]:
+        """Composite score weights (a copy; assign to change them)"""
+        return dict(self._weights)
+        
+    @weights.setter
+    def weights(self, weights: Dict[str, float]) -> None:
+        self._weights = dict(weights)
+        self._weight_vec = np.array([
+            self._weights['vulnerability'],
+            self._weights['strategic_value'],
+            self._weights['threat_level']
+        ])
+        self._scorer = self._compile_scorer()
+        
+    def _compile_scorer(self) -> Callable[[TargetVulnerability], float]:
+        """Build a scalar scoring function with the current weights bound as constants"""
+        wv = float(self._weights['vulnerability'])
+        wsv = float(self._weights['strategic_value'])
+        wtl = float(self._weights['threat_level'])
         
-        for target in targets:
-            # Calculate composite score
-            score = self._calculate_composite_score(target)
+        def score(target: TargetVulnerability) -> float:
+            return wv * target.vulnerability_score + wsv * target.strategic_value + wtl * target.threat_level
             
-            # Determine priority level
-            priority = self._determine_priority_level(score)
+        return score
+        
+    def prioritize_targets(self, targets: List[TargetVulnerability],
+                           top_k: Optional[int] = None) -> List[Dict]:
+        """
+        Prioritize electronic attack targets based on multiple factors
+        
+        Args:
+            targets: Candidate targets
+            top_k: Only return the K highest scoring targets
             
-            prioritized.append({
-                'target': target,
-                'score': score,
-                'priority': priority
-            })
+        Returns:
+            Targets with score and priority, highest score first
+        """
+        if not targets:
+            return []
+            
+        if len(targets) <= _SCALAR_BATCH_LIMIT:
+            return self._prioritize_small(targets, top_k)
             
-        # Sort by priority (highest first)
-        prioritized.sort(key=lambda x: x['score'], reverse=True)
-        return prioritized
+        # Factor matrix, one row per target
+        factors = np.fromiter(
+            (value for target in targets for value in (
+                target.vulnerability_score,
+                target.strategic_value,
+                target.threat_level
+            )),
+            dtype=np.float64,
+            count=3 * len(targets)
+        ).reshape(-1, 3)
+        
+        # Composite scores and priority levels for all targets at once
+        scores = factors @ self._weight_vec
+        levels = np.digitize(scores, _PRIORITY_THRESHOLDS, right=True)
+        
+        # Sort by score (highest first), ties keep input order
+        order = np.argsort(-scores, kind='stable')[:top_k]
         
-    def _calculate_composite_score(self, target: TargetVulnerability) -> float:
-        """Calculate weighted composite score"""
-        return (
-            self.weights['vulnerability'] * target.vulnerability_score +
-            self.weights['strategic_value'] * target.strategic_value +
-            self.weights['threat_level'] * target.threat_level
-        )
+        return [
+            {
+                'target': targets[i],
+                'score': float(scores[i]),
+                'priority': _PRIORITY_LEVELS[levels[i]]
+            }
+            for i in order
+        ]
         
-    def _determine_priority_level(self, score: float) -> AttackPriority:
-        """Convert score to priority level"""
-        if score > 0.8:
-            return AttackPriority.CRITICAL
-        elif score > 0.6:
-            return AttackPriority.HIGH
-        elif score > 0.4:
-            return AttackPriority.MEDIUM
-        return AttackPriority.LOW
\ No newline at end of file
+    def _prioritize_small(self, targets: List[TargetVulnerability],
+                          top_k: Optional[int]) -> List[Dict]:
+        """Scalar path for small batches, same ordering as prioritize_targets"""
+        scorer = self._scorer
+        scored = sorted(
+            ((scorer(target), target) for target in targets),
+            key=lambda item: -item[0]
+        )[:top_k]
+        
+        return [
+            {
+                'target': target,
+                'score': score,
+                'priority': _PRIORITY_LEVELS[bisect_left(_PRIORITY_THRESHOLD_LIST, score)]
+            }
+            for score, target in scored
+        ]
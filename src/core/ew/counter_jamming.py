@@ -1,42 +1,56 @@
+import math
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+@dataclass(slots=True)
+class JammingAnalysis:
+    jamming_type: str
+    confidence: float
+    affected_bands: List = field(default_factory=list)
+
 class CounterJammingSystem:
     def __init__(self, secure_comms: SecureCommunication, em_sensor: EMSensor):
         self.secure_comms = secure_comms
         self.em_sensor = em_sensor
         self.jamming_threshold = 0.7  # Detection confidence threshold
         
-    async def analyze_jamming(self, spectrum: np.ndarray) -> Dict:
-        """Analyze spectrum for jamming patterns"""
-        analysis = {
-            'jamming_detected': False,
-            'jamming_type': None,
-            'confidence': 0.0,
-            'affected_bands': []
-        }
+        # Mean power above which jamming is suspected, kept in step with the sensor
+        self._noise_floor_limit = em_sensor.jamming_effects['noise_floor'] + 20
+        em_sensor.add_noise_floor_listener(self._on_noise_floor_changed)
         
-        # Calculate power statistics
-        mean_power = np.mean(spectrum)
-        std_power = np.std(spectrum)
+    def _on_noise_floor_changed(self, noise_floor: float) -> None:
+        self._noise_floor_limit = noise_floor + 20
+        
+    async def analyze_jamming(self, spectrum: np.ndarray) -> Optional[JammingAnalysis]:
+        """
+        Analyze spectrum for jamming patterns
+        
+        Returns:
+            Analysis of the detected jamming, or None if no jamming is detected
+        """
+        # Calculate power statistics from one sum and one dot product
+        n = spectrum.size
+        mean_power = spectrum.sum() / n
+        variance = float(spectrum @ spectrum) / n - mean_power * mean_power
+        std_power = math.sqrt(max(variance, 0.0))
         
         # Detect abnormal power levels
-        if std_power > 15 or mean_power > self.em_sensor.jamming_effects['noise_floor'] + 20:
-            analysis['jamming_detected'] = True
-            analysis['confidence'] = min(1.0, (std_power / 20) * (mean_power / -50))
+        if std_power <= 15 and mean_power <= self._noise_floor_limit:
+            return None
             
-            if std_power > 20:
-                analysis['jamming_type'] = 'NOISE'
-            else:
-                analysis['jamming_type'] = 'SPOT'
-                
-        return analysis
+        return JammingAnalysis(
+            jamming_type='NOISE' if std_power > 20 else 'SPOT',
+            confidence=min(1.0, (std_power / 20) * (mean_power / -50))
+        )
         
-    async def activate_countermeasures(self, analysis: Dict) -> None:
+    async def activate_countermeasures(self, analysis: Optional[JammingAnalysis]) -> None:
         """Activate appropriate countermeasures based on jamming analysis"""
-        if not analysis['jamming_detected']:
+        if analysis is None:
             return
             
-        if analysis['jamming_type'] == 'NOISE':
+        if analysis.jamming_type == 'NOISE':
             await self._handle_noise_jamming()
-        elif analysis['jamming_type'] == 'SPOT':
+        elif analysis.jamming_type == 'SPOT':
             await self._handle_spot_jamming()
             
     async def _handle_noise_jamming(self) -> None:
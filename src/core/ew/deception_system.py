@@ -1,6 +1,8 @@
 from enum import Enum, auto
+import asyncio
+import heapq
 import numpy as np
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass
 from ..events.event_manager import EventManager
 
@@ -20,9 +22,23 @@ class DeceptionPattern:
 class DeceptionSystem:
     def __init__(self, uav_system):
         self.uav = uav_system
-        self.active_patterns: List[DeceptionPattern] = []
+        self.max_active_patterns = 16
         self.deception_library = self._load_deception_library()
         
+        # Min-heap of (priority, expiry, id, pattern); the root is evicted first
+        self._active_heap: List[Tuple[int, float, int, DeceptionPattern]] = []
+        self._active_ids: Set[int] = set()
+        
+        # Min-heap of (expiry, id, pattern); entries evicted early are skipped when popped
+        self._expiry_heap: List[Tuple[float, int, DeceptionPattern]] = []
+        self._expiry_wakeup = asyncio.Event()
+        self._expiry_task = None
+        
+    @property
+    def active_patterns(self) -> List[DeceptionPattern]:
+        """Currently active deception patterns, in no particular order"""
+        return [entry[3] for entry in self._active_heap if entry[2] in self._active_ids]
+        
     async def execute_deception(self, pattern_type: DeceptionType, params: Dict) -> None:
         """Execute specified deception pattern"""
         pattern = DeceptionPattern(
@@ -32,19 +48,16 @@ class DeceptionSystem:
             priority=params.get('priority', 1)
         )
         
-        self.active_patterns.append(pattern)
+        if not self._commit_pattern(pattern):
+            return
         await self._apply_pattern(pattern)
         
-    async def _apply_pattern(self, pattern: DeceptionPattern) -> None:
-        """Apply specific deception pattern"""
-        if pattern.pattern_type == DeceptionType.RADAR_SPOOFING:
-            await self._apply_radar_spoofing(pattern.parameters)
-        elif pattern.pattern_type == DeceptionType.COMMS_SPOOFING:
-            await self._apply_comms_spoofing(pattern.parameters)
-        elif pattern.pattern_type == DeceptionType.GPS_SPOOFING:
-            await self._apply_gps_spoofing(pattern.parameters)
+    def _commit_pattern(self, pattern: DeceptionPattern) -> bool:
+        """Activate a pattern and queue its activation event in one synchronous step"""
+        if not self._activate(pattern):
+            return False
             
-        await self.uav.event_manager.publish(SystemEvent(
+        self.uav.event_manager.publish_nowait(SystemEvent(
             event_type=SystemEventType.DECEPTION_ACTIVATED,
             component_id="deception_system",
             data={
@@ -54,6 +67,74 @@ class DeceptionSystem:
             timestamp=datetime.now(),
             priority=pattern.priority
         ))
+        return True
+        
+    def _activate(self, pattern: DeceptionPattern) -> bool:
+        """
+        Track a new pattern until it expires
+        
+        At capacity the lowest-priority, soonest-expiring pattern is evicted.
+        Returns False if the new pattern ranks below every active one.
+        """
+        self._prune_expired_entries()
+        loop = asyncio.get_running_loop()
+        expiry = loop.time() + pattern.duration
+        entry = (pattern.priority, expiry, id(pattern), pattern)
+        
+        if len(self._active_ids) < self.max_active_patterns:
+            heapq.heappush(self._active_heap, entry)
+        elif entry[:2] > self._active_heap[0][:2]:
+            evicted = heapq.heapreplace(self._active_heap, entry)
+            self._active_ids.discard(evicted[2])
+        else:
+            return False
+            
+        self._active_ids.add(entry[2])
+        heapq.heappush(self._expiry_heap, (expiry, entry[2], pattern))
+        
+        # Wake the expiry driver in case this pattern expires first
+        self._expiry_wakeup.set()
+        if self._expiry_task is None or self._expiry_task.done():
+            self._expiry_task = asyncio.create_task(self._run_expiry())
+        return True
+        
+    def _prune_expired_entries(self) -> None:
+        """Drop expired entries from the root of the priority heap"""
+        heap = self._active_heap
+        while heap and heap[0][2] not in self._active_ids:
+            heapq.heappop(heap)
+            
+    async def _run_expiry(self) -> None:
+        """Single driver retiring patterns as their durations elapse"""
+        loop = asyncio.get_running_loop()
+        while self._expiry_heap:
+            delay = self._expiry_heap[0][0] - loop.time()
+            if delay > 0:
+                # Sleep until due, or until an earlier expiry is scheduled
+                self._expiry_wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._expiry_wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+                
+            _, pattern_id, _ = heapq.heappop(self._expiry_heap)
+            self._active_ids.discard(pattern_id)
+            
+            # Expired entries deep in the priority heap are left in place and
+            # compacted once they outnumber the live ones
+            if len(self._active_heap) > 2 * len(self._active_ids):
+                self._active_heap = [e for e in self._active_heap if e[2] in self._active_ids]
+                heapq.heapify(self._active_heap)
+                
+    async def _apply_pattern(self, pattern: DeceptionPattern) -> None:
+        """Apply specific deception pattern"""
+        if pattern.pattern_type == DeceptionType.RADAR_SPOOFING:
+            await self._apply_radar_spoofing(pattern.parameters)
+        elif pattern.pattern_type == DeceptionType.COMMS_SPOOFING:
+            await self._apply_comms_spoofing(pattern.parameters)
+        elif pattern.pattern_type == DeceptionType.GPS_SPOOFING:
+            await self._apply_gps_spoofing(pattern.parameters)
         
     async def _apply_radar_spoofing(self, params: Dict) -> None:
         """Generate false radar signatures"""
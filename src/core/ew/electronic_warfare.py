@@ -1,10 +1,49 @@
 from enum import Enum, auto
 import numpy as np
-from typing import Dict, List, Optional
+from numba import njit
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from ..events.event_manager import EventManager
 from ..events.system_events import SystemEvent, SystemEventType
 
+@njit(cache=True, fastmath=True)
+def _find_peaks_nb(spectrum: np.ndarray, threshold: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Single pass local-maximum search with inline -3 dB widths
+    
+    Returns bin index, power and -3 dB width in bins for each peak above
+    threshold. Flat-topped peaks report the middle of the plateau.
+    """
+    n = len(spectrum)
+    bins = np.empty(n, dtype=np.int64)
+    powers = np.empty(n, dtype=spectrum.dtype)
+    widths = np.empty(n, dtype=np.int64)
+    count = 0
+    rising = False
+    plateau_start = 0
+    for i in range(1, n):
+        if spectrum[i] > spectrum[i - 1]:
+            rising = True
+            plateau_start = i
+        elif spectrum[i] < spectrum[i - 1]:
+            if rising:
+                peak = (plateau_start + i - 1) // 2
+                power = spectrum[peak]
+                if power > threshold:
+                    half_power = power - 3.0
+                    lo = plateau_start
+                    while lo > 0 and spectrum[lo - 1] > half_power:
+                        lo -= 1
+                    hi = i - 1
+                    while hi < n - 1 and spectrum[hi + 1] > half_power:
+                        hi += 1
+                    bins[count] = peak
+                    powers[count] = power
+                    widths[count] = hi - lo + 1
+                    count += 1
+            rising = False
+    return bins[:count], powers[:count], widths[:count]
+
 class SignalType(Enum):
     RADAR = auto()
     COMMS = auto()
@@ -29,68 +68,101 @@ class ElectronicWarfare:
         self.detection_threshold = -70  # dBm
         self.classification_confidence = 0.85
         
+        # Spectrum bin layout, matching EMSensor defaults
+        self.spectrum_start = 1e6  # Hz at bin 0
+        self.spectrum_resolution = 1e6  # Hz per bin
+        
+        # Match score weights for frequency and bandwidth agreement
+        self.match_weights = (0.5, 0.5)
+        self._build_threat_arrays()
+        
     async def detect_signals(self, spectrum: np.ndarray) -> List[DetectedSignal]:
         """Detect and classify signals in spectrum"""
         detected = []
         
         # Find peaks above detection threshold
-        peaks = self._find_peaks(spectrum)
+        frequencies, powers, bandwidths = self._find_peaks(spectrum)
+        signals = [
+            DetectedSignal(
+                frequency=float(frequency),
+                bandwidth=float(bandwidth),
+                power=float(power),
+                modulation='unknown',
+                signal_type=SignalType.UNKNOWN,
+                confidence=0.0
+            )
+            for frequency, power, bandwidth in zip(frequencies, powers, bandwidths)
+        ]
         
-        for peak in peaks:
-            signal = self._analyze_signal(peak, spectrum)
-            if signal.power > self.detection_threshold:
-                classified = self._classify_signal(signal)
-                detected.append(classified)
-                
-                # Publish detection event
-                await self.event_manager.publish(SystemEvent(
-                    event_type=SystemEventType.EM_SIGNAL_DETECTED,
-                    component_id="electronic_warfare",
-                    data={
-                        "signal": classified,
-                        "timestamp": datetime.now()
-                    },
-                    priority=2
-                ))
-                
+        # Classify all detections against the threat library in one pass
+        events = []
+        for classified in self._classify_signals(signals):
+            detected.append(classified)
+            events.append(SystemEvent(
+                event_type=SystemEventType.EM_SIGNAL_DETECTED,
+                component_id="electronic_warfare",
+                data={
+                    "signal": classified,
+                    "timestamp": datetime.now()
+                },
+                priority=2
+            ))
+            
+        # Publish all detection events together
+        await self.event_manager.publish_many(events)
         return detected
         
-    def _find_peaks(self, spectrum: np.ndarray) -> List[Dict[str, float]]:
-        """Find spectral peaks using adaptive thresholding"""
-        # Implementation would use actual signal processing
-        return []
-        
-    def _analyze_signal(self, peak: Dict[str, float], spectrum: np.ndarray) -> DetectedSignal:
-        """Analyze signal characteristics"""
-        # Calculate bandwidth
-        bandwidth = self._calculate_bandwidth(peak, spectrum)
+    def _find_peaks(self, spectrum: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Find spectral peaks above the detection threshold
         
-        return DetectedSignal(
-            frequency=peak['frequency'],
-            bandwidth=bandwidth,
-            power=peak['power'],
-            modulation='unknown',
-            signal_type=SignalType.UNKNOWN,
-            confidence=0.0
+        Returns:
+            Peak frequencies (Hz), powers (dBm) and -3 dB bandwidths (Hz)
+        """
+        bins, powers, widths = _find_peaks_nb(
+            np.ascontiguousarray(spectrum, dtype=np.float64),
+            float(self.detection_threshold)
         )
+        frequencies = self.spectrum_start + bins * self.spectrum_resolution
+        return frequencies, powers, widths * self.spectrum_resolution
         
     def _classify_signal(self, signal: DetectedSignal) -> DetectedSignal:
         """Classify signal against known threat library"""
-        best_match = None
-        highest_score = 0.0
+        return self._classify_signals([signal])[0]
         
-        for threat in self.known_threats:
-            score = self._calculate_match_score(signal, threat)
-            if score > highest_score:
-                highest_score = score
-                best_match = threat
-                
-        if highest_score > self.classification_confidence:
-            signal.signal_type = best_match['type']
-            signal.modulation = best_match['modulation']
-            signal.confidence = highest_score
+    def _classify_signals(self, signals: List[DetectedSignal]) -> List[DetectedSignal]:
+        """Classify signals against the known threat library in one vectorized pass"""
+        if not signals or not self.known_threats:
+            return signals
             
-        return signal
+        freq = np.array([signal.frequency for signal in signals])[:, np.newaxis]
+        bw = np.array([signal.bandwidth for signal in signals])[:, np.newaxis]
+        
+        # (signals, threats) match scores
+        in_freq = (freq >= self._threat_freq_lo) & (freq <= self._threat_freq_hi)
+        in_bw = (bw >= self._threat_bw_lo) & (bw <= self._threat_bw_hi)
+        scores = in_freq * self.match_weights[0] + in_bw * self.match_weights[1]
+        
+        best = scores.argmax(axis=1)
+        best_scores = scores[np.arange(len(signals)), best]
+        
+        for signal, idx, score in zip(signals, best, best_scores):
+            if score > self.classification_confidence:
+                signal.signal_type = self._threat_types[idx]
+                signal.modulation = self._threat_mods[idx]
+                signal.confidence = float(score)
+                
+        return signals
+        
+    def _build_threat_arrays(self) -> None:
+        """Unpack the threat library into parallel arrays for vectorized matching"""
+        threats = self.known_threats
+        self._threat_freq_lo = np.array([t['frequency_range'][0] for t in threats])
+        self._threat_freq_hi = np.array([t['frequency_range'][1] for t in threats])
+        self._threat_bw_lo = np.array([t['bandwidth_range'][0] for t in threats])
+        self._threat_bw_hi = np.array([t['bandwidth_range'][1] for t in threats])
+        self._threat_types = [t['type'] for t in threats]
+        self._threat_mods = [t['modulation'] for t in threats]
         
     def _load_threat_library(self) -> List[Dict[str, Any]]:
         """Load known threat signatures"""
@@ -1,6 +1,10 @@
+from collections import deque
 from enum import Enum, auto
+import asyncio
+import heapq
+import itertools
 import numpy as np
-from typing import Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 from ..events.event_manager import EventManager
 
 class JammingType(Enum):
@@ -9,12 +13,85 @@ class JammingType(Enum):
     SWEEP = auto()
     PULSE = auto()
 
+class CalendarQueue:
+    """
+    Calendar queue of timed items
+    
+    Items are hashed by time into a ring of buckets of equal width. Only the
+    bucket being served is kept sorted, in a small binary heap, so pushes are
+    O(1) and pops O(log k) in the size of a single bucket.
+    """
+    def __init__(self, num_buckets: int = 256, bucket_width: float = 0.01):
+        self.num_buckets = num_buckets
+        self.bucket_width = bucket_width
+        self._calendar: List[deque] = [deque() for _ in range(num_buckets)]
+        self._current_heap: List[Tuple[float, int, Any]] = []
+        self._current_bucket = 0
+        self._pending = 0  # Items still in the calendar, not yet in the heap
+        self._seq = itertools.count()
+        
+    def __len__(self) -> int:
+        return self._pending + len(self._current_heap)
+        
+    def push(self, when: float, item: Any) -> None:
+        """Schedule an item at the given time"""
+        bucket = int(when / self.bucket_width)
+        if not len(self):
+            self._current_bucket = bucket
+            
+        entry = (when, next(self._seq), item)
+        if bucket <= self._current_bucket:
+            heapq.heappush(self._current_heap, entry)
+        else:
+            self._calendar[bucket % self.num_buckets].append((bucket, entry))
+            self._pending += 1
+            
+    def peek_time(self) -> Optional[float]:
+        """Time of the earliest item, or None when empty"""
+        scanned = 0
+        while not self._current_heap:
+            if not self._pending:
+                return None
+            if scanned >= self.num_buckets:
+                # A whole year of empty buckets: jump to the earliest item
+                self._current_bucket = min(
+                    bucket for slot in self._calendar for bucket, _ in slot
+                ) - 1
+                scanned = 0
+            self._advance()
+            scanned += 1
+        return self._current_heap[0][0]
+        
+    def pop(self) -> Tuple[float, Any]:
+        """Remove and return the earliest (time, item); the queue must not be empty"""
+        self.peek_time()
+        when, _, item = heapq.heappop(self._current_heap)
+        return when, item
+        
+    def _advance(self) -> None:
+        """Move to the next bucket and load its items for this year into the heap"""
+        self._current_bucket += 1
+        slot = self._calendar[self._current_bucket % self.num_buckets]
+        for _ in range(len(slot)):
+            bucket, entry = slot.popleft()
+            if bucket == self._current_bucket:
+                heapq.heappush(self._current_heap, entry)
+                self._pending -= 1
+            else:
+                slot.append((bucket, entry))
+
 class JammingSimulator:
     def __init__(self, em_sensor: EMSensor, event_manager: EventManager):
         self.em_sensor = em_sensor
         self.event_manager = event_manager
         self.active_jammers: Dict[str, Dict] = {}
         
+        # Sweep steps for all jammers run off one timer queue and driver task
+        self._sweeps: Dict[str, Dict] = {}
+        self._timers = CalendarQueue()
+        self._timer_wakeup = asyncio.Event()
+        self._timer_task = None
+        
     async def simulate_jamming_attack(self, jammer_id: str, params: Dict) -> None:
         """Simulate a jamming attack with given parameters"""
         jam_type = JammingType[params['type'].upper()]
@@ -24,14 +101,14 @@ class JammingSimulator:
         elif jam_type == JammingType.SPOT:
             await self._simulate_spot_jamming(params)
         elif jam_type == JammingType.SWEEP:
-            await self._simulate_sweep_jamming(params)
+            await self._simulate_sweep_jamming(jammer_id, params)
             
         self.active_jammers[jammer_id] = params
         await self._notify_jamming_start(jammer_id, params)
         
     async def _simulate_noise_jamming(self, params: Dict) -> None:
         """Simulate broadband noise jamming"""
-        self.em_sensor.jamming_effects['noise_floor'] = params.get('noise_floor', -70)
+        self.em_sensor.set_noise_floor(params.get('noise_floor', -70))
         
     async def _simulate_spot_jamming(self, params: Dict) -> None:
         """Simulate spot frequency jamming"""
@@ -41,10 +118,69 @@ class JammingSimulator:
             params.get('power', 30)
         )
         
-    async def _simulate_sweep_jamming(self, params: Dict) -> None:
+    async def _simulate_sweep_jamming(self, jammer_id: str, params: Dict) -> None:
         """Simulate sweeping jamming signal"""
-        # This would be implemented with a background task that moves the jamming frequency
-        pass
+        bandwidth = params.get('bandwidth', 1e6)
+        frequencies = np.arange(
+            params['start_frequency'],
+            params['stop_frequency'],
+            params.get('step', bandwidth)
+        )
+        if len(frequencies) == 0:
+            return
+            
+        self._sweeps[jammer_id] = {
+            'frequencies': frequencies,
+            'bandwidth': bandwidth,
+            'power': params.get('power', 30),
+            'dwell': params.get('dwell', 0.01),  # seconds per step
+            'current': None
+        }
+        
+        loop = asyncio.get_running_loop()
+        self._timers.push(loop.time(), (jammer_id, 0))
+        self._timer_wakeup.set()
+        if self._timer_task is None or self._timer_task.done():
+            self._timer_task = asyncio.create_task(self._run_timers())
+            
+    async def stop_jamming_attack(self, jammer_id: str) -> None:
+        """Stop a jamming attack; pending sweep steps are dropped when they fire"""
+        self.active_jammers.pop(jammer_id, None)
+        sweep = self._sweeps.pop(jammer_id, None)
+        if sweep is not None and sweep['current'] is not None:
+            self.em_sensor.remove_jammer(sweep['current'])
+            
+    async def _run_timers(self) -> None:
+        """Single driver advancing every sweeping jammer on schedule"""
+        loop = asyncio.get_running_loop()
+        while True:
+            when = self._timers.peek_time()
+            delay = None if when is None else when - loop.time()
+            if delay is None or delay > 0:
+                # Sleep until due, or until an earlier step is scheduled
+                self._timer_wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._timer_wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+                
+            when, (jammer_id, step) = self._timers.pop()
+            self._sweep_step(jammer_id, step, when)
+            
+    def _sweep_step(self, jammer_id: str, step: int, when: float) -> None:
+        """Retune a sweeping jammer and schedule its next step"""
+        sweep = self._sweeps.get(jammer_id)
+        if sweep is None:
+            return
+            
+        if sweep['current'] is not None:
+            self.em_sensor.remove_jammer(sweep['current'])
+        frequency = float(sweep['frequencies'][step % len(sweep['frequencies'])])
+        self.em_sensor.add_jammer(frequency, sweep['bandwidth'], sweep['power'])
+        sweep['current'] = frequency
+        
+        self._timers.push(when + sweep['dwell'], (jammer_id, step + 1))
         
     async def _notify_jamming_start(self, jammer_id: str, params: Dict) -> None:
         """Notify systems about jamming attack"""
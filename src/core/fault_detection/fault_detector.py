@@ -1,14 +1,99 @@
 from abc import ABC, abstractmethod
-from typing import Dict, List
+from typing import Any, Dict, List, Optional
+import time
 import numpy as np
 from ..events.event_manager import EventManager
 
+class FaultRingBuffer:
+    """Fixed-capacity fault log stored as typed columns"""
+    def __init__(self, capacity: int = 10000):
+        self.capacity = capacity
+        self._timestamp = np.zeros(capacity)  # Wall-clock seconds
+        self._severity = np.zeros(capacity, dtype=np.float32)
+        self._value = np.full(capacity, np.nan)
+        self._component = np.zeros(capacity, dtype=np.int16)
+        self._fault_type = np.zeros(capacity, dtype=np.int16)
+        self._details = np.empty(capacity, dtype=object)
+        self._head = 0
+        self._count = 0
+        
+        # String interning for the code columns
+        self._component_codes: Dict[str, int] = {}
+        self._component_names: List[str] = []
+        self._type_codes: Dict[str, int] = {}
+        self._type_names: List[str] = []
+        
+    def __len__(self) -> int:
+        return self._count
+        
+    @staticmethod
+    def _intern(name: str, codes: Dict[str, int], names: List[str]) -> int:
+        code = codes.get(name)
+        if code is None:
+            code = codes[name] = len(names)
+            names.append(name)
+        return code
+        
+    def append(self, component: str, fault_type: str, value: Optional[float],
+               severity: float, timestamp: Optional[float] = None,
+               details: Any = None) -> None:
+        """Record one fault, overwriting the oldest entry when full"""
+        i = self._head
+        self._timestamp[i] = time.time() if timestamp is None else timestamp
+        self._severity[i] = severity
+        self._value[i] = np.nan if value is None else value
+        self._component[i] = self._intern(component, self._component_codes, self._component_names)
+        self._fault_type[i] = self._intern(fault_type, self._type_codes, self._type_names)
+        self._details[i] = details
+        self._head = (i + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+        
+    def _chronological(self) -> np.ndarray:
+        """Slot indices from oldest to newest"""
+        if self._count < self.capacity:
+            return np.arange(self._count)
+        return (np.arange(self.capacity) + self._head) % self.capacity
+        
+    def recent(self, seconds: float, now: Optional[float] = None) -> np.ndarray:
+        """Slot indices of faults logged in the last `seconds`, oldest first"""
+        slots = self._chronological()
+        now = time.time() if now is None else now
+        start = np.searchsorted(self._timestamp[slots], now - seconds, side='left')
+        return slots[start:]
+        
+    def count_by_component(self, seconds: Optional[float] = None) -> Dict[str, int]:
+        """Number of faults per component, optionally within a time window"""
+        slots = self._chronological() if seconds is None else self.recent(seconds)
+        counts = np.bincount(self._component[slots], minlength=len(self._component_names))
+        return {
+            name: int(count)
+            for name, count in zip(self._component_names, counts) if count
+        }
+        
+    def records(self) -> List[Dict[str, Any]]:
+        """Materialize entries as dictionaries, oldest first"""
+        return [
+            {
+                'component': self._component_names[self._component[i]],
+                'type': self._type_names[self._fault_type[i]],
+                'value': float(self._value[i]),
+                'severity': float(self._severity[i]),
+                'timestamp': float(self._timestamp[i]),
+                'details': self._details[i]
+            }
+            for i in self._chronological()
+        ]
+
 class FaultDetector(ABC):
     def __init__(self, event_manager: EventManager):
         self.event_manager = event_manager
-        self.fault_history = []
+        self.fault_history = FaultRingBuffer()
         self.detection_thresholds = {}
         
+        # Health score weights, aligned with _health_keys
+        self._health_keys = ('vibration', 'temperature', 'voltage', 'current', 'signal_noise')
+        self._health_w = np.array([0.3, 0.25, 0.2, 0.15, 0.1])
+        
     @abstractmethod
     async def detect_faults(self, sensor_data: Dict) -> List[Dict]:
         """Detect faults in hardware components"""
@@ -19,9 +104,15 @@ class FaultDetector(ABC):
         """Diagnose detected faults"""
         pass
         
-    async def log_fault(self, fault: Dict) -> None:
-        """Log detected fault"""
-        self.fault_history.append(fault)
+    async def log_fault(self, fault: Dict, component: Optional[str] = None) -> None:
+        """Log detected fault against component, defaulting to the fault's own 'component' field"""
+        self.fault_history.append(
+            component or fault.get('component', 'unknown'),
+            fault.get('type', 'unknown'),
+            fault.get('value'),
+            fault.get('severity', 0.0),
+            details=fault
+        )
         await self.event_manager.publish(SystemEvent(
             event_type=SystemEventType.HARDWARE_FAULT_DETECTED,
             component_id="fault_detector",
@@ -30,11 +121,14 @@ class FaultDetector(ABC):
         
     def _calculate_health_score(self, metrics: Dict[str, float]) -> float:
         """Calculate overall health score from component metrics"""
-        weights = {
-            'vibration': 0.3,
-            'temperature': 0.25,
-            'voltage': 0.2,
-            'current': 0.15,
-            'signal_noise': 0.1
-        }
-        return sum(metrics[k] * weights[k] for k in weights)
\ No newline at end of file
+        v = np.fromiter(
+            (metrics[k] for k in self._health_keys),
+            dtype=np.float64,
+            count=len(self._health_keys)
+        )
+        return float(v @ self._health_w)
+        
+    def _calculate_health_scores(self, metrics: List[Dict[str, float]]) -> np.ndarray:
+        """Health scores for several metric sets with one matrix product"""
+        m = np.array([[entry[k] for k in self._health_keys] for entry in metrics], dtype=np.float64)
+        return m.reshape(-1, len(self._health_keys)) @ self._health_w
\ No newline at end of file
@@ -1,5 +1,10 @@
-from typing import Dict
+from typing import Dict, List
+import asyncio
+import heapq
+import itertools
+import numpy as np
 from ..hil.hil_interface import HILInterface
+from .fault_detector import FaultRingBuffer
 from .sensor_fault_detector import SensorFaultDetector
 
 class FaultManager:
@@ -8,32 +13,89 @@ class FaultManager:
             name: SensorFaultDetector(interface, event_manager)
             for name, interface in hil_interfaces.items()
         }
-        self.active_faults = []
+        self.active_faults = FaultRingBuffer()
+        self.poll_interval = 1.0  # seconds
+        self.fault_recheck_delay = 0.25  # seconds
+        
+        # Static schedule: one periodic poll per detector. All polls share one
+        # period, so the deadlines stay sorted as a ring starting at _poll_ptr.
+        self._poll_names = list(self.detectors)
+        self._poll_schedule = np.zeros(len(self._poll_names))
+        self._poll_ptr = 0
+        
+        # Dynamic schedule: follow-up rechecks after a fault, (deadline, seq, name)
+        self._dynamic_heap: List[tuple] = []
+        self._dynamic_seq = itertools.count()
         
     async def monitor_components(self) -> None:
         """Continuously monitor all hardware components"""
-        while True:
-            for name, detector in self.detectors.items():
-                data = await self.detectors[name].sensor.read_diagnostic_data()
-                faults = await detector.detect_faults(data)
+        loop = asyncio.get_running_loop()
+        n_polls = len(self._poll_names)
+        
+        # Stagger the first polls across one interval
+        self._poll_schedule[:] = loop.time() + np.arange(n_polls) * (self.poll_interval / max(n_polls, 1))
+        self._poll_ptr = 0
+        
+        while n_polls or self._dynamic_heap:
+            static_next = self._poll_schedule[self._poll_ptr] if n_polls else np.inf
+            dynamic_next = self._dynamic_heap[0][0] if self._dynamic_heap else np.inf
+            
+            delay = min(static_next, dynamic_next) - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                
+            # Collect everything due by now and poll it concurrently
+            now = loop.time()
+            due = []
+            for _ in range(n_polls):
+                deadline = self._poll_schedule[self._poll_ptr]
+                if deadline > now:
+                    break
+                due.append(self._poll_component(self._poll_names[self._poll_ptr], schedule_recheck=True))
+                self._poll_schedule[self._poll_ptr] = deadline + self.poll_interval
+                self._poll_ptr = (self._poll_ptr + 1) % n_polls
+            while self._dynamic_heap and self._dynamic_heap[0][0] <= now:
+                _, _, name = heapq.heappop(self._dynamic_heap)
+                due.append(self._poll_component(name, schedule_recheck=False))
+                
+            await asyncio.gather(*due)
                 
-                for fault in faults:
-                    diagnosis = await detector.diagnose_fault(fault)
-                    self.active_faults.append({
-                        'component': name,
-                        'fault': fault,
-                        'diagnosis': diagnosis,
-                        'timestamp': datetime.now()
-                    })
-                    await detector.log_fault(fault)
-                    
-            await asyncio.sleep(1.0)  # Check every second
+    async def _poll_component(self, name: str, schedule_recheck: bool) -> None:
+        """Read, check and diagnose one component"""
+        detector = self.detectors[name]
+        data = await detector.sensor.read_diagnostic_data()
+        faults = await detector.detect_faults(data)
+        
+        for fault in faults:
+            diagnosis = await detector.diagnose_fault(fault)
+            self.active_faults.append(
+                name,
+                fault.get('type', 'unknown'),
+                fault.get('value'),
+                fault.get('severity', 0.0),
+                details=diagnosis
+            )
+            await detector.log_fault(fault, name)
+            
+        # Follow up on fresh faults sooner than the next periodic poll
+        if faults and schedule_recheck:
+            heapq.heappush(self._dynamic_heap, (
+                asyncio.get_running_loop().time() + self.fault_recheck_delay,
+                next(self._dynamic_seq),
+                name
+            ))
             
     async def get_component_health(self) -> Dict[str, float]:
         """Get health status for all components"""
-        return {
-            name: detector._calculate_health_score(
-                await detector.sensor.read_diagnostic_data()
-            )
-            for name, detector in self.detectors.items()
-        }
\ No newline at end of file
+        if not self.detectors:
+            return {}
+            
+        names = list(self.detectors)
+        metrics = await asyncio.gather(*(
+            self.detectors[name].sensor.read_diagnostic_data()
+            for name in names
+        ))
+        
+        # All detectors share the same health weights, so score in one batch
+        scores = self.detectors[names[0]]._calculate_health_scores(metrics)
+        return dict(zip(names, scores.tolist()))
\ No newline at end of file
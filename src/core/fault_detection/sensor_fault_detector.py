@@ -1,3 +1,4 @@
+import numpy as np
 from .fault_detector import FaultDetector
 from ..hil.hil_interface import HILInterface
 
@@ -16,31 +17,62 @@ class SensorFaultDetector(FaultDetector):
             'signal_noise': {'max': 0.05},
             'response_time': {'max': 0.01}
         }
+        self._build_threshold_arrays()
+        
+    def _build_threshold_arrays(self) -> None:
+        """
+        Pack detection_thresholds into per-channel bound arrays
+        
+        Must be called again whenever detection_thresholds is modified.
+        """
+        self._channels = tuple(self.detection_thresholds)
+        self._min = np.array([
+            limits.get('min', -np.inf) for limits in self.detection_thresholds.values()
+        ])
+        self._max = np.array([
+            limits.get('max', np.inf) for limits in self.detection_thresholds.values()
+        ])
+        self._fault_types = tuple(
+            'temperature_out_of_range' if channel == 'temperature' else f'{channel}_anomaly'
+            for channel in self._channels
+        )
         
     async def detect_faults(self, sensor_data: Dict) -> List[Dict]:
-        """Detect sensor faults based on operational parameters"""
+        """
+        Detect sensor faults based on operational parameters
+        
+        Channel values may be scalars or equal-length windows of samples; a
+        window is faulted if any sample is out of range and reports the
+        first such sample.
+        """
         faults = []
         
-        # Check temperature
-        if 'temperature' in sensor_data:
-            if not (self.detection_thresholds['temperature']['min'] <= sensor_data['temperature'] <= self.detection_thresholds['temperature']['max']):
-                faults.append({
-                    'type': 'temperature_out_of_range',
-                    'value': sensor_data['temperature'],
-                    'severity': self._calculate_temperature_severity(sensor_data['temperature'])
-                })
-                
-        # Check voltage levels
-        if 'voltage' in sensor_data:
-            if not (self.detection_thresholds['voltage']['min'] <= sensor_data['voltage'] <= self.detection_thresholds['voltage']['max']):
-                faults.append({
-                    'type': 'voltage_anomaly',
-                    'value': sensor_data['voltage'],
-                    'severity': 0.8
-                })
-                
-        # Add other fault checks...
+        present = [i for i, channel in enumerate(self._channels) if channel in sensor_data]
+        if not present:
+            return faults
+            
+        # Range-check every channel (and every sample) at once
+        values = np.array([sensor_data[self._channels[i]] for i in present], dtype=np.float64)
+        lo = self._min[present]
+        hi = self._max[present]
+        if values.ndim > 1:
+            lo = lo[:, np.newaxis]
+            hi = hi[:, np.newaxis]
+        out_of_range = ~((values >= lo) & (values <= hi))
+        flagged = out_of_range.any(axis=1) if values.ndim > 1 else out_of_range
         
+        for k in np.flatnonzero(flagged):
+            channel = self._channels[present[k]]
+            value = values[k][np.argmax(out_of_range[k])] if values.ndim > 1 else values[k]
+            faults.append({
+                'type': self._fault_types[present[k]],
+                'value': float(value),
+                'severity': (
+                    self._calculate_temperature_severity(value)
+                    if channel == 'temperature' else 0.8
+                )
+            })
+            
         return faults
         
     async def diagnose_fault(self, fault_data: Dict) -> Dict:
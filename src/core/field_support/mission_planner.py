@@ -1,3 +1,4 @@
+import asyncio
 from typing import Dict, List
 import numpy as np
 from ..digital_twin.twin_manager import DigitalTwinManager
@@ -16,11 +17,11 @@ class MissionPlanner:
         # Generate primary mission plan
         primary_plan = self._generate_primary_plan(parameters)
         
-        # Generate contingency plans
-        contingencies = await self._generate_contingencies(parameters)
-        
-        # Run simulation validation
-        validation = await self._validate_plan(primary_plan)
+        # Generate contingency plans and run simulation validation concurrently
+        contingencies, validation = await asyncio.gather(
+            self._generate_contingencies(parameters),
+            self._validate_plan(primary_plan)
+        )
         
         return {
             'primary': primary_plan,
@@ -33,12 +34,14 @@ class MissionPlanner:
         # Set up twin environment
         await self.twin.configure_environment(plan['environment'])
         
-        # Execute mission steps
-        results = []
-        for step in plan['steps']:
-            result = await self.twin.execute_step(step)
-            results.append(result)
-            
+        # Execute mission steps, running each dependency level concurrently
+        steps = plan['steps']
+        results = [None] * len(steps)
+        for level in self._step_levels(steps):
+            level_results = await asyncio.gather(*(self.twin.execute_step(steps[i]) for i in level))
+            for i, result in zip(level, level_results):
+                results[i] = result
+                
         # Analyze performance
         analysis = self._analyze_rehearsal(results)
         
@@ -48,6 +51,45 @@ class MissionPlanner:
             'recommendations': self._generate_recommendations(analysis)
         }
     
+    @staticmethod
+    def _step_levels(steps: List[Dict]) -> List[List[int]]:
+        """
+        Group step indices into levels that can execute concurrently
+        
+        Steps may declare 'depends_on', a list of other steps' 'id' (defaulting
+        to the step's index). A plan where no step declares dependencies runs
+        strictly in order, one step per level.
+        """
+        if not any('depends_on' in step for step in steps):
+            return [[i] for i in range(len(steps))]
+            
+        index = {step.get('id', i): i for i, step in enumerate(steps)}
+        dependents: List[List[int]] = [[] for _ in steps]
+        pending = [0] * len(steps)
+        for i, step in enumerate(steps):
+            for dep in step.get('depends_on', ()):
+                if dep not in index:
+                    raise ValueError(f"Step {step.get('id', i)} depends on unknown step {dep}")
+                dependents[index[dep]].append(i)
+                pending[i] += 1
+                
+        # Kahn's algorithm, one frontier at a time
+        levels = []
+        frontier = [i for i in range(len(steps)) if pending[i] == 0]
+        while frontier:
+            levels.append(frontier)
+            next_frontier = []
+            for i in frontier:
+                for j in dependents[i]:
+                    pending[j] -= 1
+                    if pending[j] == 0:
+                        next_frontier.append(j)
+            frontier = next_frontier
+            
+        if sum(len(level) for level in levels) != len(steps):
+            raise ValueError("Mission step dependencies contain a cycle")
+        return levels
+        
     async def _analyze_rehearsal(self, results: List[Dict]) -> Dict[str, Any]:
         """Analyze mission rehearsal results"""
         performance_metrics = {
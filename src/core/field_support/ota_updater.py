@@ -1,8 +1,56 @@
+import asyncio
 import hashlib
-from typing import Dict, List
-from cryptography.hazmat.primitives import serialization
+import hmac
+from functools import lru_cache
+from typing import Dict, Iterable, List, Union
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import padding
+from cryptography.hazmat.primitives.asymmetric.utils import Prehashed
 from ..comms.secure_comms import SecureCommunication
 
+_HASH_CHUNK = 64 * 1024  # bytes fed to the hash per update() call
+
+def _payload_digest(payload: Union[bytes, bytearray, memoryview, Iterable[bytes]]) -> bytes:
+    """
+    SHA256 of an update payload in a single streaming pass
+    
+    Accepts a bytes-like object, hashed in place through a memoryview, or an
+    iterable of byte chunks such as a network stream. An iterable payload is
+    consumed and can only be checked once.
+    """
+    sha256 = hashlib.sha256()
+    if isinstance(payload, (bytes, bytearray, memoryview)):
+        view = memoryview(payload).cast('B')
+        for start in range(0, len(view), _HASH_CHUNK):
+            sha256.update(view[start:start + _HASH_CHUNK])
+    else:
+        for chunk in payload:
+            sha256.update(chunk)
+    return sha256.digest()
+
+@lru_cache(maxsize=16)
+def _load_public_key(key_pem: bytes):
+    """Parse a PEM public key once per distinct key"""
+    return serialization.load_pem_public_key(key_pem)
+
+@lru_cache(maxsize=256)
+def _verify_cached(payload_sha256: bytes, signature: bytes, key_pem: bytes) -> bool:
+    """RSA-PSS verification of a SHA256 payload digest, memoized per (digest, signature, key)"""
+    try:
+        _load_public_key(key_pem).verify(
+            signature,
+            payload_sha256,
+            padding.PSS(
+                mgf=padding.MGF1(hashes.SHA256()),
+                salt_length=padding.PSS.MAX_LENGTH
+            ),
+            Prehashed(hashes.SHA256())
+        )
+        return True
+    except InvalidSignature:
+        return False
+
 class OTAUpdater:
     def __init__(self, secure_comms: SecureCommunication):
         self.secure_comms = secure_comms
@@ -11,10 +59,14 @@ class OTAUpdater:
     async def check_for_updates(self) -> List[Dict]:
         """Check for available updates from secure server"""
         update_list = await self.secure_comms.request_updates()
-        return [
-            update for update in update_list 
-            if self._validate_update_signature(update)
-        ]
+        
+        # Verify signatures in parallel on the loop's default executor;
+        # RSA verification runs in OpenSSL with the GIL released
+        results = await asyncio.gather(*[
+            asyncio.to_thread(self._validate_update_signature, update)
+            for update in update_list
+        ])
+        return [update for update, valid in zip(update_list, results) if valid]
         
     async def apply_update(self, update: Dict) -> bool:
         """Apply verified update package"""
@@ -28,16 +80,19 @@ class OTAUpdater:
     def _validate_update_signature(self, update: Dict) -> bool:
         """Validate cryptographic signature of update package"""
         try:
-            public_key = serialization.load_pem_public_key(update['signature_key'])
-            public_key.verify(
-                update['signature'],
-                update['payload'],
-                padding.PSS(
-                    mgf=padding.MGF1(hashes.SHA256()),
-                    salt_length=padding.PSS.MAX_LENGTH
-                ),
-                hashes.SHA256()
-            )
-            return True
+            # Hash the payload once; repeat polls of the same update hit the cache
+            digest = _payload_digest(update['payload'])
+            return _verify_cached(digest, bytes(update['signature']), bytes(update['signature_key']))
         except:
-            return False
\ No newline at end of file
+            return False
+            
+    def _verify_update_integrity(self, update: Dict) -> bool:
+        """Check payload digest and signature from a single hashing pass"""
+        try:
+            digest = _payload_digest(update['payload'])
+            expected = update.get('expected_digest')
+            if expected is not None and not hmac.compare_digest(digest, bytes(expected)):
+                return False
+            return _verify_cached(digest, bytes(update['signature']), bytes(update['signature_key']))
+        except:
+            return False
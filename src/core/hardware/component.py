@@ -17,15 +17,36 @@ class ComponentStatus(Enum):
     ERROR = 4
     MAINTENANCE = 5
 
+# Statuses in which a component keeps servicing update() ticks
+ACTIVE_STATUSES = frozenset({ComponentStatus.ONLINE, ComponentStatus.DEGRADED})
+
 class HardwareComponent(ABC):
     """Base class for all hardware components"""
     
+    __slots__ = ('component_id', 'type_name', 'config', 'critical', '_status', 'diagnostics',
+                 '_last_update', '_loop', '_diag_version')
+    
     def __init__(self, component_id: str, config: Dict[str, Any] = None):
         self.component_id = component_id
+        self.type_name = type(self).__name__  # Concrete class name, used in events and summaries
         self.config = config or {}
+        # A failed critical component aborts manager initialization
+        self.critical = bool(self.config.get("critical", False))
+        # Bumped whenever a field reported by get_diagnostics changes
+        self._diag_version = 0
         self.status = ComponentStatus.OFFLINE
         self.diagnostics = {}
         self._last_update = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None  # Set by initialize()
+        
+    @property
+    def status(self) -> ComponentStatus:
+        return self._status
+        
+    @status.setter
+    def status(self, status: ComponentStatus) -> None:
+        self._status = status
+        self._diag_version += 1
         
     @abstractmethod
     async def initialize(self) -> bool:
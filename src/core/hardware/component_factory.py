@@ -10,6 +10,14 @@ from .control_unit import ControlUnit
 from .navigation_system import NavigationSystem
 from .sensor import Sensor, SensorType
 
+_LOGGER = logging.getLogger("sentinel.hardware.factory")
+
+# Component types constructed directly from (component_id, config)
+_CONSTRUCTORS: Dict[str, Type[HardwareComponent]] = {
+    "control_unit": ControlUnit,
+    "navigation_system": NavigationSystem
+}
+
 class ComponentFactory:
     """Factory for creating hardware components"""
     
@@ -26,24 +34,20 @@ class ComponentFactory:
         Returns:
             Created component instance or None if type is invalid
         """
-        logger = logging.getLogger("sentinel.hardware.factory")
         config = config or {}
         
-        if component_type == "control_unit":
-            return ControlUnit(component_id, config)
-            
-        elif component_type == "navigation_system":
-            return NavigationSystem(component_id, config)
+        constructor = _CONSTRUCTORS.get(component_type)
+        if constructor is not None:
+            return constructor(component_id, config)
             
-        elif component_type == "sensor":
+        if component_type == "sensor":
             sensor_type_str = config.get("sensor_type", "TEMPERATURE")
             try:
                 sensor_type = SensorType[sensor_type_str]
                 return Sensor(component_id, sensor_type, config)
             except KeyError:
-                logger.error(f"Invalid sensor type: {sensor_type_str}")
+                _LOGGER.error(f"Invalid sensor type: {sensor_type_str}")
                 return None
                 
-        else:
-            logger.error(f"Unknown component type: {component_type}")
-            return None
\ No newline at end of file
+        _LOGGER.error(f"Unknown component type: {component_type}")
+        return None
\ No newline at end of file
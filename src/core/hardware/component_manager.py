@@ -6,11 +6,20 @@ This module provides a manager for hardware components.
 from typing import Dict, Any, List, Optional
 import asyncio
 import logging
+from collections import defaultdict
 from .component import HardwareComponent, ComponentStatus
 from .component_factory import ComponentFactory
 from ..events.event_manager import EventManager
 from ..system.events import SystemEvent, SystemEventType
 
+# Health summary counter incremented for each component status
+_HEALTH_COUNTERS = {
+    ComponentStatus.ONLINE: "online_components",
+    ComponentStatus.DEGRADED: "degraded_components",
+    ComponentStatus.OFFLINE: "offline_components",
+    ComponentStatus.ERROR: "error_components"
+}
+
 class ComponentManager:
     """Manager for hardware components"""
     
@@ -18,24 +27,40 @@ class ComponentManager:
         self.logger = logging.getLogger("sentinel.hardware.manager")
         self.event_manager = event_manager
         self.components: Dict[str, HardwareComponent] = {}
+        # Components indexed by every class in their MRO
+        self._by_type: Dict[type, List[HardwareComponent]] = defaultdict(list)
         self._running = False
         
     async def initialize(self) -> bool:
         """Initialize the component manager and all components"""
         self.logger.info("Initializing hardware component manager")
         
-        # Initialize all components
-        init_tasks = []
-        for component in self.components.values():
-            init_tasks.append(component.initialize())
-            
-        # Wait for all components to initialize
-        if init_tasks:
-            results = await asyncio.gather(*init_tasks, return_exceptions=True)
-            success = all(result is True for result in results if not isinstance(result, Exception))
-        else:
-            success = True
-            
+        # Initialize all components concurrently, handling each as it finishes
+        pending = {
+            asyncio.create_task(component.initialize()): component
+            for component in self.components.values()
+        }
+        success = True
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                component = pending.pop(task)
+                error = task.exception()
+                if error is None and task.result() is True:
+                    continue
+                    
+                if error is None:
+                    success = False
+                if component.critical:
+                    # No point waiting on the rest once a critical component has failed
+                    self.logger.error("Critical component %s failed to initialize", component.component_id)
+                    success = False
+                    for other in pending:
+                        other.cancel()
+                    await asyncio.gather(*pending, return_exceptions=True)
+                    pending = {}
+                    break
+                    
         self._running = success
         return success
         
@@ -56,11 +81,13 @@ class ComponentManager:
     async def register_component(self, component: HardwareComponent) -> bool:
         """Register a hardware component"""
         if component.component_id in self.components:
-            self.logger.warning(f"Component with ID {component.component_id} already registered")
+            self.logger.warning("Component with ID %s already registered", component.component_id)
             return False
             
         self.components[component.component_id] = component
-        
+        for cls in type(component).__mro__:
+            self._by_type[cls].append(component)
+            
         # Initialize component if manager is already running
         if self._running:
             await component.initialize()
@@ -68,7 +95,7 @@ class ComponentManager:
         await self.event_manager.publish(SystemEvent(
             event_type=SystemEventType.COMPONENT_REGISTERED,
             component_id=component.component_id,
-            data={"type": component.__class__.__name__}
+            data={"type": component.type_name}
         ))
         
         return True
@@ -76,7 +103,7 @@ class ComponentManager:
     async def unregister_component(self, component_id: str) -> bool:
         """Unregister a hardware component"""
         if component_id not in self.components:
-            self.logger.warning(f"Component with ID {component_id} not registered")
+            self.logger.warning("Component with ID %s not registered", component_id)
             return False
             
         component = self.components[component_id]
@@ -86,6 +113,8 @@ class ComponentManager:
             await component.shutdown()
             
         del self.components[component_id]
+        for cls in type(component).__mro__:
+            self._by_type[cls].remove(component)
         
         await self.event_manager.publish(SystemEvent(
             event_type=SystemEventType.COMPONENT_UNREGISTERED,
@@ -101,7 +130,7 @@ class ComponentManager:
         
     def get_components_by_type(self, component_type: type) -> List[HardwareComponent]:
         """Get all components of a specific type"""
-        return [c for c in self.components.values() if isinstance(c, component_type)]
+        return list(self._by_type.get(component_type, ()))
         
     async def create_component(self, component_type: str, component_id: str, config: Dict[str, Any] = None) -> Optional[HardwareComponent]:
         """Create and register a new component"""
@@ -136,20 +165,22 @@ class ComponentManager:
             "components": {}
         }
         
-        for component_id, component in self.components.items():
-            status = await component.get_status()
-            health["components"][component_id] = {
+        # Query all components concurrently
+        components = list(self.components.items())
+        statuses = await asyncio.gather(*(component.get_status() for _, component in components))
+        
+        # Loop-invariant lookups bound once
+        summaries = health["components"]
+        counter_for = _HEALTH_COUNTERS.get
+        
+        for (component_id, component), status in zip(components, statuses):
+            summaries[component_id] = {
                 "status": status.name,
-                "type": component.__class__.__name__
+                "type": component.type_name
             }
             
-            if status == ComponentStatus.ONLINE:
-                health["online_components"] += 1
-            elif status == ComponentStatus.DEGRADED:
-                health["degraded_components"] += 1
-            elif status == ComponentStatus.OFFLINE:
-                health["offline_components"] += 1
-            elif status == ComponentStatus.ERROR:
-                health["error_components"] += 1
+            counter = counter_for(status)
+            if counter is not None:
+                health[counter] += 1
                 
         return health
\ No newline at end of file
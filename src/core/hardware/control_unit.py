@@ -6,7 +6,8 @@ This module implements the control unit hardware component for the XY-28C-Sentin
 from typing import Dict, Any, List, Optional
 import asyncio
 import logging
-from .component import HardwareComponent, ComponentStatus
+from collections import deque
+from .component import HardwareComponent, ComponentStatus, ACTIVE_STATUSES
 from ..utils.error_handler import SentinelError, ErrorCategory, ErrorSeverity
 
 class ControlMode(Enum):
@@ -19,17 +20,21 @@ class ControlMode(Enum):
 class ControlUnit(HardwareComponent):
     """Control unit hardware component implementation"""
     
+    __slots__ = ('logger', 'control_mode', 'command_queue', 'telemetry')
+    
     def __init__(self, component_id: str, config: Dict[str, Any] = None):
         super().__init__(component_id, config)
         self.logger = logging.getLogger(f"sentinel.hardware.{component_id}")
         self.control_mode = ControlMode.MANUAL
-        self.command_queue = asyncio.Queue()
-        self.telemetry = {}
+        self.command_queue = deque()
+        # Reused across ticks; _read_telemetry overwrites the values in place
+        self.telemetry = {"cpu_temp": 0.0, "memory_usage": 0.0, "uptime": 0.0}
         
     async def initialize(self) -> bool:
         """Initialize the control unit hardware"""
-        self.logger.info(f"Initializing control unit: {self.component_id}")
+        self.logger.info("Initializing control unit: %s", self.component_id)
         self.status = ComponentStatus.INITIALIZING
+        self._loop = asyncio.get_running_loop()
         
         try:
             # Perform hardware initialization
@@ -37,17 +42,17 @@ class ControlUnit(HardwareComponent):
             await asyncio.sleep(0.5)  # Simulate initialization time
             
             self.status = ComponentStatus.ONLINE
-            self.logger.info(f"Control unit {self.component_id} initialized successfully")
+            self.logger.info("Control unit %s initialized successfully", self.component_id)
             return True
             
         except Exception as e:
             self.status = ComponentStatus.ERROR
-            self.logger.error(f"Failed to initialize control unit: {e}")
+            self.logger.error("Failed to initialize control unit: %s", e)
             return False
             
     async def shutdown(self) -> None:
         """Shutdown the control unit hardware"""
-        self.logger.info(f"Shutting down control unit: {self.component_id}")
+        self.logger.info("Shutting down control unit: %s", self.component_id)
         
         try:
             # Perform hardware shutdown
@@ -55,28 +60,28 @@ class ControlUnit(HardwareComponent):
             await asyncio.sleep(0.2)  # Simulate shutdown time
             
             self.status = ComponentStatus.OFFLINE
-            self.logger.info(f"Control unit {self.component_id} shutdown successfully")
+            self.logger.info("Control unit %s shutdown successfully", self.component_id)
             
         except Exception as e:
-            self.logger.error(f"Error during control unit shutdown: {e}")
+            self.logger.error("Error during control unit shutdown: %s", e)
             
     async def update(self) -> None:
         """Update control unit state"""
-        if self.status not in [ComponentStatus.ONLINE, ComponentStatus.DEGRADED]:
+        if self.status not in ACTIVE_STATUSES:
             return
             
         try:
-            # Process commands in the queue
-            while not self.command_queue.empty():
-                command = self.command_queue.get_nowait()
-                await self._process_command(command)
+            # Process the commands queued so far in order; later arrivals wait for the next tick
+            queue = self.command_queue
+            for _ in range(len(queue)):
+                await self._process_command(queue.popleft())
                 
             # Update telemetry data
-            self.telemetry = await self._read_telemetry()
-            self._last_update = asyncio.get_event_loop().time()
+            await self._read_telemetry()
+            self._last_update = self._loop.time()
             
         except Exception as e:
-            self.logger.error(f"Error updating control unit: {e}")
+            self.logger.error("Error updating control unit: %s", e)
             if self.status == ComponentStatus.ONLINE:
                 self.status = ComponentStatus.DEGRADED
                 
@@ -85,9 +90,9 @@ class ControlUnit(HardwareComponent):
         diagnostics = {
             "status": self.status.name,
             "control_mode": self.control_mode.name,
-            "queue_size": self.command_queue.qsize(),
+            "queue_size": len(self.command_queue),
             "last_update": self._last_update,
-            "telemetry": self.telemetry
+            "telemetry": dict(self.telemetry)
         }
         
         # Add hardware-specific diagnostics
@@ -97,16 +102,12 @@ class ControlUnit(HardwareComponent):
         
     async def send_command(self, command: Dict[str, Any]) -> bool:
         """Send a command to the control unit"""
-        try:
-            await self.command_queue.put(command)
-            return True
-        except Exception as e:
-            self.logger.error(f"Failed to queue command: {e}")
-            return False
+        self.command_queue.append(command)
+        return True
             
     async def set_control_mode(self, mode: ControlMode) -> bool:
         """Set the control unit operation mode"""
-        self.logger.info(f"Changing control mode from {self.control_mode.name} to {mode.name}")
+        self.logger.info("Changing control mode from %s to %s", self.control_mode.name, mode.name)
         self.control_mode = mode
         return True
         
@@ -114,16 +115,17 @@ class ControlUnit(HardwareComponent):
         """Process a control command"""
         # This would send commands to actual hardware in a real implementation
         command_type = command.get("type")
-        self.logger.debug(f"Processing command: {command_type}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Processing command: %s", command_type)
         
         # Simulate command processing
         await asyncio.sleep(0.05)
         
     async def _read_telemetry(self) -> Dict[str, Any]:
-        """Read telemetry data from the control unit"""
+        """Read telemetry data from the control unit into self.telemetry"""
         # This would read from actual hardware in a real implementation
-        return {
-            "cpu_temp": 45.2,
-            "memory_usage": 0.32,
-            "uptime": asyncio.get_event_loop().time() - self._last_update
-        }
\ No newline at end of file
+        telemetry = self.telemetry
+        telemetry["cpu_temp"] = 45.2
+        telemetry["memory_usage"] = 0.32
+        telemetry["uptime"] = self._loop.time() - self._last_update
+        return telemetry
\ No newline at end of file
@@ -0,0 +1,58 @@
+"""
+Navigation Kernels Module
+
+This module provides compiled numeric routines for the navigation system hardware component.
+"""
+import math
+import numpy as np
+from numba import njit
+
+EARTH_RADIUS_KM = 6371.0
+
+@njit(cache=True, fastmath=True)
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance in km between two points given in degrees"""
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    dphi = phi2 - phi1
+    dlam = math.radians(lon2 - lon1)
+    a = math.sin(0.5 * dphi) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(0.5 * dlam) ** 2
+    return 2.0 * EARTH_RADIUS_KM * math.asin(math.sqrt(min(1.0, a)))
+
+@njit(cache=True)
+def closest_waypoint(pos: np.ndarray, waypoints: np.ndarray) -> int:
+    """Index of the waypoint nearest to pos by ground distance, or -1 if there are none"""
+    if waypoints.shape[0] == 0:
+        return -1
+    best = 0
+    best_dist = haversine_km(pos[0], pos[1], waypoints[0, 0], waypoints[0, 1])
+    for i in range(1, waypoints.shape[0]):
+        d = haversine_km(pos[0], pos[1], waypoints[i, 0], waypoints[i, 1])
+        if d < best_dist:
+            best_dist = d
+            best = i
+    return best
+
+@njit(cache=True, fastmath=True)
+def integrate_state(state: np.ndarray, dt: float, accel: np.ndarray, gyro: np.ndarray) -> None:
+    """
+    Advance the (3, 3) navigation state in place by one IMU step
+    
+    Rows are position (latitude deg, longitude deg, altitude m), velocity
+    (east, north, up) in m/s and orientation (roll, pitch, yaw) in radians.
+    Position uses the mean of the old and new velocity over the step.
+    """
+    lat = math.radians(state[0, 0])
+    meters_to_deg = 180.0 / (math.pi * EARTH_RADIUS_KM * 1000.0)
+    
+    ve = state[1, 0] + 0.5 * accel[0] * dt
+    vn = state[1, 1] + 0.5 * accel[1] * dt
+    vu = state[1, 2] + 0.5 * accel[2] * dt
+    
+    state[0, 0] += vn * dt * meters_to_deg
+    state[0, 1] += ve * dt * meters_to_deg / max(math.cos(lat), 1e-6)
+    state[0, 2] += vu * dt
+    
+    for k in range(3):
+        state[1, k] += accel[k] * dt
+        state[2, k] += gyro[k] * dt
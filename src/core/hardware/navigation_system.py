@@ -6,8 +6,10 @@ This module implements the navigation system hardware component for the XY-28C-S
 from typing import Dict, Any, List, Tuple, Optional
 import asyncio
 import logging
+import numpy as np
 from enum import Enum
-from .component import HardwareComponent, ComponentStatus
+from .component import HardwareComponent, ComponentStatus, ACTIVE_STATUSES
+from .nav_kernels import integrate_state, closest_waypoint
 
 class NavigationMode(Enum):
     """Navigation system operation modes"""
@@ -20,37 +22,79 @@ class NavigationMode(Enum):
 class NavigationSystem(HardwareComponent):
     """Navigation system hardware component implementation"""
     
+    __slots__ = ('logger', 'navigation_mode', '_state', '_waypoints_buf', '_waypoints_len')
+    
     def __init__(self, component_id: str, config: Dict[str, Any] = None):
         super().__init__(component_id, config)
         self.logger = logging.getLogger(f"sentinel.hardware.{component_id}")
         self.navigation_mode = NavigationMode.STANDBY
-        self.position = (0.0, 0.0, 0.0)  # (latitude, longitude, altitude)
-        self.velocity = (0.0, 0.0, 0.0)  # (x, y, z) velocity in m/s
-        self.orientation = (0.0, 0.0, 0.0)  # (roll, pitch, yaw) in radians
-        self.waypoints = []
+        
+        # Navigation state rows: position (latitude, longitude, altitude),
+        # velocity (x, y, z) in m/s, orientation (roll, pitch, yaw) in radians
+        self._state = np.zeros((3, 3), dtype=np.float64)
+        
+        # Waypoint rows with spare capacity, grown geometrically
+        self._waypoints_buf = np.empty((16, 3), dtype=np.float64)
+        self._waypoints_len = 0
+        
+    @property
+    def waypoints(self) -> np.ndarray:
+        """Waypoints in insertion order, shape (N, 3)"""
+        return self._waypoints_buf[:self._waypoints_len]
+        
+    @property
+    def position(self) -> np.ndarray:
+        """Current position, a view into the state array"""
+        return self._state[0]
+        
+    @position.setter
+    def position(self, value) -> None:
+        self._state[0] = value
+        
+    @property
+    def velocity(self) -> np.ndarray:
+        """Current velocity, a view into the state array"""
+        return self._state[1]
+        
+    @velocity.setter
+    def velocity(self, value) -> None:
+        self._state[1] = value
+        
+    @property
+    def orientation(self) -> np.ndarray:
+        """Current orientation, a view into the state array"""
+        return self._state[2]
+        
+    @orientation.setter
+    def orientation(self, value) -> None:
+        self._state[2] = value
         
     async def initialize(self) -> bool:
         """Initialize the navigation system hardware"""
-        self.logger.info(f"Initializing navigation system: {self.component_id}")
+        self.logger.info("Initializing navigation system: %s", self.component_id)
         self.status = ComponentStatus.INITIALIZING
+        self._loop = asyncio.get_running_loop()
         
         try:
             # Perform hardware initialization
             # This would connect to actual hardware in a real implementation
             await asyncio.sleep(0.7)  # Simulate initialization time
             
+            # Compile the navigation kernels now so the first update doesn't
+            self._warm_kernels()
+            
             self.status = ComponentStatus.ONLINE
-            self.logger.info(f"Navigation system {self.component_id} initialized successfully")
+            self.logger.info("Navigation system %s initialized successfully", self.component_id)
             return True
             
         except Exception as e:
             self.status = ComponentStatus.ERROR
-            self.logger.error(f"Failed to initialize navigation system: {e}")
+            self.logger.error("Failed to initialize navigation system: %s", e)
             return False
             
     async def shutdown(self) -> None:
         """Shutdown the navigation system hardware"""
-        self.logger.info(f"Shutting down navigation system: {self.component_id}")
+        self.logger.info("Shutting down navigation system: %s", self.component_id)
         
         try:
             # Perform hardware shutdown
@@ -58,23 +102,23 @@ class NavigationSystem(HardwareComponent):
             await asyncio.sleep(0.3)  # Simulate shutdown time
             
             self.status = ComponentStatus.OFFLINE
-            self.logger.info(f"Navigation system {self.component_id} shutdown successfully")
+            self.logger.info("Navigation system %s shutdown successfully", self.component_id)
             
         except Exception as e:
-            self.logger.error(f"Error during navigation system shutdown: {e}")
+            self.logger.error("Error during navigation system shutdown: %s", e)
             
     async def update(self) -> None:
         """Update navigation system state"""
-        if self.status not in [ComponentStatus.ONLINE, ComponentStatus.DEGRADED]:
+        if self.status not in ACTIVE_STATUSES:
             return
             
         try:
             # Update position, velocity, and orientation
             await self._update_navigation_data()
-            self._last_update = asyncio.get_event_loop().time()
+            self._last_update = self._loop.time()
             
         except Exception as e:
-            self.logger.error(f"Error updating navigation system: {e}")
+            self.logger.error("Error updating navigation system: %s", e)
             if self.status == ComponentStatus.ONLINE:
                 self.status = ComponentStatus.DEGRADED
                 
@@ -83,9 +127,9 @@ class NavigationSystem(HardwareComponent):
         diagnostics = {
             "status": self.status.name,
             "navigation_mode": self.navigation_mode.name,
-            "position": self.position,
-            "velocity": self.velocity,
-            "orientation": self.orientation,
+            "position": tuple(self.position.tolist()),
+            "velocity": tuple(self.velocity.tolist()),
+            "orientation": tuple(self.orientation.tolist()),
             "waypoint_count": len(self.waypoints),
             "last_update": self._last_update
         }
@@ -97,22 +141,39 @@ class NavigationSystem(HardwareComponent):
         
     async def set_navigation_mode(self, mode: NavigationMode) -> bool:
         """Set the navigation system operation mode"""
-        self.logger.info(f"Changing navigation mode from {self.navigation_mode.name} to {mode.name}")
+        self.logger.info("Changing navigation mode from %s to %s", self.navigation_mode.name, mode.name)
         self.navigation_mode = mode
         return True
         
     async def add_waypoint(self, waypoint: Tuple[float, float, float]) -> bool:
         """Add a waypoint to the navigation system"""
-        self.waypoints.append(waypoint)
+        if self._waypoints_len == len(self._waypoints_buf):
+            grown = np.empty((2 * len(self._waypoints_buf), 3), dtype=np.float64)
+            grown[:self._waypoints_len] = self._waypoints_buf
+            self._waypoints_buf = grown
+            
+        self._waypoints_buf[self._waypoints_len] = waypoint
+        self._waypoints_len += 1
         return True
         
     async def clear_waypoints(self) -> None:
         """Clear all waypoints"""
-        self.waypoints = []
+        self._waypoints_len = 0
         
     async def get_position(self) -> Tuple[float, float, float]:
         """Get current position"""
-        return self.position
+        return tuple(self.position.tolist())
+        
+    async def get_closest_waypoint(self) -> int:
+        """Index of the waypoint nearest the current position, or -1 if there are none"""
+        return int(closest_waypoint(self._state[0], self.waypoints))
+        
+    def _warm_kernels(self) -> None:
+        """Trigger JIT compilation of the navigation kernels on scratch data"""
+        scratch = np.zeros((3, 3), dtype=np.float64)
+        zeros = np.zeros(3, dtype=np.float64)
+        integrate_state(scratch, 0.0, zeros, zeros)
+        closest_waypoint(zeros, scratch)
         
     async def _update_navigation_data(self) -> None:
         """Update navigation data from hardware"""
@@ -120,6 +181,18 @@ class NavigationSystem(HardwareComponent):
         
         # Simulate data update
         await asyncio.sleep(0.02)
+        imu = self._read_imu()
+        if imu is None:
+            return
+        accel, gyro = imu
+        
+        # Integrate IMU readings over the time since the last update
+        now = self._loop.time()
+        dt = now - self._last_update if self._last_update else 0.0
+        integrate_state(self._state, dt, accel, gyro)
         
-        # In a real implementation, this would update position, velocity, and orientation
-        # based on sensor readings
\ No newline at end of file
+    def _read_imu(self) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """Read acceleration (m/s^2) and angular rate (rad/s) from the IMU, or None without a sample"""
+        # Placeholder: this would read from actual hardware in a real implementation,
+        # until then no sample is available and the state is left untouched
+        return None
\ No newline at end of file
@@ -3,11 +3,12 @@ Sensor Component Module
 
 This module implements the sensor hardware component for the XY-28C-Sentinel system.
 """
-from typing import Dict, Any, List, Optional
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional
 import asyncio
 import logging
 from enum import Enum
-from .component import HardwareComponent, ComponentStatus
+from .component import HardwareComponent, ComponentStatus, ACTIVE_STATUSES
 
 class SensorType(Enum):
     """Types of sensors"""
@@ -34,6 +35,9 @@ class SensorMode(Enum):
 class Sensor(HardwareComponent):
     """Sensor hardware component implementation"""
     
+    __slots__ = ('logger', 'sensor_type', '_sensor_mode', '_reading_frequency', 'last_reading',
+                 'calibration_data', '_diag_cache')
+    
     def __init__(self, component_id: str, sensor_type: SensorType, config: Dict[str, Any] = None):
         super().__init__(component_id, config)
         self.logger = logging.getLogger(f"sentinel.hardware.{component_id}")
@@ -42,11 +46,31 @@ class Sensor(HardwareComponent):
         self.reading_frequency = config.get("reading_frequency", 10)  # Hz
         self.last_reading = {}
         self.calibration_data = {}
+        self._diag_cache = None
+        
+    @property
+    def sensor_mode(self) -> SensorMode:
+        return self._sensor_mode
+        
+    @sensor_mode.setter
+    def sensor_mode(self, mode: SensorMode) -> None:
+        self._sensor_mode = mode
+        self._diag_version += 1
+        
+    @property
+    def reading_frequency(self) -> float:
+        return self._reading_frequency
+        
+    @reading_frequency.setter
+    def reading_frequency(self, frequency: float) -> None:
+        self._reading_frequency = frequency
+        self._diag_version += 1
         
     async def initialize(self) -> bool:
         """Initialize the sensor hardware"""
         self.logger.info(f"Initializing {self.sensor_type.name} sensor: {self.component_id}")
         self.status = ComponentStatus.INITIALIZING
+        self._loop = asyncio.get_running_loop()
         
         try:
             # Perform hardware initialization
@@ -82,7 +106,7 @@ class Sensor(HardwareComponent):
             
     async def update(self) -> None:
         """Update sensor state and readings"""
-        if self.status not in [ComponentStatus.ONLINE, ComponentStatus.DEGRADED]:
+        if self.status not in ACTIVE_STATUSES:
             return
             
         try:
@@ -90,15 +114,19 @@ class Sensor(HardwareComponent):
             if self.sensor_mode != SensorMode.OFF:
                 self.last_reading = await self._read_sensor_data()
                 
-            self._last_update = asyncio.get_event_loop().time()
+            self._last_update = self._loop.time()
             
         except Exception as e:
             self.logger.error(f"Error updating sensor: {e}")
             if self.status == ComponentStatus.ONLINE:
                 self.status = ComponentStatus.DEGRADED
                 
-    async def get_diagnostics(self) -> Dict[str, Any]:
-        """Get diagnostic information from the sensor"""
+    async def get_diagnostics(self) -> Mapping[str, Any]:
+        """Get diagnostic information from the sensor (read-only, cached until it changes)"""
+        key = (self._diag_version, self._last_update)
+        if self._diag_cache is not None and self._diag_cache[0] == key:
+            return self._diag_cache[1]
+            
         diagnostics = {
             "status": self.status.name,
             "sensor_type": self.sensor_type.name,
@@ -110,7 +138,8 @@ class Sensor(HardwareComponent):
         # Add hardware-specific diagnostics
         # This would read from actual hardware in a real implementation
         
-        return diagnostics
+        self._diag_cache = (key, MappingProxyType(diagnostics))
+        return self._diag_cache[1]
         
     async def set_sensor_mode(self, mode: SensorMode) -> bool:
         """Set the sensor operation mode"""
@@ -138,7 +167,7 @@ class Sensor(HardwareComponent):
             self.calibration_data = {
                 "offset": 0.0,
                 "scale": 1.0,
-                "timestamp": asyncio.get_event_loop().time()
+                "timestamp": asyncio.get_running_loop().time()
             }
             
             return True
@@ -169,5 +198,5 @@ class Sensor(HardwareComponent):
         self.calibration_data = {
             "offset": 0.0,
             "scale": 1.0,
-            "timestamp": asyncio.get_event_loop().time()
+            "timestamp": self._loop.time()
         }
\ No newline at end of file
@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any, AsyncIterator
+from typing import Dict, Any, AsyncIterator, Optional
 import asyncio
 from ..events.event_manager import EventManager
+from .shared_sensor_region import SharedSensorRegion
 
 class HILInterface(ABC):
     def __init__(self, event_manager: EventManager):
@@ -10,6 +11,17 @@ class HILInterface(ABC):
         self.sampling_rate = 1000  # Hz
         self.calibration_data = {}
         self._processing_pipeline = None
+        
+        # Set True by interfaces whose device reader calls notify_data_ready();
+        # otherwise a single ticker task signals at sampling_rate
+        self.hardware_signalled = False
+        # Created lazily inside the running loop; replaced on every signal so
+        # all waiting streams wake together
+        self._data_ready: Optional[asyncio.Event] = None
+        self._ticker: Optional[asyncio.Task] = None
+        
+        # Optional shared-memory region the interface publishes its frames to
+        self.shared_region: Optional[SharedSensorRegion] = None
 
     @abstractmethod
     async def connect(self) -> bool:
@@ -46,25 +58,61 @@ class HILInterface(ABC):
         """Perform comprehensive self-test"""
         pass
 
+    def notify_data_ready(self) -> None:
+        """Wake every stream waiting for a sample; call from the device reader"""
+        ready, self._data_ready = self._data_ready, asyncio.Event()
+        if ready is not None:
+            ready.set()
+
+    def _data_available(self) -> bool:
+        """Whether a sample is already buffered; interfaces that queue samples override this"""
+        return False
+
+    async def _wait_data_ready(self) -> None:
+        """Wait until the next sample is available"""
+        if self._data_available():
+            return
+        if self._data_ready is None:
+            self._data_ready = asyncio.Event()
+        if not self.hardware_signalled and (self._ticker is None or self._ticker.done()):
+            self._ticker = asyncio.create_task(self._run_ticker())
+        await self._data_ready.wait()
+
+    async def _run_ticker(self) -> None:
+        """Signal data ready at sampling_rate on a drift-free deadline schedule"""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time()
+        while self.connected:
+            deadline += 1 / self.sampling_rate
+            await asyncio.sleep(max(0.0, deadline - loop.time()))
+            self.notify_data_ready()
+        # Release streams still waiting so they observe the disconnect
+        self.notify_data_ready()
+
     async def stream_data(self, callback) -> None:
         """Continuously stream sensor data"""
         while self.connected:
-            data = await self.read_sensor_data()
-            await callback(data)
-            await asyncio.sleep(1/self.sampling_rate)
+            await self._wait_data_ready()
+            if not self.connected:
+                break
+            await callback(await self.read_sensor_data())
 
     async def stream_processed_data(self, processor) -> AsyncIterator[Dict[str, Any]]:
         """Stream processed sensor data in real-time"""
         async for raw_data in self._stream_raw_data():
-            processed = await processor.process(raw_data)
-            yield processed
-            await asyncio.sleep(1/self.sampling_rate)
+            yield await processor.process(raw_data)
 
     async def _stream_raw_data(self) -> AsyncIterator[Dict[str, Any]]:
         """Internal raw data streaming"""
         while self.connected:
+            await self._wait_data_ready()
+            if not self.connected:
+                break
             yield await self.read_sensor_data()
-            await asyncio.sleep(1/self.sampling_rate)
+
+    def set_shared_region(self, region: Optional[SharedSensorRegion]) -> None:
+        """Publish frames to a shared-memory region readable from other processes"""
+        self.shared_region = region
 
     def set_processing_pipeline(self, pipeline):
         """Set custom processing pipeline"""
@@ -1,12 +1,43 @@
+import asyncio
+import os
+import tty
+from collections import deque
+from typing import Any, AsyncIterator, Dict, List
 import numpy as np
 from ..hil.hil_interface import HILInterface
+from ..utils.buffer_pool import NdArrayPool
 from ..events.system_events import SystemEvent, SystemEventType
 
+# Wire format of one IMU frame
+_IMU_DTYPE = np.dtype([('acc', '<f4', 3), ('gyro', '<f4', 3), ('mag', '<f4', 3), ('ts', '<f8')])
+# Frames read per readv() call at most
+_FRAME_BATCH = 64
+# Frames kept for consumers; the oldest are dropped when nothing is reading
+_FRAME_BACKLOG = 4 * _FRAME_BATCH
+
+# Expected gravity directions for the 6-point calibration, read-only
+_CAL_ORIENTATIONS = np.array([
+    [1, 0, 0, 0],   # Front
+    [-1, 0, 0, 0],  # Back
+    [0, 1, 0, 0],   # Left
+    [0, -1, 0, 0],  # Right
+    [0, 0, 1, 0],   # Up
+    [0, 0, -1, 0]   # Down
+], dtype=np.float32)
+_CAL_ORIENTATIONS.flags.writeable = False
+
 class IMUHILInterface(HILInterface):
     def __init__(self, event_manager, port='/dev/tty.usbmodem12345'):
         super().__init__(event_manager)
         self.port = port
         self.serial_interface = None
+        
+        # The serial reader signals stream consumers as frames arrive
+        self.hardware_signalled = True
+        self._rx_buf = bytearray(_FRAME_BATCH * _IMU_DTYPE.itemsize)
+        self._rx_len = 0
+        self._frames = deque(maxlen=_FRAME_BACKLOG)
+        self._buffers = NdArrayPool()
 
     async def connect(self) -> bool:
         try:
@@ -22,19 +53,82 @@ class IMUHILInterface(HILInterface):
         except Exception as e:
             self.connected = False
             return False
+            
+    async def disconnect(self) -> None:
+        self._close_serial()
+        
+    def _close_serial(self) -> None:
+        """Stop watching and close the serial port, then wake streams so they see the disconnect"""
+        self.connected = False
+        if self.serial_interface is not None:
+            asyncio.get_running_loop().remove_reader(self.serial_interface)
+            os.close(self.serial_interface)
+            self.serial_interface = None
+        # Release streams waiting for the next frame
+        self.notify_data_ready()
+        
+    async def _init_serial(self) -> int:
+        """Open the serial port in raw non-blocking mode and watch it for frames"""
+        fd = os.open(self.port, os.O_RDWR | os.O_NOCTTY | os.O_NONBLOCK)
+        tty.setraw(fd)
+        asyncio.get_running_loop().add_reader(fd, self._on_serial_readable)
+        return fd
+        
+    def _on_serial_readable(self) -> None:
+        """Drain all available bytes with one readv() and queue the complete frames as records"""
+        try:
+            n = os.readv(self.serial_interface, [memoryview(self._rx_buf)[self._rx_len:]])
+        except BlockingIOError:
+            return
+        except OSError:
+            # Device unplugged (EIO)
+            self._close_serial()
+            return
+        if n == 0:
+            # Hang-up: the fd would stay readable and spin the loop
+            self._close_serial()
+            return
+        self._rx_len += n
+        
+        size = _IMU_DTYPE.itemsize
+        count = self._rx_len // size
+        whole = count * size
+        if count:
+            # One copy per batch; each queued record is a view into it
+            batch = np.frombuffer(self._rx_buf, dtype=_IMU_DTYPE, count=count).copy()
+            self._frames.extend(batch)
+            if self.shared_region is not None:
+                self.shared_region.write(batch, float(batch['ts'][-1]))
+            
+        # Keep any partial frame at the start of the buffer
+        self._rx_buf[:self._rx_len - whole] = self._rx_buf[whole:self._rx_len]
+        self._rx_len -= whole
+        if whole:
+            self.notify_data_ready()
+            
+    def _data_available(self) -> bool:
+        return bool(self._frames)
+        
+    async def _read_serial_data(self) -> np.void:
+        """Next IMU frame record, waiting for the serial reader if none is queued"""
+        while not self._frames:
+            if not self.connected:
+                raise ConnectionError("IMU disconnected")
+            await self._wait_data_ready()
+        return self._frames.popleft()
 
     async def read_sensor_data(self) -> Dict[str, Any]:
         if not self.connected:
             raise ConnectionError("IMU not connected")
             
-        # Read raw data from serial interface
-        raw_data = await self._read_serial_data()
+        # Read the next frame from the serial interface
+        rec = await self._read_serial_data()
         
         return {
-            'acceleration': np.array(raw_data[:3]),
-            'angular_velocity': np.array(raw_data[3:6]),
-            'magnetic_field': np.array(raw_data[6:9]),
-            'timestamp': raw_data[9]
+            'acceleration': rec['acc'],
+            'angular_velocity': rec['gyro'],
+            'magnetic_field': rec['mag'],
+            'timestamp': float(rec['ts'])
         }
 
     async def calibrate(self) -> Dict[str, Any]:
@@ -49,12 +143,16 @@ class IMUHILInterface(HILInterface):
         processor.add_filter(self._remove_noise)
         processor.add_transform(self._calculate_orientation)
         
+        # The quaternion buffer is reused once the consumer asks for the
+        # next sample; consumers that keep it must copy it
         async for data in self.stream_processed_data(processor):
+            quaternion = data['orientation']
             yield {
-                'quaternion': data['orientation'],
+                'quaternion': quaternion,
                 'timestamp': data['timestamp'],
                 'accuracy': data.get('accuracy', 0.95)
             }
+            self._buffers.release(quaternion)
 
     def _remove_noise(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Apply noise reduction filter"""
@@ -64,23 +162,16 @@ class IMUHILInterface(HILInterface):
     def _calculate_orientation(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Calculate orientation from IMU data"""
         # Implementation would use sensor fusion algorithms
-        data['orientation'] = [1, 0, 0, 0]  # Example quaternion
+        quaternion = self._buffers.acquire((4,), np.float32)
+        quaternion[:] = (1, 0, 0, 0)  # Example quaternion
+        data['orientation'] = quaternion
         return data
 
     async def collect_calibration_data(self) -> List[Dict]:
         """Collect IMU calibration data"""
         # Perform 6-point calibration routine
-        orientations = [
-            np.array([1, 0, 0, 0]),  # Front
-            np.array([-1, 0, 0, 0]), # Back
-            np.array([0, 1, 0, 0]),  # Left
-            np.array([0, -1, 0, 0]), # Right
-            np.array([0, 0, 1, 0]),  # Up
-            np.array([0, 0, -1, 0])  # Down
-        ]
-        
         data = []
-        for orient in orientations:
+        for orient in _CAL_ORIENTATIONS:
             raw_data = await self._read_calibration_orientation(orient)
             data.append({
                 "expected": orient,
@@ -1,5 +1,7 @@
 from ..sensors.fusion.multi_sensor_fusion import MultiSensorFusion
-from typing import Dict, List
+from typing import Dict, List, Tuple
+import numpy as np
+from .shared_sensor_region import SharedSensorRegion
 
 class SensorFusionHILAdapter:
     def __init__(self, fusion_module: MultiSensorFusion):
@@ -17,6 +19,11 @@ class SensorFusionHILAdapter:
             'task': asyncio.create_task(sensor_interface.stream_data(callback))
         })
 
+    @staticmethod
+    def read_shared_frame(region: SharedSensorRegion) -> Tuple[np.ndarray, int, float]:
+        """Latest frame from a sensor's shared-memory region, read in place; confirm copies with region.validate()"""
+        return region.read()
+
     async def _process_sensor_data(self, data: Dict, sensor_type: str) -> None:
         """Process incoming sensor data for fusion"""
         if sensor_type == 'imu':
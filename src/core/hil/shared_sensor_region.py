@@ -0,0 +1,128 @@
+from multiprocessing import shared_memory
+from typing import Optional, Tuple
+import numpy as np
+
+# Region header: index of the published buffer, then per-buffer frame number,
+# timestamp and record count. Aligned so every field is naturally aligned for
+# single-store updates; frame_no 0 marks a buffer being written.
+_HEADER_DTYPE = np.dtype([
+    ('front_idx', '<u4'),
+    ('frame_no', '<u8', 2),
+    ('ts', '<f8', 2),
+    ('len', '<u4', 2)
+], align=True)
+_PAYLOAD_ALIGN = 64  # Payload buffers start on cache-line boundaries
+
+def _aligned(nbytes: int) -> int:
+    return -(-nbytes // _PAYLOAD_ALIGN) * _PAYLOAD_ALIGN
+
+class SharedSensorRegion:
+    """
+    Double-buffered sensor frames in named shared memory
+    
+    The writer fills the back buffer and then flips front_idx with a single
+    aligned 32-bit store. Readers map the region once and get zero-copy views
+    of the front buffer; a view can be overwritten if the writer publishes
+    twice while it is in use, so readers that copy confirm the copy with
+    validate() afterwards (a seqlock on the per-buffer frame number), or use
+    read_copy() which does this for them.
+    """
+    def __init__(self, name: str, dtype: np.dtype, capacity: int, create: bool = False):
+        self.dtype = np.dtype(dtype)
+        self.capacity = capacity
+        self._payload_offset = _aligned(_HEADER_DTYPE.itemsize)
+        self._payload_size = _aligned(self.dtype.itemsize * capacity)
+        self._shm = shared_memory.SharedMemory(
+            name=name,
+            create=create,
+            size=self._payload_offset + 2 * self._payload_size
+        )
+        self._header = np.ndarray((), dtype=_HEADER_DTYPE, buffer=self._shm.buf)
+        self._payloads = tuple(
+            np.ndarray(
+                (capacity,),
+                dtype=self.dtype,
+                buffer=self._shm.buf,
+                offset=self._payload_offset + i * self._payload_size
+            )
+            for i in range(2)
+        )
+        if create:
+            self._shm.buf[:self._payload_offset] = bytes(self._payload_offset)
+            
+    @property
+    def name(self) -> str:
+        return self._shm.name
+        
+    def write(self, frames: np.ndarray, timestamp: float) -> int:
+        """
+        Publish up to `capacity` records as the next frame
+        
+        Returns:
+            Frame number of the published frame
+        """
+        header = self._header
+        back = 1 - int(header['front_idx'])
+        count = min(len(frames), self.capacity)
+        
+        # Invalidate the back buffer before overwriting it, so readers still
+        # holding a view of it fail validate()
+        frame_no = int(header['frame_no'].max()) + 1
+        header['frame_no'][back] = 0
+        self._payloads[back][:count] = frames[:count]
+        header['ts'][back] = timestamp
+        header['len'][back] = count
+        header['frame_no'][back] = frame_no
+        
+        # Publish: a single aligned u32 store
+        header['front_idx'] = back
+        return frame_no
+        
+    def read(self) -> Tuple[np.ndarray, int, float]:
+        """
+        Zero-copy view of the latest published frame
+        
+        Returns:
+            (records, frame number, timestamp). The view is only guaranteed
+            intact while validate(frame number) holds.
+        """
+        header = self._header
+        front = int(header['front_idx'])
+        frame_no = int(header['frame_no'][front])
+        count = int(header['len'][front])
+        return self._payloads[front][:count], frame_no, float(header['ts'][front])
+        
+    def validate(self, frame_no: int) -> bool:
+        """Whether a frame read earlier is still intact, i.e. the read was not torn"""
+        return frame_no != 0 and frame_no in self._header['frame_no']
+        
+    def read_copy(self, retries: int = 3) -> Optional[Tuple[np.ndarray, int, float]]:
+        """
+        Copy of the latest published frame, retried if the writer overwrote it mid-copy
+        
+        Returns:
+            (records, frame number, timestamp), or None if nothing has been
+            published yet or every attempt was torn
+        """
+        for _ in range(retries):
+            view, frame_no, timestamp = self.read()
+            records = view.copy()
+            del view
+            if self.validate(frame_no):
+                return records, frame_no, timestamp
+        return None
+        
+    def close(self) -> None:
+        """
+        Unmap the region from this process
+        
+        Every view returned by read() must have been released first; while
+        one is alive the underlying SharedMemory.close() raises BufferError.
+        """
+        self._header = None
+        self._payloads = ()
+        self._shm.close()
+        
+    def unlink(self) -> None:
+        """Destroy the region; call once from the creating process"""
+        self._shm.unlink()
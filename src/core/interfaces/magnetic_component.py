@@ -50,7 +50,7 @@ class MagneticComponent(SystemComponent, Plugin):
         return "magnetic"
     
     def get_plugin_info(self) -> Dict[str, Any]:
-        return {
+        return self._memoized_plugin_info(lambda: {
             "type": "magnetic",
             "capabilities": self.get_capabilities()
-        }
\ No newline at end of file
+        })
\ No newline at end of file
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List
+from types import MappingProxyType
+from typing import Callable, Dict, Any, List, Mapping
 
 class Plugin(ABC):
     """
@@ -28,4 +29,22 @@ class Plugin(ABC):
     @abstractmethod
     def get_capabilities(self) -> List[str]:
         """Get the capabilities provided by this plugin"""
-        pass
\ No newline at end of file
+        pass
+    
+    def _memoized_plugin_info(self, build: Callable[[], Dict[str, Any]]) -> Mapping[str, Any]:
+        """
+        Plugin info rebuilt only when the component state changes
+        
+        Args:
+            build: Builds the info dictionary from current state
+            
+        Returns:
+            Read-only view of the cached info
+        """
+        state = getattr(self, '_state', None)
+        version = getattr(state, 'version', None)
+        cached = getattr(self, '_plugin_info_cache', None)
+        if cached is None or version is None or cached[0] is not state or cached[1] != version:
+            cached = (state, version, MappingProxyType(build()))
+            self._plugin_info_cache = cached
+        return cached[2]
\ No newline at end of file
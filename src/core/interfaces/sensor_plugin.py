@@ -47,7 +47,7 @@ class SensorPlugin(SystemComponent, Plugin):
         return "sensor"
     
     def get_plugin_info(self) -> Dict[str, Any]:
-        return {
+        return self._memoized_plugin_info(lambda: {
             "type": "sensor",
             "capabilities": self.get_capabilities()
-        }
\ No newline at end of file
+        })
\ No newline at end of file
@@ -22,8 +22,8 @@ class SimulationPlugin(SystemComponent, Plugin):
         return self._state.get("capabilities", [])
     
     def get_plugin_info(self) -> Dict[str, Any]:
-        return {
+        return self._memoized_plugin_info(lambda: {
             "type": "simulation",
             "simulation_type": self._state.get("simulation_type", "unknown"),
             "capabilities": self.get_capabilities()
-        }
\ No newline at end of file
+        })
\ No newline at end of file
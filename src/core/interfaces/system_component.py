@@ -1,12 +1,13 @@
 from abc import ABC, abstractmethod
 from typing import Any, Dict
 from ..events.event_manager import EventManager
+from ..utils.versioned_dict import VersionedDict
 
 class SystemComponent(ABC):
     def __init__(self, component_id: str, event_manager: EventManager):
         self.component_id = component_id
         self.event_manager = event_manager
-        self._state: Dict[str, Any] = {}
+        self._state: VersionedDict = VersionedDict()
         
     @abstractmethod
     async def initialize(self) -> None:
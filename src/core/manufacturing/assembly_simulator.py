@@ -1,22 +1,89 @@
-from typing import Dict, List
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple, Union
 import numpy as np
 from ..events.event_manager import EventManager
 
+# Rows of the pairwise clearance matrix computed per pass
+_INTERFERENCE_TILE = 256
+
+@dataclass
+class GeomBatch:
+    """Component geometries held as parallel arrays, one row per component"""
+    nominal: np.ndarray  # (N, V, 3) nominal vertices
+    tol: np.ndarray      # (N, V, 3) symmetric tolerance per vertex coordinate
+    names: List[str]
+    actual: np.ndarray = field(init=False, repr=False)  # Reused perturbation output
+    
+    def __post_init__(self):
+        self.actual = np.empty_like(self.nominal)
+        
+    @classmethod
+    def from_components(cls, components: List[Dict]) -> 'GeomBatch':
+        """Pack component dicts with equal vertex counts into a batch"""
+        if not components:
+            empty = np.empty((0, 0, 3))
+            return cls(empty, empty.copy(), [])
+            
+        nominal = np.stack([
+            np.asarray(c['geometry'], dtype=float).reshape(-1, 3) for c in components
+        ])
+        tol = np.empty_like(nominal)
+        for k, c in enumerate(components):
+            tol[k] = np.abs(np.asarray(c['tolerances'], dtype=float))
+        return cls(nominal, tol, [c['name'] for c in components])
+        
+    @classmethod
+    def group_components(cls, components: List[Dict]) -> Tuple[List['GeomBatch'], List[int]]:
+        """
+        Pack component dicts into one batch per vertex count
+        
+        Returns:
+            The batches, and for their rows taken in order, each row's index in components
+        """
+        groups: Dict[int, List[int]] = {}
+        for k, c in enumerate(components):
+            groups.setdefault(np.size(c['geometry']) // 3, []).append(k)
+            
+        batches = [cls.from_components([components[k] for k in rows]) for rows in groups.values()]
+        order = [k for rows in groups.values() for k in rows]
+        return batches, order
+
 class AssemblySimulator:
-    def __init__(self, event_manager: EventManager):
+    def __init__(self, event_manager: EventManager, seed: Optional[int] = None):
         self.event_manager = event_manager
         self.interference_threshold = 0.01  # mm
+        self._rng = np.random.default_rng(seed)
         
-    async def simulate_assembly(self, components: List[Dict[str, Any]]) -> Dict[str, Any]:
+    async def simulate_assembly(self, components: Union[List[Dict[str, Any]], GeomBatch]) -> Dict[str, Any]:
         """Simulate assembly process with tolerance effects"""
+        if isinstance(components, GeomBatch):
+            batches, order = [components], list(range(len(components.names)))
+        else:
+            batches, order = GeomBatch.group_components(components)
+            
         # Generate tolerance-affected geometries
-        actual_geoms = self._apply_tolerances(components)
-        
+        for batch in batches:
+            self._apply_tolerances(batch)
+            
+        # Back in the caller's component order
+        names: List[str] = [None] * len(order)
+        boxes = np.empty((len(order), 6))
+        actual_geoms: List[Dict] = [None] * len(order)
+        start = 0
+        for batch in batches:
+            rows = order[start:start + len(batch.names)]
+            boxes[rows] = self._bounding_boxes(batch.actual)
+            # Copy out of the reused buffer before handing geometries to callers
+            for k, name, geometry in zip(rows, batch.names, batch.actual.copy()):
+                names[k] = name
+                actual_geoms[k] = {'name': name, 'geometry': geometry}
+            start += len(rows)
+            
         # Check for interferences
-        interferences = self._detect_interferences(actual_geoms)
+        interferences = self._detect_interferences(names, boxes)
         
         # Validate assembly
-        validation = self._validate_assembly(actual_geoms)
+        validation = self._validate_assembly(batches)
         
         await self.event_manager.publish(SystemEvent(
             event_type=SystemEventType.ASSEMBLY_SIMULATION_COMPLETE,
@@ -33,40 +100,59 @@ class AssemblySimulator:
             'validation': validation
         }
         
-    def _apply_tolerances(self, components: List[Dict]) -> List[Dict]:
-        """Apply tolerance effects to nominal geometries"""
-        return [
-            {
-                'name': c['name'],
-                'geometry': self._perturb_geometry(c['geometry'], c['tolerances'])
-            }
-            for c in components
-        ]
+    def _apply_tolerances(self, batch: GeomBatch) -> np.ndarray:
+        """Apply tolerance effects to nominal geometries, in place in batch.actual"""
+        # actual = nominal + U(-tol, tol), without temporaries
+        actual = batch.actual
+        self._rng.random(out=actual)
+        actual *= 2.0
+        actual -= 1.0
+        actual *= batch.tol
+        actual += batch.nominal
+        return actual
         
-    def _detect_interferences(self, geometries: List[Dict]) -> List[Dict]:
-        """Detect part interferences due to tolerance stacking"""
+    def _detect_interferences(self, names: List[str], boxes: np.ndarray) -> List[Dict]:
+        """Detect part interferences due to tolerance stacking, given each part's (N, 6) AABB"""
         interferences = []
         
-        # Simple pairwise interference check
-        for i, geom1 in enumerate(geometries):
-            for j, geom2 in enumerate(geometries[i+1:], i+1):
-                clearance = self._calculate_clearance(geom1, geom2)
-                if clearance < -self.interference_threshold:
-                    interferences.append({
-                        'component_a': geom1['name'],
-                        'component_b': geom2['name'],
-                        'clearance': clearance
-                    })
+        # Pairwise AABB clearance, one tile of rows at a time so the (tile, N, 3)
+        # temporary stays cache-sized for large assemblies
+        n = len(boxes)
+        for start in range(0, n, _INTERFERENCE_TILE):
+            stop = min(start + _INTERFERENCE_TILE, n)
+            rows = boxes[start:stop, None, :]
+            sep = np.abs(rows[..., :3] - boxes[None, :, :3]) - (rows[..., 3:] + boxes[None, :, 3:])
+            clearance = sep.max(axis=-1)
+            
+            # Upper triangle only: each pair once, never a part against itself
+            i, j = np.nonzero(clearance < -self.interference_threshold)
+            upper = j > i + start
+            i, j = i[upper], j[upper]
+            for a, b, value in zip((i + start).tolist(), j.tolist(), clearance[i, j].tolist()):
+                interferences.append({
+                    'component_a': names[a],
+                    'component_b': names[b],
+                    'clearance': value
+                })
                     
         return interferences
         
-    def _validate_assembly(self, geometries: List[Dict]) -> Dict[str, Any]:
+    @staticmethod
+    def _bounding_boxes(vertices: np.ndarray) -> np.ndarray:
+        """Reduce (N, V, 3) vertices to an (N, 6) array of (cx, cy, cz, rx, ry, rz) AABBs"""
+        if vertices.shape[1] == 0:
+            # Vertex-less parts collapse to a point at the origin
+            return np.zeros((len(vertices), 6))
+        lo, hi = vertices.min(axis=1), vertices.max(axis=1)
+        return np.concatenate(((lo + hi) * 0.5, (hi - lo) * 0.5), axis=1)
+        
+    def _validate_assembly(self, batches: List[GeomBatch]) -> Dict[str, Any]:
         """Validate assembly meets functional requirements"""
         # Check critical dimensions
-        critical_dims = self._check_critical_dimensions(geometries)
+        critical_dims = self._check_critical_dimensions(batches)
         
         # Check kinematic constraints
-        kinematics = self._check_kinematic_constraints(geometries)
+        kinematics = self._check_kinematic_constraints(batches)
         
         return {
             'critical_dimensions': critical_dims,
@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import Any, Dict, Optional, Tuple
 import asyncio
 from ..events.event_manager import EventManager
 
@@ -6,34 +6,83 @@ class ManufacturingExecutionSystem:
     def __init__(self, event_manager: EventManager):
         self.event_manager = event_manager
         self.active_processes = {}
+        self.min_progress_interval = 60.0  # Shortest time between in-step progress updates (s)
+        
+        # Per-component step completion signals and (start, duration, step_num, step)
+        self._step_done: Dict[str, asyncio.Event] = {}
+        self._step_progress: Dict[str, Tuple[float, float, int, Dict]] = {}
+        self._heartbeat_task: Optional[asyncio.Task] = None
         
     async def execute_manufacturing_plan(self, plan: Dict[str, Any]) -> None:
         """Execute manufacturing plan"""
         component = plan['component']
-        self.active_processes[component] = {
+        # Step state is kept per component, so only one plan may run for it at a time
+        process = self.active_processes.get(component)
+        if process is not None and process['status'] == 'running':
+            raise RuntimeError(f"A manufacturing plan is already running for {component}")
+            
+        process = self.active_processes[component] = {
             'status': 'running',
             'current_step': 0,
             'steps': plan['steps']
         }
         
         # Execute each step
-        for i, step in enumerate(plan['steps']):
-            await self._execute_manufacturing_step(component, i, step)
+        try:
+            for i, step in enumerate(plan['steps']):
+                if not await self._execute_manufacturing_step(component, i, step):
+                    await self.event_manager.publish(SystemEvent(
+                        event_type=SystemEventType.MANUFACTURING_ERROR,
+                        component_id=f"manufacturing_{component}",
+                        data={'status': 'cancelled', 'step': i + 1}
+                    ))
+                    return
+        except BaseException:
+            process['status'] = 'error'
+            raise
             
+        process['status'] = 'complete'
         await self.event_manager.publish(SystemEvent(
             event_type=SystemEventType.MANUFACTURING_COMPLETE,
             component_id=f"manufacturing_{component}",
             data={'status': 'complete'}
         ))
         
-    async def _execute_manufacturing_step(self, component: str, step_num: int, step: Dict) -> None:
-        """Execute individual manufacturing step"""
+    def cancel_step(self, component: str) -> bool:
+        """Cancel the running step, and with it the rest of the component's plan"""
+        done = self._step_done.get(component)
+        if done is None:
+            return False
+        self.active_processes[component]['status'] = 'cancelled'
+        done.set()
+        return True
+        
+    async def _execute_manufacturing_step(self, component: str, step_num: int, step: Dict) -> bool:
+        """
+        Execute individual manufacturing step
+        
+        Returns:
+            True if the step ran to completion, False if it was cancelled
+        """
         # Update status
         self.active_processes[component]['current_step'] = step_num
         
-        # Simulate step execution
-        await asyncio.sleep(step['estimated_time'] * 3600)  # Convert hours to seconds
-        
+        # Simulate step execution, waking early only if cancelled
+        duration = step['estimated_time'] * 3600  # Convert hours to seconds
+        done = self._step_done[component] = asyncio.Event()
+        self._step_progress[component] = (asyncio.get_running_loop().time(), duration, step_num, step)
+        if self._heartbeat_task is None or self._heartbeat_task.done():
+            self._heartbeat_task = asyncio.create_task(self._publish_progress())
+            
+        try:
+            await asyncio.wait_for(done.wait(), timeout=duration)
+            return False
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            del self._step_done[component]
+            del self._step_progress[component]
+            
         # Publish progress update
         await self.event_manager.publish(SystemEvent(
             event_type=SystemEventType.MANUFACTURING_UPDATE,
@@ -43,4 +92,32 @@ class ManufacturingExecutionSystem:
                 'total_steps': len(self.active_processes[component]['steps']),
                 'process': step['process']
             }
-        ))
\ No newline at end of file
+        ))
+        return True
+        
+    async def _publish_progress(self) -> None:
+        """Single heartbeat publishing in-step progress for every running component"""
+        loop = asyncio.get_running_loop()
+        while self._step_progress:
+            interval = max(
+                self.min_progress_interval,
+                min(duration for _, duration, _, _ in self._step_progress.values()) / 100
+            )
+            await asyncio.sleep(interval)
+            
+            now = loop.time()
+            events = [
+                SystemEvent(
+                    event_type=SystemEventType.MANUFACTURING_UPDATE,
+                    component_id=f"manufacturing_{component}",
+                    data={
+                        'step': step_num + 1,
+                        'total_steps': len(self.active_processes[component]['steps']),
+                        'process': step['process'],
+                        'progress': min(1.0, (now - start) / duration) if duration > 0 else 1.0
+                    }
+                )
+                for component, (start, duration, step_num, step) in self._step_progress.items()
+            ]
+            if events:
+                await self.event_manager.publish_many(events)
@@ -43,7 +43,7 @@ class UAVSystem:
             spectrum = await self.em_sensor.get_em_spectrum()
             analysis = await self.counter_jamming.analyze_jamming(spectrum)
             
-            if analysis['jamming_detected']:
+            if analysis is not None:
                 await self.counter_jamming.activate_countermeasures(analysis)
                 
             await asyncio.sleep(0.1)
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
 import numpy as np
 
 @dataclass
@@ -10,22 +10,55 @@ class ThermalProperties:
     emissivity: float  # 0-1
     absorption_coefficient: float  # m⁻¹
 
+@dataclass
+class ThermalSimContext:
+    """Material and geometry setup reused across thermal simulation runs"""
+    material: ThermalProperties
+    geometry: Dict[str, Any]
+    grid_shape: Tuple[int, ...]
+
 class ThermalSimulation:
     def __init__(self, environment: UnifiedEnvironment):
         self.environment = environment
         self.boltzmann = 5.670374419e-8  # W/m²K⁴
         
-    async def simulate_thermal_behavior(
+    def prepare_context(
         self,
         material: ThermalProperties,
-        geometry: Dict[str, Any],
+        geometry: Dict[str, Any]
+    ) -> ThermalSimContext:
+        """Build a reusable simulation context for a material/geometry pair"""
+        return ThermalSimContext(
+            material=material,
+            geometry=geometry,
+            grid_shape=tuple(geometry['grid_shape'])
+        )
+        
+    async def simulate_thermal_behavior(
+        self,
+        material: Optional[ThermalProperties],
+        geometry: Optional[Dict[str, Any]],
         heat_sources: Dict[str, float],
         duration: float,
-        time_step: float
+        time_step: float,
+        ctx: Optional[ThermalSimContext] = None,
+        out: Optional[np.ndarray] = None
     ) -> Dict[str, np.ndarray]:
-        """Simulate thermal response under environmental conditions"""
+        """Simulate thermal response under environmental conditions
+        
+        When ``out`` is given, only the final temperature field is kept and
+        written into it instead of accumulating the full history. The result
+        then covers the last time step alone: ``temperature_history`` has
+        length 1, ``time_points`` holds only the final time and ``max_temps``
+        describes the final field.
+        """
+        if ctx is None:
+            ctx = self.prepare_context(material, geometry)
+        self.material = ctx.material
+        material = ctx.material
+        
         # Initialize temperature field
-        temp_field = np.full(geometry['grid_shape'], self.environment.atmosphere.temperature)
+        temp_field = np.full(ctx.grid_shape, self.environment.atmosphere.temperature)
         
         # Time stepping
         time_points = np.arange(0, duration, time_step)
@@ -41,10 +74,19 @@ class ThermalSimulation:
             # Calculate thermal diffusion
             temp_field = self._calculate_diffusion(temp_field, material, time_step)
             
-            results.append(temp_field.copy())
+            if out is None:
+                results.append(temp_field.copy())
+                
+        if out is not None:
+            np.copyto(out, temp_field)
+            results = [out]
+            temperature_history = out[np.newaxis]
+            time_points = time_points[-1:]
+        else:
+            temperature_history = np.array(results)
             
         return {
-            'temperature_history': np.array(results),
+            'temperature_history': temperature_history,
             'time_points': time_points,
             'max_temps': self._analyze_max_temps(results)
         }
@@ -7,6 +7,7 @@ class EMSensor:
             'noise_floor': -100,
             'active_jammers': []
         }
+        self._noise_floor_listeners = []
         
     async def get_em_spectrum(self) -> np.ndarray:
         """Get current EM spectrum with jamming effects"""
@@ -29,6 +30,16 @@ class EMSensor:
             
         return spectrum
         
+    def set_noise_floor(self, noise_floor: float) -> None:
+        """Set the jamming noise floor and notify listeners"""
+        self.jamming_effects['noise_floor'] = noise_floor
+        for listener in self._noise_floor_listeners:
+            listener(noise_floor)
+            
+    def add_noise_floor_listener(self, listener) -> None:
+        """Register a callback invoked with the new noise floor when it changes"""
+        self._noise_floor_listeners.append(listener)
+        
     def add_jammer(self, frequency: float, bandwidth: float, power: float) -> None:
         """Add a jamming signal to the simulation"""
         self.jamming_effects['active_jammers'].append({
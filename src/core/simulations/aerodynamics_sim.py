@@ -1,12 +1,13 @@
 from typing import Dict, Any
 from ..interfaces.simulation_plugin import SimulationPlugin
+from ..utils.versioned_dict import VersionedDict
 from ..models.morphing_aerodynamics import MorphingSurface
 from ..models.biomimetic_structure import BiomimeticExoskeletonAnalysis
 from ..sensors.camouflage_control import AdaptiveCamouflageController
 
 class AerodynamicsSimulation(SimulationPlugin):
     async def initialize(self) -> None:
-        self._state = {
+        self._state = VersionedDict({
             "simulation_type": "aerodynamics",
             "capabilities": [
                 "hypersonic_flow",
@@ -16,7 +17,7 @@ class AerodynamicsSimulation(SimulationPlugin):
                 "aeroelastic_coupling",
                 "adaptive_camouflage"  # New capability
             ]
-        }
+        })
         self.camouflage_controller = AdaptiveCamouflageController()
         
     async def update_camouflage(
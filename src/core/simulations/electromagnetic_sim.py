@@ -1,5 +1,6 @@
 from typing import Dict, Any
 from ..interfaces.simulation_plugin import SimulationPlugin
+from ..utils.versioned_dict import VersionedDict
 from ..physics.models.electromagnetics import EMPropagationModel
 from ..physics.models.metamaterial_em import MetamaterialEMPSimulation
 from ..physics.models.quantum_field import QuantumFieldCalculator
@@ -7,7 +8,7 @@ import numpy as np
 
 class ElectromagneticSimulation(SimulationPlugin):
     async def initialize(self) -> None:
-        self._state = {
+        self._state = VersionedDict({
             "simulation_type": "electromagnetic",
             "capabilities": [
                 "emp_propagation", 
@@ -16,7 +17,7 @@ class ElectromagneticSimulation(SimulationPlugin):
                 "metamaterial_emp",
                 "quantum_field_effects"  # Add new capability
             ]
-        }
+        })
         self.emp_model = EMPropagationModel()
         self.metamaterial_utils = MetamaterialEMPSimulation()
         self.quantum_field_calculator = QuantumFieldCalculator()
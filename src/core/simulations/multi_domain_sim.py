@@ -1,12 +1,13 @@
 from typing import Dict, Any, List
 from ..interfaces.simulation_plugin import SimulationPlugin
+from ..utils.versioned_dict import VersionedDict
 from ..physics.models.unified_environment import MultiDomainEnvironment, UnifiedEnvironment
 from ..physics.models.electronic_vulnerability import EMPVulnerabilityAnalyzer
 from ..physics.models.electromagnetics import EMPropagationModel
 
 class MultiDomainSimulation(SimulationPlugin):
     async def initialize(self) -> None:
-        self._state = {
+        self._state = VersionedDict({
             "simulation_type": "multi_domain",
             "capabilities": [
                 "atmospheric_propagation",
@@ -15,7 +16,7 @@ class MultiDomainSimulation(SimulationPlugin):
                 "system_vulnerability",
                 "weather_impact"
             ]
-        }
+        })
         self.environment = MultiDomainEnvironment()
         self.emp_model = EMPropagationModel()
         self.vulnerability_analyzer = EMPVulnerabilityAnalyzer()
@@ -1,12 +1,13 @@
 from typing import Dict, Any
 from ..interfaces.simulation_plugin import SimulationPlugin
+from ..utils.versioned_dict import VersionedDict
 from ..physics.models.nano_explosives import NanoExplosivesSimulation, NanoParticle
 from ..physics.utils.detonation_optimizer import DetonationOptimizer
 from ..physics.solvers.detonation_solver import DetonationSolver
 
 class NanoExplosivesSimulationPlugin(SimulationPlugin):
     async def initialize(self) -> None:
-        self._state = {
+        self._state = VersionedDict({
             "simulation_type": "nano_explosives",
             "capabilities": [
                 "molecular_dynamics",
@@ -14,7 +15,7 @@ class NanoExplosivesSimulationPlugin(SimulationPlugin):
                 "particle_interactions",
                 "detonation_optimization"
             ]
-        }
+        })
         self.detonation_optimizer = DetonationOptimizer(DetonationSolver())
         
     async def optimize_detonation(
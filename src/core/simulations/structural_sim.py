@@ -1,10 +1,11 @@
 from typing import Dict, Any
 from ..interfaces.simulation_plugin import SimulationPlugin
+from ..utils.versioned_dict import VersionedDict
 from ..models.biomimetic_structure import BiomimeticExoskeletonAnalysis
 
 class StructuralSimulation(SimulationPlugin):
     async def initialize(self) -> None:
-        self._state = {
+        self._state = VersionedDict({
             "simulation_type": "structural",
             "capabilities": [
                 "static_analysis",
@@ -12,7 +13,7 @@ class StructuralSimulation(SimulationPlugin):
                 "buckling_analysis",
                 "actuator_interaction"
             ]
-        }
+        })
         self.analysis_model = None
         
     async def configure_exoskeleton(
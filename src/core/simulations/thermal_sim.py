@@ -1,10 +1,11 @@
 from typing import Dict, Any
 from ..interfaces.simulation_plugin import SimulationPlugin
+from ..utils.versioned_dict import VersionedDict
 from ..physics.models.thermal import ThermalSimulation, ThermalProperties
 
 class ThermalSimulationPlugin(SimulationPlugin):
     async def initialize(self) -> None:
-        self._state = {
+        self._state = VersionedDict({
             "simulation_type": "thermal",
             "capabilities": [
                 "environmental_thermal",
@@ -12,7 +13,7 @@ class ThermalSimulationPlugin(SimulationPlugin):
                 "transient_analysis",
                 "hypersonic_heating"  # New capability
             ]
-        }
+        })
         
     async def run_simulation(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
         if 'mach' in parameters:  # Hypersonic mode
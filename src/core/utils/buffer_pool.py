@@ -0,0 +1,36 @@
+"""
+Reusable NumPy buffers for XY-28C-Sentinel streaming paths.
+"""
+from collections import defaultdict, deque
+from typing import Deque, Dict, Tuple
+import numpy as np
+
+class NdArrayPool:
+    """Free lists of preallocated arrays keyed by shape and dtype"""
+    
+    def __init__(self, max_per_key: int = 64):
+        self.max_per_key = max_per_key
+        self._free: Dict[Tuple[Tuple[int, ...], np.dtype], Deque[np.ndarray]] = defaultdict(deque)
+        
+    def acquire(self, shape, dtype=np.float64) -> np.ndarray:
+        """
+        Get an uninitialized array, reusing a released one when available.
+        
+        Args:
+            shape: Array shape
+            dtype: Array dtype
+            
+        Returns:
+            Array whose contents must be written before use
+        """
+        key = ((shape,) if isinstance(shape, int) else tuple(shape), np.dtype(dtype))
+        free = self._free[key]
+        if free:
+            return free.pop()
+        return np.empty(key[0], dtype=key[1])
+        
+    def release(self, arr: np.ndarray) -> None:
+        """Return an array to the pool; the caller must not use it afterwards"""
+        free = self._free[(arr.shape, arr.dtype)]
+        if len(free) < self.max_per_key:
+            free.append(arr)
@@ -0,0 +1,28 @@
+"""
+Event loop selection for XY-28C-Sentinel.
+"""
+import asyncio
+
+try:
+    import uvloop
+except ImportError:
+    # Fall back to the default asyncio loop when uvloop is unavailable
+    uvloop = None
+
+def install_uvloop() -> bool:
+    """
+    Make uvloop the event loop policy for loops created after this call.
+    
+    Call once at process start, before the event loop is created.
+    
+    Returns:
+        True if uvloop was installed, False if it is not available
+    """
+    if uvloop is None:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+def uvloop_active() -> bool:
+    """Whether the current event loop policy is uvloop's"""
+    return uvloop is not None and isinstance(asyncio.get_event_loop_policy(), uvloop.EventLoopPolicy)
@@ -0,0 +1,45 @@
+"""
+Change-tracking dictionary for XY-28C-Sentinel caches.
+"""
+from typing import Any
+
+class VersionedDict(dict):
+    """
+    Dictionary that bumps `version` on every mutation through its own methods.
+    
+    Caches derived from the contents can key on `version` instead of comparing
+    values. In-place changes to mutable values are not seen.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.version = 0
+        
+    def __setitem__(self, key, value) -> None:
+        super().__setitem__(key, value)
+        self.version += 1
+        
+    def __delitem__(self, key) -> None:
+        super().__delitem__(key)
+        self.version += 1
+        
+    def update(self, *args, **kwargs) -> None:
+        super().update(*args, **kwargs)
+        self.version += 1
+        
+    def setdefault(self, key, default=None) -> Any:
+        if key not in self:
+            self.version += 1
+        return super().setdefault(key, default)
+        
+    def pop(self, *args) -> Any:
+        self.version += 1
+        return super().pop(*args)
+        
+    def popitem(self) -> Any:
+        self.version += 1
+        return super().popitem()
+        
+    def clear(self) -> None:
+        super().clear()
+        self.version += 1